@@ -0,0 +1,80 @@
+"""
+Measures the overhead that CompositeEnvironmentDriver adds to
+the video refresh and audio batch callbacks.
+
+Each callback is timed twice:
+once with the core reusing a single buffer (as most cores do),
+and once with the core alternating between two buffers,
+which defeats view reuse and shows the cost of creating a view on every call.
+
+Run with ``python benchmarks/callbacks.py``.
+"""
+
+import timeit
+from ctypes import POINTER, addressof, c_int16, c_ubyte, cast
+
+from libretro import (
+    CompositeEnvironmentDriver,
+    GeneratorInputDriver,
+    NullVideoDriver,
+    RingBufferAudioDriver,
+)
+
+WIDTH = 320
+HEIGHT = 240
+PITCH = WIDTH * 2
+AUDIO_FRAMES = 800  # One frame's worth of audio at 48kHz and 60fps
+CALLS = 100_000
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds * 1e9 / CALLS:>8.0f} ns/call")
+
+
+def main():
+    env = CompositeEnvironmentDriver(
+        {
+            "audio": RingBufferAudioDriver(AUDIO_FRAMES),
+            "input": GeneratorInputDriver(),
+            "video": NullVideoDriver(),
+        }
+    )
+
+    frames = [(c_ubyte * (PITCH * HEIGHT))() for _ in range(2)]
+    frame_addresses = [addressof(f) for f in frames]
+    samples = [(c_int16 * (AUDIO_FRAMES * 2))() for _ in range(2)]
+    sample_pointers = [cast(s, POINTER(c_int16)) for s in samples]
+
+    same_frame = frame_addresses[0]
+    _report(
+        "video_refresh (same buffer)",
+        timeit.timeit(lambda: env.video_refresh(same_frame, WIDTH, HEIGHT, PITCH), number=CALLS),
+    )
+
+    calls = iter(range(CALLS))
+    _report(
+        "video_refresh (alternating buffers)",
+        timeit.timeit(
+            lambda: env.video_refresh(frame_addresses[next(calls) & 1], WIDTH, HEIGHT, PITCH),
+            number=CALLS,
+        ),
+    )
+
+    same_batch = sample_pointers[0]
+    _report(
+        "audio_sample_batch (same buffer)",
+        timeit.timeit(lambda: env.audio_sample_batch(same_batch, AUDIO_FRAMES), number=CALLS),
+    )
+
+    calls = iter(range(CALLS))
+    _report(
+        "audio_sample_batch (alternating buffers)",
+        timeit.timeit(
+            lambda: env.audio_sample_batch(sample_pointers[next(calls) & 1], AUDIO_FRAMES),
+            number=CALLS,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
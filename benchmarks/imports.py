@@ -0,0 +1,53 @@
+"""
+Measures how long it takes a fresh interpreter to import parts of libretro.py,
+which every short-lived script or worker process has to pay for.
+
+Each statement is run in a new subprocess several times,
+and the median time is reported after subtracting the interpreter's own startup time.
+
+Run with ``python benchmarks/imports.py``.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 15
+
+STATEMENTS = (
+    "import libretro",
+    "from libretro import Core",
+    "from libretro import SessionBuilder",
+    "from libretro import DEFAULT_DRIVER_MAP",
+    "import libretro.parallel",
+    "from libretro import *",
+    "from libretro import ModernGlVideoDriver",
+)
+
+
+def _time(statement: str) -> float | None:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", statement], capture_output=True)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            return None
+
+    return statistics.median(times)
+
+
+def main():
+    baseline = _time("pass")
+    print(f"{'interpreter startup':<45} {baseline * 1000:>8.1f} ms")
+    for statement in STATEMENTS:
+        elapsed = _time(statement)
+        if elapsed is None:
+            print(f"{statement:<45} {'failed':>8}")
+        else:
+            print(f"{statement:<45} {(elapsed - baseline) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Checks that every name libretro.py's top-level package has ever exported
+still resolves to the same object, both as an attribute and through ``from libretro import *``.
+
+The package loads its submodules lazily and works out where each name comes from at runtime,
+so a new module or name that shadows an existing one would otherwise go unnoticed.
+The expected names are recorded in ``exports.json`` next to this script,
+as the dotted path of the object that each name refers to.
+
+Needs every optional dependency installed (``just install`` does this).
+
+Run with ``python scripts/check_exports.py``, or with ``--update`` to record any new names.
+"""
+
+import json
+import sys
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+
+EXPORTS = Path(__file__).with_name("exports.json")
+
+
+def _resolve(path: str) -> object:
+    # Dotted paths can name a module, or an attribute of one
+    parts = path.split(".")
+    for i in range(len(parts), 0, -1):
+        try:
+            value = import_module(".".join(parts[:i]))
+        except ImportError:
+            continue
+
+        for part in parts[i:]:
+            value = getattr(value, part)
+
+        return value
+
+    raise ImportError(f"Can't resolve {path!r}")
+
+
+def _path_of(name: str, value: object) -> str:
+    if isinstance(value, ModuleType):
+        return value.__name__
+
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str):
+        path = f"{module}.{qualname}"
+        try:
+            if _resolve(path) is value:
+                return path
+        except (AttributeError, ImportError):
+            pass
+
+    # Constants and aliases don't know where they're defined,
+    # so use the most deeply-nested module that has them
+    modules = sorted(
+        (m for n, m in list(sys.modules.items()) if n == "libretro" or n.startswith("libretro.")),
+        key=lambda m: m.__name__.count("."),
+        reverse=True,
+    )
+    for module in modules:
+        if module.__name__ != "libretro" and vars(module).get(name) is value:
+            return f"{module.__name__}.{name}"
+
+    raise LookupError(f"Can't find where libretro.{name} is defined")
+
+
+def main() -> int:
+    import libretro
+
+    star: dict[str, object] = {}
+    exec("from libretro import *", star)
+
+    names = sorted(name for name in star if not name.startswith("_"))
+    expected: dict[str, str] = json.loads(EXPORTS.read_text()) if EXPORTS.exists() else {}
+
+    errors = []
+    for name, path in expected.items():
+        value = getattr(libretro, name, EXPORTS)
+        if value is EXPORTS:
+            errors.append(f"libretro.{name} is missing (expected {path})")
+        elif value is not _resolve(path):
+            errors.append(f"libretro.{name} is {_path_of(name, value)}, expected {path}")
+        elif star.get(name, EXPORTS) is not value:
+            errors.append(f"'from libretro import *' doesn't export {name} as {path}")
+
+    listed = set(dir(libretro))
+    for name in names:
+        if name not in listed:
+            errors.append(f"dir(libretro) doesn't list {name}")
+
+    for error in errors:
+        print(error, file=sys.stderr)
+
+    if "--update" in sys.argv[1:]:
+        if errors:
+            print("Not updating; fix the errors above first", file=sys.stderr)
+            return 1
+
+        updated = {name: _path_of(name, getattr(libretro, name)) for name in names}
+        EXPORTS.write_text(json.dumps({**updated, **expected}, indent=4, sort_keys=True) + "\n")
+        print(f"Recorded {len(updated.keys() - expected.keys())} new names in {EXPORTS}")
+        return 0
+
+    if not errors:
+        print(f"All {len(expected)} recorded names are still exported")
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,88 @@
 TODO this is API docs
 """
 
-from .api import *
-from .builder import *
-from .core import *
-from .drivers import *
-from .error import *
-from .session import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import *
+    from .builder import *
+    from .core import *
+    from .drivers import *
+    from .error import *
+    from .metadata import *
+    from .rewind import *
+    from .session import *
+
+# Submodules are only imported when one of their names is first accessed (see PEP 562),
+# so that "import libretro" is cheap for short-lived processes that only need part of it.
+# Names resolve as if these modules had been star-imported in this order,
+# so a name exported by more than one of them comes from the last.
+_STAR_MODULES = ("api", "builder", "core", "drivers", "error", "metadata", "rewind", "session")
+
+# Names that a later module started exporting after the star imports were replaced,
+# which would otherwise change what they resolve to
+_PINNED_NAMES = {"memory": "api"}  # Not libretro.drivers.vfs.memory
+
+_SUBMODULES = (*_STAR_MODULES, "parallel")
+
+# Maps each exported name to the module it's taken from; built on first use
+_names: dict[str, str] | None = None
+
+
+def _public_names(module) -> list[str]:
+    # The names that "from module import *" would import,
+    # including any that the module only loads when they're first accessed
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in dir(module) if not name.startswith("_")]
+
+    return list(names)
+
+
+def _name_map() -> dict[str, str]:
+    global _names
+    if _names is None:
+        names: dict[str, str] = {}
+        for module_name in _STAR_MODULES:
+            module = import_module(f".{module_name}", __name__)
+            names.update((name, module_name) for name in _public_names(module))
+
+        names.update(_PINNED_NAMES)
+        _names = names
+
+    return _names
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+
+    if name == "__all__":
+        # Some exported names (e.g. "dict") shadow builtins once they're cached in this module,
+        # so avoid relying on those builtins here.
+        # The star-imported modules were exported too, since importing them bound their names here.
+        # Lazily-loaded names are left out if they can't be loaded (e.g. a broken moderngl).
+        names = [*_STAR_MODULES]
+        for name, module_name in _name_map().items():
+            module = import_module(f".{module_name}", __name__)
+            if name not in _STAR_MODULES and hasattr(module, name):
+                names.append(name)
+
+        globals()["__all__"] = names
+        return names
+
+    if not name.startswith("_"):
+        module_name = _name_map().get(name)
+        if module_name is not None:
+            value = getattr(import_module(f".{module_name}", __name__), name)
+            globals()[name] = value
+            return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    # Leaves out what this module imports for itself (e.g. import_module)
+    private = (name for name in globals() if name.startswith("_"))
+    return sorted({*private, *_SUBMODULES, *__getattr__("__all__")})
@@ -8,6 +8,7 @@ from ctypes import (
     Array,
     Structure,
     addressof,
+    byref,
     c_char_p,
     c_double,
     c_int,
@@ -35,6 +36,28 @@ from libretro._typing import Buffer
 pythonapi.PyMemoryView_FromMemory.argtypes = (c_char_p, c_ssize_t, c_int)
 pythonapi.PyMemoryView_FromMemory.restype = py_object
 
+
+class _Py_buffer(Structure):
+    _fields_ = (
+        ("buf", c_void_p),
+        ("obj", c_void_p),  # Not py_object, PyBuffer_Release manages the reference
+        ("len", c_ssize_t),
+        ("itemsize", c_ssize_t),
+        ("readonly", c_int),
+        ("ndim", c_int),
+        ("format", c_char_p),
+        ("shape", POINTER(c_ssize_t)),
+        ("strides", POINTER(c_ssize_t)),
+        ("suboffsets", POINTER(c_ssize_t)),
+        ("internal", c_void_p),
+    )
+
+
+pythonapi.PyObject_GetBuffer.argtypes = (py_object, POINTER(_Py_buffer), c_int)
+pythonapi.PyObject_GetBuffer.restype = c_int
+pythonapi.PyBuffer_Release.argtypes = (POINTER(_Py_buffer),)
+pythonapi.PyBuffer_Release.restype = None
+
 _int_types = (c_int16, c_int32)
 if hasattr(ctypes, "c_int64"):
     # Some builds of ctypes apparently do not have ctypes.c_int64
@@ -128,6 +151,18 @@ def addressof_buffer(buffer: Buffer) -> int:
     return ctypes.addressof(buffer_array)
 
 
+def addressof_view(buffer: Buffer) -> int:
+    # Unlike addressof_buffer, this also works with read-only buffers
+    # (such as the views passed to VideoDriver.refresh)
+    # and doesn't need to create a ctypes array.
+    view = _Py_buffer()
+    pythonapi.PyObject_GetBuffer(buffer, byref(view), 0)  # PyBUF_SIMPLE
+    try:
+        return view.buf or 0
+    finally:
+        pythonapi.PyBuffer_Release(byref(view))
+
+
 def memoryview_at(
     address: c_char_p | c_void_p | int | bytes, size: c_ssize_t | int, readonly=False
 ) -> memoryview:
@@ -166,6 +201,7 @@ __all__ = [
     "deepcopy_buffer",
     "mmap_file",
     "addressof_buffer",
+    "addressof_view",
     "memoryview_at",
     "c_ptrdiff_t",
     "c_uintptr",
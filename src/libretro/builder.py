@@ -384,7 +384,8 @@ class SessionBuilder:
             :class:`~collections.abc.Callable` () -> :class:`.VideoDriver`
                 Zero-argument function that returns a :class:`.VideoDriver`.
                 Called in :meth:`build`.
-
+                Pass :class:`.NullVideoDriver` itself to discard all frames
+                when only the core's throughput matters.
 
         :return: This :class:`SessionBuilder` object.
         :raises TypeError: If ``video`` is not one of the aforementioned types.
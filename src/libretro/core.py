@@ -1,3 +1,6 @@
+import os
+import shutil
+import weakref
 from abc import abstractmethod
 from collections.abc import Callable, Sequence
 from copy import deepcopy
@@ -9,15 +12,21 @@ from ctypes import (
     c_bool,
     c_char,
     c_char_p,
+    c_int,
+    c_long,
     c_size_t,
     c_ubyte,
     c_uint,
     c_void_p,
     cast,
     cdll,
+    sizeof,
 )
-from os import PathLike
-from typing import Protocol
+from enum import Enum, auto
+from functools import lru_cache
+from os import PathLike, fsdecode
+from tempfile import mkdtemp
+from typing import Protocol, Self
 
 from libretro._typing import Buffer
 from libretro.api import (
@@ -35,6 +44,89 @@ from libretro.api import (
 )
 from libretro.api._utils import memoryview_at
 
+
+@lru_cache(maxsize=16)
+def _char_array(length: int) -> type[Array]:
+    # Savestates are usually the same size every time,
+    # so there's no need to look up a new array type on every call
+    return c_char * length
+
+
+_LM_ID_NEWLM = -1
+
+try:
+    # dlmopen is a glibc extension; it's not available on macOS, Windows, or musl
+    _libdl = CDLL(None, use_errno=True)
+    _dlmopen = _libdl.dlmopen
+    _dlmopen.argtypes = [c_long, c_char_p, c_int]
+    _dlmopen.restype = c_void_p
+    _dlerror = _libdl.dlerror
+    _dlerror.argtypes = []
+    _dlerror.restype = c_char_p
+except (OSError, AttributeError, TypeError):
+    _dlmopen = None
+    _dlerror = None
+
+
+class CoreIsolation(Enum):
+    """
+    How :meth:`Core.isolated` loads a private instance of a core's shared library.
+    """
+
+    DLMOPEN = auto()
+    """
+    Load the library into a new link-map namespace with ``dlmopen``,
+    giving it (and its dependencies) their own copies of all global state.
+    Only available on Linux with glibc, which limits each process to 16 namespaces.
+    """
+
+    COPY = auto()
+    """
+    Copy the library to a temporary file and load that,
+    which the dynamic linker treats as a different library.
+    Works on every platform, but the core's own dependencies are still shared.
+
+    .. note::
+        On Windows, a loaded library's file can't be deleted,
+        and ctypes never unloads the libraries it loads.
+        Each copy (and the temporary directory it's in) is therefore left behind
+        when the process exits, and has to be cleaned up separately
+        (e.g. by clearing ``libretro.py-core-*`` directories from :func:`tempfile.gettempdir`).
+    """
+
+
+def _load_dlmopen(path: str) -> CDLL:
+    handle = _dlmopen(_LM_ID_NEWLM, os.fsencode(path), os.RTLD_NOW | os.RTLD_LOCAL)
+    if not handle:
+        error = _dlerror()
+        raise OSError(f"dlmopen failed: {error.decode(errors='replace') if error else path}")
+
+    return CDLL(path, handle=handle)
+
+
+def _load_copy(path: str) -> CDLL:
+    # Each copy gets its own directory so that its file name matches the original's;
+    # some cores use their own file name to find their data
+    directory = mkdtemp(prefix="libretro.py-core-")
+    try:
+        copy = shutil.copy2(path, os.path.join(directory, os.path.basename(path)))
+        library = CDLL(copy)
+    except BaseException:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+
+    # Loaded libraries' files can be deleted right away on POSIX systems, but not on Windows;
+    # this finalizer also runs at exit, but the library is still loaded by then,
+    # so the copy is left behind there (see CoreIsolation.COPY)
+    weakref.finalize(library, shutil.rmtree, directory, ignore_errors=True)
+    try:
+        os.unlink(copy)
+    except OSError:
+        pass
+
+    return library
+
+
 # TODO: Add a CorePhase enum that's updated when entering/leaving each phase.
 # (Some envcalls can only be called in certain phases, so this would be useful for error checking.)
 
@@ -259,6 +351,9 @@ class Core(CoreInterface):
                 f"Couldn't find required symbol '{e.name}' in {self._core._name}"
             ) from e
 
+        # Set by isolated() so that the original path is reported instead of the private copy's
+        self._origin: str | None = None
+
         # Need to keep references to these objects to prevent them from being garbage collected,
         # otherwise the C function pointers to them will become invalid.
         self._environment: retro_environment_t | None = None
@@ -268,6 +363,61 @@ class Core(CoreInterface):
         self._input_poll: retro_input_poll_t | None = None
         self._input_state: retro_input_state_t | None = None
 
+    @classmethod
+    def isolated(cls, path: str | PathLike, isolation: CoreIsolation | None = None) -> Self:
+        """
+        Loads a private instance of a core's shared library,
+        with global state that's independent of any other instance in this process.
+
+        Loading the same path with :class:`~ctypes.CDLL` more than once
+        returns the already-loaded library,
+        so two :class:`Core` objects created from the same path share all global state.
+        Use this method to run several sessions of one core in a single process,
+        e.g. for a secondary run-ahead instance
+        (see :attr:`.SavestateContext.RUNAHEAD_SAME_BINARY`).
+        Pass ``lambda: Core.isolated(path)`` to :meth:`.SessionBuilder.with_core`
+        to give each built session its own instance.
+
+        :param path: The path to the core's shared library.
+        :param isolation: How to isolate the new instance.
+            If :obj:`None`, :attr:`CoreIsolation.DLMOPEN` is tried first if it's available,
+            falling back to :attr:`CoreIsolation.COPY` if it isn't or if it fails.
+        :return: A new :class:`Core` whose :attr:`path` is still ``path``.
+
+        :raises TypeError: If any parameter is not consistent with its documented types.
+        :raises ValueError: If ``isolation`` is :attr:`CoreIsolation.DLMOPEN`
+            but ``dlmopen`` isn't available on this platform,
+            or if the library doesn't define all the required functions.
+        :raises OSError: If the library couldn't be loaded.
+        """
+        if not isinstance(path, (str, PathLike)):
+            raise TypeError(f"Expected a str or PathLike, got {type(path).__name__}")
+
+        path = fsdecode(path)
+        match isolation:
+            case CoreIsolation.DLMOPEN if _dlmopen is None:
+                raise ValueError("dlmopen is not available on this platform")
+            case CoreIsolation.DLMOPEN:
+                library = _load_dlmopen(path)
+            case CoreIsolation.COPY:
+                library = _load_copy(path)
+            case None if _dlmopen is not None:
+                try:
+                    library = _load_dlmopen(path)
+                except OSError:
+                    # Most likely out of namespaces, or the core needs static TLS
+                    library = _load_copy(path)
+            case None:
+                library = _load_copy(path)
+            case _:
+                raise TypeError(
+                    f"Expected a CoreIsolation or None, got {type(isolation).__name__}"
+                )
+
+        core = cls(library)
+        core._origin = path
+        return core
+
     def set_environment(self, env: retro_environment_t) -> None:
         """
         Calls the core's ``retro_set_environment`` function with the given callback.
@@ -470,13 +620,14 @@ class Core(CoreInterface):
         """
         return self._core.retro_serialize_size()
 
-    def serialize(self, data: bytearray | memoryview | Buffer) -> bool:
+    def serialize(self, data: bytearray | memoryview | Array | Buffer) -> bool:
         """
         Calls the core's ``retro_serialize`` function with the given mutable buffer and its length,
         filling it with whatever data the core returns.
 
-        :param data: A ``bytearray``, mutable ``memoryview``, or ``Buffer`` implementation
+        :param data: A ``bytearray``, mutable ``memoryview``, ctypes ``Array``, or ``Buffer`` implementation
             that core's serialized state will be saved to.
+            ctypes arrays are passed to the core directly.
         :return: ``True`` if the core successfully serialized its state, ``False`` otherwise.
         :raise TypeError: If ``data`` is not one of the aforementioned types.
         :raise ValueError: If ``data`` is a read-only ``memoryview`` or ``Buffer``.
@@ -486,6 +637,8 @@ class Core(CoreInterface):
         """
         buf: memoryview
         match data:
+            case Array():
+                return self._core.retro_serialize(data, sizeof(data))
             case memoryview() as mem if mem.readonly:
                 raise ValueError("data must not be readonly")
             case memoryview():
@@ -497,22 +650,23 @@ class Core(CoreInterface):
                     f"Expected a bytearray, writable Buffer, or writable memoryview; got {type(data).__name__}"
                 )
 
-        buflength = len(buf)
-        arraytype: Array = c_char * buflength
-
-        return self._core.retro_serialize(byref(arraytype.from_buffer(buf)), buflength)
+        buflength = buf.nbytes
+        return self._core.retro_serialize(_char_array(buflength).from_buffer(buf), buflength)
 
-    def unserialize(self, data: bytes | bytearray | memoryview | Buffer) -> bool:
+    def unserialize(self, data: bytes | bytearray | memoryview | Array | Buffer) -> bool:
         """
         Calls the core's ``retro_unserialize`` function with the given buffer and its length,
         restoring the core's state from the serialized data.
 
-        :param data: A ``bytes``, ``bytearray``, ``memoryview``, or ``Buffer``.
+        :param data: A ``bytes``, ``bytearray``, ``memoryview``, ctypes ``Array``, or ``Buffer``.
+            ctypes arrays are passed to the core directly.
         :raises TypeError: If ``data`` is not one of the aforementioned types.
         :return: ``True`` if the core successfully loaded a state from ``data``, ``False`` if not.
         """
         buf: memoryview
         match data:
+            case Array():
+                return self._core.retro_unserialize(data, sizeof(data))
             case bytes():
                 buf = memoryview_at(data, len(data), readonly=False)
                 # HACK! ctypes.Array.from_buffer requires a writable buffer,
@@ -528,11 +682,10 @@ class Core(CoreInterface):
                     f"Expected bytes, bytearray, memoryview, or Buffer; got {type(data).__name__}"
                 )
 
-        buflen = len(buf)
-        arraytype: Array = c_char * buflen
+        buflen = buf.nbytes
 
         # TODO: Validate that the buffer wasn't written to, and raise a warning if it was. (Use zlib.crc32)
-        return self._core.retro_unserialize(byref(arraytype.from_buffer(buf)), buflen)
+        return self._core.retro_unserialize(_char_array(buflen).from_buffer(buf), buflen)
 
     def cheat_reset(self):
         """
@@ -682,11 +835,13 @@ class Core(CoreInterface):
     def path(self) -> str:
         """
         The path to the core's shared library.
+        For a core loaded with :meth:`isolated`, this is the original library's path.
         """
-        return self._core._name
+        return self._origin or self._core._name
 
 
 __all__ = [
     "CoreInterface",
     "Core",
+    "CoreIsolation",
 ]
@@ -30,3 +30,15 @@ from .timing import *
 from .user import *
 from .vfs import *
 from .video import *
+
+
+def __getattr__(name: str):
+    # Some video drivers are only imported when first accessed; see video/__init__.py
+    try:
+        return getattr(video, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *(n for n in dir(video) if not n.startswith("_"))})
@@ -4,4 +4,6 @@ Drivers that receive and optionally process audio data emitted by the core.
 
 from .array import *
 from .driver import *
+from .null import *
+from .ring import *
 from .wave import *
@@ -0,0 +1,128 @@
+import hashlib
+import struct
+import sys
+from array import array
+from copy import deepcopy
+from typing import final
+
+from libretro._typing import override
+from libretro.api.audio import retro_audio_buffer_status_callback, retro_audio_callback
+from libretro.api.av import retro_system_av_info
+from libretro.error import UnsupportedEnvCall
+
+from .driver import AudioDriver
+
+_STEREO_FRAME = struct.Struct("<hh")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+@final
+class NullAudioDriver(AudioDriver):
+    """
+    An audio driver that discards samples instead of storing them,
+    for use when the core's raw throughput matters more than its output.
+
+    It counts the frames it receives and can optionally maintain a running hash of them,
+    so that a session's audio can be compared against a known-good run
+    without keeping it in memory.
+    """
+
+    def __init__(self, hash_algorithm: str | None = None):
+        """
+        :param hash_algorithm: The name of a :py:mod:`hashlib` algorithm
+            used to hash all samples in order as little-endian 16-bit integers,
+            or :obj:`None` to disable hashing.
+
+        :raises TypeError: If ``hash_algorithm`` is not a :class:`str` or :obj:`None`.
+        :raises ValueError: If ``hash_algorithm`` isn't supported by :py:mod:`hashlib`.
+        """
+        if hash_algorithm is not None and not isinstance(hash_algorithm, str):
+            raise TypeError(f"Expected a str or None, got {type(hash_algorithm).__name__}")
+
+        self._hash = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self._frame_count = 0
+        self._system_av_info: retro_system_av_info | None = None
+
+    @override
+    def sample(self, left: int, right: int) -> None:
+        self._frame_count += 1
+        if self._hash is not None:
+            self._hash.update(_STEREO_FRAME.pack(left, right))
+
+    @override
+    def sample_batch(self, data: memoryview) -> int:
+        samples = data.cast("B")
+        frames = len(samples) // _STEREO_FRAME.size
+        self._frame_count += frames
+        if self._hash is not None:
+            if _LITTLE_ENDIAN:
+                self._hash.update(samples)
+            else:
+                # Swapped so that the digest doesn't depend on the host's byte order
+                swapped = array("h")
+                swapped.frombytes(samples)
+                swapped.byteswap()
+                self._hash.update(swapped)
+
+        return frames
+
+    @property
+    def frame_count(self) -> int:
+        """The number of stereo frames received so far."""
+        return self._frame_count
+
+    @property
+    def digest(self) -> bytes | None:
+        """
+        The running hash of all samples received so far,
+        or :obj:`None` if hashing is disabled.
+        """
+        return self._hash.digest() if self._hash is not None else None
+
+    @property
+    @override
+    def callbacks(self) -> retro_audio_callback | None:
+        return None
+
+    @callbacks.setter
+    @override
+    def callbacks(self, callback: retro_audio_callback | None):
+        raise UnsupportedEnvCall("NullAudioDriver does not support setting callbacks")
+
+    @property
+    @override
+    def buffer_status(self) -> retro_audio_buffer_status_callback | None:
+        return None
+
+    @buffer_status.setter
+    @override
+    def buffer_status(self, callback: retro_audio_buffer_status_callback):
+        raise UnsupportedEnvCall("NullAudioDriver does not support setting buffer status callback")
+
+    @property
+    @override
+    def minimum_latency(self) -> int | None:
+        return None
+
+    @minimum_latency.setter
+    @override
+    def minimum_latency(self, latency: int | None):
+        raise UnsupportedEnvCall("NullAudioDriver does not support setting minimum latency")
+
+    @property
+    @override
+    def system_av_info(self) -> retro_system_av_info | None:
+        return deepcopy(self._system_av_info)
+
+    @system_av_info.setter
+    @override
+    def system_av_info(self, info: retro_system_av_info):
+        if not isinstance(info, retro_system_av_info):
+            raise TypeError(f"Expected retro_system_av_info; got {type(info).__name__}")
+
+        self._system_av_info = deepcopy(info)
+
+
+__all__ = [
+    "NullAudioDriver",
+]
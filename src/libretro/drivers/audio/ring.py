@@ -0,0 +1,286 @@
+from array import array
+from copy import deepcopy
+from enum import Enum, auto
+from threading import Condition
+
+from libretro._typing import override
+from libretro.api.audio import retro_audio_buffer_status_callback, retro_audio_callback
+from libretro.api.av import retro_system_av_info
+from libretro.error import UnsupportedEnvCall
+
+from .driver import AudioDriver
+
+_CHANNELS = 2
+
+
+class OverflowPolicy(Enum):
+    """
+    What a :class:`RingBufferAudioDriver` does when the core submits more audio than fits.
+    """
+
+    OVERWRITE = auto()
+    """Discard the oldest frames to make room for new ones."""
+
+    BLOCK = auto()
+    """Wait for another thread to :meth:`~RingBufferAudioDriver.read` enough frames."""
+
+
+class RingBufferAudioDriver(AudioDriver):
+    """
+    An audio driver that keeps a fixed number of the most recent stereo frames
+    in a buffer that's allocated once,
+    so that memory use doesn't grow over the course of a long session.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        policy: OverflowPolicy = OverflowPolicy.OVERWRITE,
+        timeout: float | None = None,
+    ):
+        """
+        :param capacity: The maximum number of stereo frames this driver can hold.
+        :param policy: What to do when a batch of frames doesn't fit in the buffer.
+        :param timeout: The maximum number of seconds to wait for free space
+            if ``policy`` is :attr:`OverflowPolicy.BLOCK`,
+            or :obj:`None` to wait indefinitely.
+            Frames that still don't fit after this time are discarded.
+            Ignored for other policies.
+
+        :raises TypeError: If any parameter is not consistent with its documented types.
+        :raises ValueError: If ``capacity`` is not positive or ``timeout`` is negative.
+        """
+        if not isinstance(capacity, int):
+            raise TypeError(f"Expected an int, got {type(capacity).__name__}")
+
+        if capacity <= 0:
+            raise ValueError(f"Expected a positive capacity, got {capacity}")
+
+        if not isinstance(policy, OverflowPolicy):
+            raise TypeError(f"Expected an OverflowPolicy, got {type(policy).__name__}")
+
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise TypeError(f"Expected a float or None, got {type(timeout).__name__}")
+
+        if timeout is not None and timeout < 0:
+            raise ValueError(f"Expected a non-negative timeout, got {timeout}")
+
+        self._capacity = capacity
+        self._policy = policy
+        self._timeout = timeout
+
+        # The buffer is stored twice over, back to back, so that any run of
+        # up to `capacity` frames is contiguous and can be viewed without copying
+        self._buffer = array("h", bytes(capacity * _CHANNELS * 2 * 2))
+        self._view = memoryview(self._buffer)
+        self._mirror = capacity * _CHANNELS
+        self._write_pos = 0
+        self._size = 0
+        self._dropped = 0
+        self._ready = Condition()
+        self._system_av_info: retro_system_av_info | None = None
+
+    def __write(self, samples: memoryview) -> None:
+        # Assumes the lock is held and that `samples` holds at most `capacity` frames
+        start = self._write_pos * _CHANNELS
+        length = len(samples)
+        head = min(length, self._mirror - start)
+        view = self._view
+        mirror = self._mirror
+
+        view[start : start + head] = samples[:head]
+        view[start + mirror : start + mirror + head] = samples[:head]
+        if head < length:
+            tail = length - head
+            view[:tail] = samples[head:]
+            view[mirror : mirror + tail] = samples[head:]
+
+        frames = length // _CHANNELS
+        self._write_pos = (self._write_pos + frames) % self._capacity
+        overflow = self._size + frames - self._capacity
+        if overflow > 0:
+            self._dropped += overflow
+            self._size = self._capacity
+        else:
+            self._size += frames
+
+        self._ready.notify_all()
+
+    def __write_blocking(self, samples: memoryview) -> int:
+        # Assumes the lock is held
+        written = 0
+        total = len(samples) // _CHANNELS
+        while written < total:
+            free = self._capacity - self._size
+            if free == 0:
+                if not self._ready.wait_for(lambda: self._size < self._capacity, self._timeout):
+                    break
+
+                continue
+
+            count = min(free, total - written)
+            self.__write(samples[written * _CHANNELS : (written + count) * _CHANNELS])
+            written += count
+
+        self._dropped += total - written
+        return written
+
+    def sample(self, left: int, right: int):
+        with self._ready:
+            self.__submit(memoryview(array("h", (left, right))))
+
+    def sample_batch(self, data: memoryview) -> int:
+        """
+        Copies ``data`` into the ring buffer according to this driver's :attr:`policy`.
+
+        :return: The number of frames accepted.
+            May be less than the number given if the policy is :attr:`OverflowPolicy.BLOCK`
+            and the timeout elapsed before enough space was freed.
+        """
+        samples = data.cast("B").cast("h")
+        with self._ready:
+            return self.__submit(samples)
+
+    def __submit(self, samples: memoryview) -> int:
+        frames = len(samples) // _CHANNELS
+        if self._policy == OverflowPolicy.BLOCK:
+            return self.__write_blocking(samples)
+
+        if frames > self._capacity:
+            # Only the newest frames would survive anyway
+            self._dropped += frames - self._capacity
+            samples = samples[-self._capacity * _CHANNELS :]
+
+        self.__write(samples)
+        return frames
+
+    def recent(self, frames: int | None = None) -> memoryview:
+        """
+        Returns the most recent frames without removing them from the buffer.
+
+        :param frames: The maximum number of frames to return,
+            or :obj:`None` to return all buffered frames.
+        :return: A :class:`memoryview` of interleaved 16-bit stereo samples
+            that points directly into this driver's buffer.
+            It will be overwritten by later samples,
+            so copy it if it needs to outlive the next frame.
+
+        :raises ValueError: If ``frames`` is negative.
+        """
+        with self._ready:
+            count = self.__count(frames)
+            start = ((self._write_pos - count) % self._capacity) * _CHANNELS
+            return self._view[start : start + count * _CHANNELS].toreadonly()
+
+    def read(self, frames: int | None = None) -> memoryview:
+        """
+        Removes the oldest frames from the buffer and returns them,
+        making room for the core to submit more.
+
+        :param frames: The maximum number of frames to read,
+            or :obj:`None` to read all buffered frames.
+        :return: A :class:`memoryview` of interleaved 16-bit stereo samples
+            that points directly into this driver's buffer.
+            The space it occupies may be reused as soon as this method returns,
+            so copy it before the core runs again.
+
+        :raises ValueError: If ``frames`` is negative.
+        """
+        with self._ready:
+            count = self.__count(frames)
+            start = ((self._write_pos - self._size) % self._capacity) * _CHANNELS
+            self._size -= count
+            self._ready.notify_all()
+            return self._view[start : start + count * _CHANNELS].toreadonly()
+
+    def __count(self, frames: int | None) -> int:
+        if frames is None:
+            return self._size
+
+        if frames < 0:
+            raise ValueError(f"Expected a non-negative frame count, got {frames}")
+
+        return min(frames, self._size)
+
+    def clear(self) -> None:
+        """
+        Discards all buffered frames without reallocating the buffer.
+        """
+        with self._ready:
+            self._size = 0
+            self._write_pos = 0
+            self._ready.notify_all()
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of frames this driver can hold."""
+        return self._capacity
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        """What this driver does when a batch of frames doesn't fit."""
+        return self._policy
+
+    @property
+    def frames(self) -> int:
+        """The number of frames currently buffered."""
+        return self._size
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of frames that were discarded before being read,
+        either because they were overwritten or because the timeout elapsed.
+        """
+        return self._dropped
+
+    @property
+    @override
+    def callbacks(self) -> retro_audio_callback | None:
+        return None
+
+    @callbacks.setter
+    @override
+    def callbacks(self, callback: retro_audio_callback | None):
+        raise UnsupportedEnvCall("RingBufferAudioDriver does not support setting callbacks")
+
+    @property
+    @override
+    def buffer_status(self) -> retro_audio_buffer_status_callback | None:
+        return None
+
+    @buffer_status.setter
+    @override
+    def buffer_status(self, callback: retro_audio_buffer_status_callback):
+        raise UnsupportedEnvCall(
+            "RingBufferAudioDriver does not support setting buffer status callback"
+        )
+
+    @property
+    @override
+    def minimum_latency(self) -> int | None:
+        return None
+
+    @minimum_latency.setter
+    @override
+    def minimum_latency(self, latency: int | None):
+        raise UnsupportedEnvCall("RingBufferAudioDriver does not support setting minimum latency")
+
+    @property
+    @override
+    def system_av_info(self) -> retro_system_av_info | None:
+        return deepcopy(self._system_av_info)
+
+    @system_av_info.setter
+    @override
+    def system_av_info(self, info: retro_system_av_info):
+        if not isinstance(info, retro_system_av_info):
+            raise TypeError(f"Expected retro_system_av_info; got {type(info).__name__}")
+
+        self._system_av_info = deepcopy(info)
+
+
+__all__ = [
+    "OverflowPolicy",
+    "RingBufferAudioDriver",
+]
@@ -1,7 +1,11 @@
+import struct
 import wave
 from copy import deepcopy
 from io import RawIOBase
 from os import PathLike, fsdecode
+from queue import Queue
+from threading import Thread
+from warnings import warn
 
 from libretro._typing import override
 from libretro.api.audio import retro_audio_buffer_status_callback, retro_audio_callback
@@ -10,9 +14,48 @@ from libretro.error import UnsupportedEnvCall
 
 from .driver import AudioDriver
 
+_FRAME_SIZE = 4  # Two channels of 16-bit samples
+_DEFAULT_SAMPLE_RATE = 44100
+_STEREO_FRAME = struct.Struct("<hh")
+
 
 class WaveWriterAudioDriver(AudioDriver):
-    def __init__(self, file: str | bytes | PathLike | RawIOBase):
+    """
+    An audio driver that records the core's output to a WAV file.
+
+    Samples are collected into preallocated chunks on the emulation thread,
+    and full chunks are written to the file by a background thread.
+    Call :meth:`close` to write any remaining samples and finalize the file.
+    """
+
+    def __init__(
+        self,
+        file: str | bytes | PathLike | RawIOBase,
+        chunk_frames: int = 4096,
+        max_pending_chunks: int = 8,
+    ):
+        """
+        :param file: The path of the file to write to, or a writable binary stream.
+        :param chunk_frames: The number of stereo frames to collect before handing them off to the writer thread.
+        :param max_pending_chunks: The number of full chunks that may be waiting to be written
+            before the emulation thread has to wait for the writer thread to catch up.
+
+        :raises TypeError: If any parameter is not consistent with its documented types.
+        :raises ValueError: If ``file`` is a stream that isn't writable,
+            or if ``chunk_frames`` or ``max_pending_chunks`` is not positive.
+        """
+        if not isinstance(chunk_frames, int):
+            raise TypeError(f"Expected an int, got {type(chunk_frames).__name__}")
+
+        if chunk_frames <= 0:
+            raise ValueError(f"Expected a positive chunk size, got {chunk_frames}")
+
+        if not isinstance(max_pending_chunks, int):
+            raise TypeError(f"Expected an int, got {type(max_pending_chunks).__name__}")
+
+        if max_pending_chunks <= 0:
+            raise ValueError(f"Expected a positive queue size, got {max_pending_chunks}")
+
         match file:
             case str() as name:
                 self._file = wave.open(name, "wb")
@@ -23,24 +66,93 @@ class WaveWriterAudioDriver(AudioDriver):
             case RawIOBase() as io if not io.writable():
                 raise ValueError("RawIOBase must be writable")
             case RawIOBase() as io:
-                self._file = wave.open(io)
+                self._file = wave.open(io, "wb")
             case _:
                 raise TypeError(f"Expected a str, bytes, path, or RawIOBase, got {file!r}")
 
         self._file.setnchannels(2)
         self._file.setsampwidth(2)
-        self._file.setframerate(44100)
+        self._file.setframerate(_DEFAULT_SAMPLE_RATE)
         self._system_av_info: retro_system_av_info | None = None
 
+        # One chunk is being filled while the others are queued or being written
+        self._free_chunks: Queue[bytearray] = Queue()
+        for _ in range(max_pending_chunks + 1):
+            self._free_chunks.put(bytearray(chunk_frames * _FRAME_SIZE))
+
+        self._full_chunks: Queue[tuple[bytearray, int] | None] = Queue(max_pending_chunks)
+        self._chunk = self._free_chunks.get()
+        self._chunk_view = memoryview(self._chunk)
+        self._chunk_length = 0
+        self._writer: Thread | None = None
+        self._error: BaseException | None = None
+        self._closed = False
+
+    def __write_chunks(self) -> None:
+        # Runs on the writer thread
+        while (item := self._full_chunks.get()) is not None:
+            chunk, length = item
+            try:
+                if self._error is None:
+                    self._file.writeframesraw(memoryview(chunk)[:length])
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._free_chunks.put(chunk)
+
+    def __check_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self) -> None:
+        """
+        Hands off all collected samples to the writer thread,
+        even if the current chunk isn't full.
+        Does not wait for them to be written.
+
+        :raises ValueError: If this driver has been closed.
+        :raises Exception: Whatever the writer thread raised while writing an earlier chunk.
+        """
+        if self._closed:
+            raise ValueError("WaveWriterAudioDriver is closed")
+
+        self.__check_error()
+        if self._chunk_length == 0:
+            return
+
+        if self._writer is None:
+            # The header (and thus the sample rate) is written along with the first chunk
+            self._writer = Thread(
+                target=self.__write_chunks, name="WaveWriterAudioDriver", daemon=True
+            )
+            self._writer.start()
+
+        self._full_chunks.put((self._chunk, self._chunk_length))
+        self._chunk = self._free_chunks.get()
+        self._chunk_view = memoryview(self._chunk)
+        self._chunk_length = 0
+
     def sample(self, left: int, right: int):
-        self._file.writeframesraw(left.to_bytes(2, "little", signed=True))
-        self._file.writeframesraw(right.to_bytes(2, "little", signed=True))
+        _STEREO_FRAME.pack_into(self._chunk, self._chunk_length, left, right)
+        self._chunk_length += _FRAME_SIZE
+        if self._chunk_length == len(self._chunk):
+            self.flush()
 
     def sample_batch(self, data: memoryview) -> int:
-        self._file.writeframesraw(data)
-
-        # Divide by two to return number of frames
-        return len(memoryview) // 2
+        samples = data.cast("B")
+        offset = 0
+        while offset < len(samples):
+            count = min(len(samples) - offset, len(self._chunk) - self._chunk_length)
+            self._chunk_view[self._chunk_length : self._chunk_length + count] = samples[
+                offset : offset + count
+            ]
+            self._chunk_length += count
+            offset += count
+            if self._chunk_length == len(self._chunk):
+                self.flush()
+
+        return len(samples) // _FRAME_SIZE
 
     @property
     @override
@@ -50,7 +162,7 @@ class WaveWriterAudioDriver(AudioDriver):
     @callbacks.setter
     @override
     def callbacks(self, callback: retro_audio_callback | None):
-        raise UnsupportedEnvCall("ArrayAudioDriver does not support setting callbacks")
+        raise UnsupportedEnvCall("WaveWriterAudioDriver does not support setting callbacks")
 
     @property
     @override
@@ -61,7 +173,7 @@ class WaveWriterAudioDriver(AudioDriver):
     @override
     def buffer_status(self, callback: retro_audio_buffer_status_callback):
         raise UnsupportedEnvCall(
-            "ArrayAudioDriver does not support setting buffer status callback"
+            "WaveWriterAudioDriver does not support setting buffer status callback"
         )
 
     @property
@@ -72,7 +184,7 @@ class WaveWriterAudioDriver(AudioDriver):
     @minimum_latency.setter
     @override
     def minimum_latency(self, latency: int | None):
-        raise UnsupportedEnvCall("ArrayAudioDriver does not support setting minimum latency")
+        raise UnsupportedEnvCall("WaveWriterAudioDriver does not support setting minimum latency")
 
     @property
     @override
@@ -87,8 +199,42 @@ class WaveWriterAudioDriver(AudioDriver):
 
         self._system_av_info = deepcopy(info)
 
+        rate = round(info.timing.sample_rate)
+        if rate <= 0 or rate == self._file.getframerate():
+            return
+
+        if self._writer is not None:
+            # WAV files only have one sample rate, and it's already been written
+            warn(
+                f"Ignoring sample rate change to {rate} Hz after recording began at {self._file.getframerate()} Hz"
+            )
+            return
+
+        self._file.setframerate(rate)
+
     def close(self):
-        self._file.close()
+        """
+        Writes all remaining samples, waits for the writer thread to finish,
+        and closes the file.
+        Does nothing if this driver is already closed.
+
+        :raises Exception: Whatever the writer thread raised while writing a chunk.
+        """
+        if self._closed:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            if self._writer is not None:
+                self._full_chunks.put(None)
+                self._writer.join()
+                self._writer = None
+
+            self._file.close()
+
+        self.__check_error()
 
 
 __all__ = [
@@ -3,6 +3,7 @@ from copy import deepcopy
 from ctypes import (
     POINTER,
     Array,
+    addressof,
     byref,
     c_bool,
     c_char_p,
@@ -11,6 +12,7 @@ from ctypes import (
     c_uint,
     c_uint64,
     c_void_p,
+    cast,
     memmove,
     pointer,
     sizeof,
@@ -93,6 +95,7 @@ from libretro.api import (
     retro_vfs_interface_info,
 )
 from libretro.api._utils import (
+    Pointer,
     as_bytes,
     deepcopy_array,
     from_zero_terminated,
@@ -122,6 +125,36 @@ from .default import DefaultEnvironmentDriver
 # TODO: Match envcalls even if the experimental flag is unset (but still consider it for ABI differences)
 
 
+_RUNAHEAD_CONTEXTS = frozenset(
+    (SavestateContext.RUNAHEAD_SAME_INSTANCE, SavestateContext.RUNAHEAD_SAME_BINARY)
+)
+
+
+class _ViewCache:
+    """
+    Reuses the most recent view if asked for the same memory again,
+    since most cores pass the same video and audio buffers on every call.
+    """
+
+    __slots__ = ("_address", "_size", "_view", "_format", "_readonly")
+
+    def __init__(self, format: str, readonly: bool):
+        self._address: int | None = None
+        self._size: int | None = None
+        self._view: memoryview | None = None
+        self._format = format
+        self._readonly = readonly
+
+    def view(self, address: int, size: int) -> memoryview:
+        if address != self._address or size != self._size:
+            view = memoryview_at(address, size, readonly=self._readonly)
+            self._view = view.cast(self._format) if self._format != "B" else view
+            self._address = address
+            self._size = size
+
+        return self._view
+
+
 class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
     class Args(TypedDict, total=False):
         audio: Required[AudioDriver]
@@ -286,6 +319,13 @@ class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
                 f"Expected PowerDriver or None, got {type(self._device_power).__qualname__}"
             )
 
+        # Toggled by the frontend while running frames that shouldn't be seen or heard
+        self._suppress_video = False
+        self._suppress_audio = False
+        self._freeze_input = False
+
+        self._video_views = _ViewCache("B", readonly=True)
+        self._audio_views = _ViewCache("h", readonly=False)
         self._rumble: retro_rumble_interface | None = None
         self._sensor: retro_sensor_interface | None = None
         self._log_cb: retro_log_callback | None = None
@@ -323,8 +363,49 @@ class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
     def timing(self) -> TimingDriver | None:
         return self._timing
 
+    @property
+    def suppress_video(self) -> bool:
+        """
+        Whether frames submitted by the core are discarded
+        instead of being passed to the video driver.
+        The core is told that video is disabled through ``RETRO_ENVIRONMENT_GET_AUDIO_VIDEO_ENABLE``.
+        """
+        return self._suppress_video
+
+    @suppress_video.setter
+    def suppress_video(self, value: bool) -> None:
+        self._suppress_video = bool(value)
+
+    @property
+    def suppress_audio(self) -> bool:
+        """
+        Whether samples submitted by the core are discarded
+        instead of being passed to the audio driver.
+        The core is told that audio is disabled through ``RETRO_ENVIRONMENT_GET_AUDIO_VIDEO_ENABLE``.
+        """
+        return self._suppress_audio
+
+    @suppress_audio.setter
+    def suppress_audio(self, value: bool) -> None:
+        self._suppress_audio = bool(value)
+
+    @property
+    def freeze_input(self) -> bool:
+        """
+        Whether the core's calls to ``retro_input_poll_t`` are ignored,
+        so that the input driver keeps reporting the state from the most recent poll.
+        """
+        return self._freeze_input
+
+    @freeze_input.setter
+    def freeze_input(self, value: bool) -> None:
+        self._freeze_input = bool(value)
+
     @override
     def video_refresh(self, data: c_void_p, width: int, height: int, pitch: int) -> None:
+        if self._suppress_video:
+            return
+
         # Handle the constants and their equivalent ints, just to be safe
         match data:
             case FrameBufferSpecial.DUPE | 0 | None:
@@ -332,7 +413,8 @@ class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
             case FrameBufferSpecial.HARDWARE | -1 | 18446744073709551615:
                 self._video.refresh(FrameBufferSpecial.HARDWARE, width, height, pitch)
             case int() | c_void_p():
-                view = memoryview_at(data, pitch * height, readonly=True)
+                address = data if isinstance(data, int) else data.value
+                view = self._video_views.view(address, pitch * height)
                 assert (
                     len(view) == pitch * height
                 ), f"Expected view to have {pitch * height} bytes, got {len(view)} bytes"
@@ -344,11 +426,24 @@ class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
 
     @override
     def audio_sample(self, left: int, right: int) -> None:
-        self._audio.sample(left, right)
+        if not self._suppress_audio:
+            self._audio.sample(left, right)
 
     @override
     def audio_sample_batch(self, data: POINTER(c_int16), frames: int) -> int:
-        sample_view = memoryview_at(data, frames * 2 * sizeof(c_int16)).cast("h")
+        if self._suppress_audio:
+            return frames
+
+        match data:
+            case Pointer() if data:
+                # Cheaper than casting the pointer to c_void_p
+                address = addressof(data.contents)
+            case int():
+                address = data
+            case _:
+                address = cast(data, c_void_p).value or 0
+
+        sample_view = self._audio_views.view(address, frames * 2 * sizeof(c_int16))
         assert (
             len(sample_view) == frames * 2
         ), f"Expected view to have {frames * 2} samples, got {len(sample_view)} samples"
@@ -356,7 +451,8 @@ class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
 
     @override
     def input_poll(self) -> None:
-        self._input.poll()
+        if not self._freeze_input:
+            self._input.poll()
 
     @override
     def input_state(self, port: int, device: int, index: int, id: int) -> int:
@@ -1039,7 +1135,16 @@ class CompositeEnvironmentDriver(DefaultEnvironmentDriver):
     @override
     def _get_audio_video_enable(self, enable_ptr: POINTER(retro_av_enable_flags)) -> bool:
         if enable_ptr:
-            enable_ptr[0] = self._av_enable
+            flags = self._av_enable
+            if flags is not None and self._suppress_video:
+                flags &= ~AvEnableFlags.VIDEO
+            if flags is not None and self._suppress_audio:
+                flags &= ~AvEnableFlags.AUDIO
+            if flags is not None and self._savestate_context in _RUNAHEAD_CONTEXTS:
+                # Run-ahead serializes on every frame, so ask the core to skip anything slow
+                flags |= AvEnableFlags.FAST_SAVESTATES
+
+            enable_ptr[0] = flags
 
         # This envcall supports passing NULL to query for support
         return True
@@ -10,7 +10,24 @@ from .driver import EnvironmentDriver
 
 EnvironmentCallbackFunction = Callable[[c_void_p], bool]
 
-_ENVCALL_MEMBERS = EnvironmentCall.__members__.values()
+# Maps each envcall to its variant with RETRO_ENVIRONMENT_EXPERIMENTAL set,
+# for envcalls that cores may send either way (e.g. SET_HW_RENDER)
+_EXPERIMENTAL_VARIANTS: Mapping[EnvironmentCall, EnvironmentCall] = {
+    e: EnvironmentCall[f"{e.name}_EXPERIMENTAL"]
+    for e in EnvironmentCall
+    if f"{e.name}_EXPERIMENTAL" in EnvironmentCall.__members__
+}
+
+
+def _dispatch_table(
+    envcalls: Mapping[EnvironmentCall, EnvironmentCallbackFunction]
+) -> dict[int, EnvironmentCallbackFunction]:
+    table = {int(envcall): function for envcall, function in envcalls.items()}
+    for envcall, variant in _EXPERIMENTAL_VARIANTS.items():
+        if envcall in envcalls and variant not in envcalls:
+            table[int(variant)] = envcalls[envcall]
+
+    return table
 
 
 class DictEnvironmentDriver(
@@ -18,9 +35,12 @@ class DictEnvironmentDriver(
 ):
     def __init__(self, envcalls: Mapping[EnvironmentCall, EnvironmentCallbackFunction]):
         self._envcalls: Mapping[EnvironmentCall, EnvironmentCallbackFunction] = MappingProxyType(
-            envcalls
+            dict(envcalls)
         )
 
+        # Keyed by the raw envcall number so that dispatch doesn't have to construct enums
+        self._dispatch = _dispatch_table(self._envcalls)
+
     @override
     def __getitem__(self, __key: EnvironmentCall) -> EnvironmentCallbackFunction:
         return self._envcalls[__key]
@@ -35,17 +55,14 @@ class DictEnvironmentDriver(
 
     @override
     def environment(self, cmd: int, data: c_void_p) -> bool:
-        if cmd not in _ENVCALL_MEMBERS:
+        function = self._dispatch.get(cmd)
+        if function is None:
             return False
 
-        envcall = EnvironmentCall(cmd)
-        if envcall in self._envcalls:
-            try:
-                return self._envcalls[envcall](data)
-            except UnsupportedEnvCall:
-                pass
-
-        return False
+        try:
+            return function(data)
+        except UnsupportedEnvCall:
+            return False
 
 
 __all__ = [
@@ -40,6 +40,10 @@ _DEVICEID_LIGHTGUN_MEMBERS = DeviceIdLightgun.__members__.values()
 _DEVICEID_MOUSE_MEMBERS = DeviceIdMouse.__members__.values()
 _KEY_MEMBERS = Key.__members__.values()
 
+# Each of a state query's four arguments must fit in 16 bits
+# for the query to be packed into a single integer key
+_STATE_KEY_LIMIT = 1 << 16
+
 
 @dataclass(order=True, slots=True)
 class Point:
@@ -134,6 +138,9 @@ class GeneratorInputDriver(InputDriver):
         self._input_poll_result: InputPollResult = None
         self._last_input_poll_result: InputPollResult = None
 
+        # Results of state() for the current poll, keyed by packed (port, device, index, id)
+        self._state_table: dict[int, int] = {}
+
         self._input_descriptors: Sequence[retro_input_descriptor] | None = None
         self._controller_info: Sequence[retro_controller_info] | None = None
         self._device_capabilities = device_capabilities
@@ -157,11 +164,13 @@ class GeneratorInputDriver(InputDriver):
 
         # Unrecognized devices will be filtered out by the CONFORM boundary on InputDeviceFlag
         self._device_capabilities = InputDeviceFlag(value)
+        self._state_table.clear()
 
     @device_capabilities.deleter
     @override
     def device_capabilities(self) -> None:
         self._device_capabilities = None
+        self._state_table.clear()
 
     @property
     @override
@@ -172,11 +181,13 @@ class GeneratorInputDriver(InputDriver):
     @override
     def bitmasks_supported(self, value: bool) -> None:
         self._bitmasks_supported = bool(value)
+        self._state_table.clear()
 
     @bitmasks_supported.deleter
     @override
     def bitmasks_supported(self) -> None:
         self._bitmasks_supported = None
+        self._state_table.clear()
 
     @property
     @override
@@ -189,10 +200,12 @@ class GeneratorInputDriver(InputDriver):
         match max_users:
             case int(i) if i >= 0:
                 self._max_users = int(i)
+                self._state_table.clear()
             case int(i):
                 raise ValueError(f"Expected None or a non-negative int, got {i}")
             case None:
                 self._max_users = None
+                self._state_table.clear()
             case _:
                 raise TypeError(f"Expected None or a non-negative int, got {max_users!r}")
 
@@ -200,6 +213,7 @@ class GeneratorInputDriver(InputDriver):
     @override
     def max_users(self) -> None:
         self._max_users = None
+        self._state_table.clear()
 
     def poll(self) -> None:
         if self._input_generator:
@@ -212,6 +226,7 @@ class GeneratorInputDriver(InputDriver):
 
             self._last_input_poll_result = self._input_poll_result
             self._input_poll_result = next(self._input_generator_state, None)
+            self._state_table.clear()
 
             # TODO: Send keyboard callback events
 
@@ -222,6 +237,21 @@ class GeneratorInputDriver(InputDriver):
             self._rumble.poll()
 
     def state(self, port: int, device: int, index: int, id: int) -> int:
+        # Cores may query the same inputs many times per frame,
+        # so each query's result is computed once per poll and then looked up.
+        # Queries that raise an exception are never stored.
+        if not 0 <= (port | device | index | id) < _STATE_KEY_LIMIT:
+            return self._lookup_state(port, device, index, id)
+
+        key = (port << 48) | (device << 32) | (index << 16) | id
+        table = self._state_table
+        value = table.get(key)
+        if value is None:
+            value = table[key] = self._lookup_state(port, device, index, id)
+
+        return value
+
+    def _lookup_state(self, port: int, device: int, index: int, id: int) -> int:
         match (
             self._input_generator,
             self._input_poll_result,
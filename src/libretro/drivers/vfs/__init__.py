@@ -1,3 +1,5 @@
+from .cache import *
 from .default import *
 from .history import *
 from .interface import *
+from .memory import *
@@ -0,0 +1,343 @@
+import errno
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from libretro.api.vfs import (
+    VfsFileAccess,
+    VfsFileAccessHint,
+    VfsMkdirResult,
+    VfsSeekPosition,
+    VfsStat,
+)
+
+from .interface import DirectoryHandle, FileHandle, FileSystemInterface
+
+
+def _path_key(path: bytes) -> bytes:
+    # Different spellings of the same path should share cached blocks
+    return os.path.abspath(os.fsencode(path))
+
+
+@dataclass(slots=True)
+class BlockCacheStats:
+    """Counts how reads through a :class:`CachingFileSystemInterface` were served."""
+
+    hits: int = 0
+    """The number of blocks that were read from the cache."""
+
+    misses: int = 0
+    """The number of blocks that had to be read from the wrapped interface."""
+
+    hit_bytes: int = 0
+    """The number of bytes copied to the core from cached blocks."""
+
+    miss_bytes: int = 0
+    """The number of bytes read from the wrapped interface to fill the cache."""
+
+    evictions: int = 0
+    """The number of blocks dropped to stay within the cache's byte budget."""
+
+    invalidations: int = 0
+    """The number of blocks dropped because their file was modified, renamed, or removed."""
+
+
+class _BlockCache:
+    def __init__(self, block_size: int, max_bytes: int, stats: BlockCacheStats):
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.stats = stats
+        self.size = 0
+
+        # Ordered from least to most recently used
+        self._blocks: OrderedDict[tuple[bytes, int], bytes] = OrderedDict()
+
+        # The cached block indexes of each path, so that a file's blocks can be found quickly
+        self._paths: dict[bytes, set[int]] = {}
+
+    def get(self, path: bytes, index: int) -> bytes | None:
+        block = self._blocks.get((path, index))
+        if block is not None:
+            self._blocks.move_to_end((path, index))
+
+        return block
+
+    def put(self, path: bytes, index: int, block: bytes) -> None:
+        if len(block) > self.max_bytes:
+            return
+
+        self.discard(path, index)
+        self._blocks[(path, index)] = block
+        self._paths.setdefault(path, set()).add(index)
+        self.size += len(block)
+        while self.size > self.max_bytes:
+            (old_path, old_index), old_block = self._blocks.popitem(last=False)
+            self.__forget(old_path, old_index, old_block)
+            self.stats.evictions += 1
+
+    def discard(self, path: bytes, index: int) -> bool:
+        block = self._blocks.pop((path, index), None)
+        if block is None:
+            return False
+
+        self.__forget(path, index, block)
+        return True
+
+    def invalidate(self, path: bytes, start: int = 0, end: int | None = None) -> None:
+        """Drops the blocks of ``path`` that overlap the byte range ``[start, end)``."""
+        indexes = self._paths.get(path)
+        if not indexes:
+            return
+
+        first = start // self.block_size
+        last = (end - 1) // self.block_size if end is not None else None
+        for index in tuple(indexes):
+            block = self._blocks[(path, index)]
+            in_range = first <= index and (last is None or index <= last)
+
+            # A short block is the end of the file, so a write past it changes its length
+            is_tail = len(block) < self.block_size and index < first
+            if (in_range or is_tail) and self.discard(path, index):
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._paths.clear()
+        self.size = 0
+
+    def __forget(self, path: bytes, index: int, block: bytes):
+        self.size -= len(block)
+        indexes = self._paths[path]
+        indexes.discard(index)
+        if not indexes:
+            del self._paths[path]
+
+
+class CachingFileHandle(FileHandle):
+    """
+    Wraps another :class:`FileHandle`, serving reads from a shared cache of fixed-size blocks.
+    The file's position is tracked here so that cache hits don't touch the wrapped handle.
+    """
+
+    def __init__(
+        self,
+        handle: FileHandle,
+        path: bytes,
+        mode: VfsFileAccess,
+        hints: VfsFileAccessHint,
+        cache: _BlockCache,
+    ):
+        super().__init__(path, mode, hints)
+        if not isinstance(handle, FileHandle):
+            raise TypeError(f"Expected a FileHandle, got {type(handle).__name__}")
+
+        if not isinstance(cache, _BlockCache):
+            raise TypeError(f"Expected a _BlockCache, got {type(cache).__name__}")
+
+        self._handle = handle
+        self._key = _path_key(path)
+        self._cache = cache
+        self._position = 0
+
+    def close(self) -> bool:
+        return self._handle.close()
+
+    @property
+    def path(self) -> bytes:
+        return self._handle.path
+
+    @property
+    def size(self) -> int:
+        return self._handle.size
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: VfsSeekPosition) -> int:
+        match whence:
+            case VfsSeekPosition.START:
+                position = offset
+            case VfsSeekPosition.CURRENT:
+                position = self._position + offset
+            case VfsSeekPosition.END:
+                position = self._handle.size + offset
+            case _:
+                raise ValueError(f"Invalid VfsSeekPosition: {whence}")
+
+        if position < 0:
+            raise OSError(errno.EINVAL, "Invalid seek position", self._handle.path)
+
+        self._position = position
+        return position
+
+    def read(self, buffer: bytearray | memoryview) -> int:
+        cache = self._cache
+        block_size = cache.block_size
+        stats = cache.stats
+        buffer = memoryview(buffer).cast("B")
+        position = self._position
+        copied = 0
+        while copied < len(buffer):
+            index, offset = divmod(position, block_size)
+            block = cache.get(self._key, index)
+            hit = block is not None
+            if not hit:
+                block = self.__load(index)
+                stats.misses += 1
+                stats.miss_bytes += len(block)
+                if block:
+                    cache.put(self._key, index, block)
+
+            chunk = block[offset : offset + len(buffer) - copied]
+            if not chunk:
+                break  # At or past the end of the file
+
+            buffer[copied : copied + len(chunk)] = chunk
+            copied += len(chunk)
+            position += len(chunk)
+            if hit:
+                stats.hits += 1
+                stats.hit_bytes += len(chunk)
+
+            if len(block) < block_size:
+                break  # Only the file's last block can be short
+
+        self._position = position
+        return copied
+
+    def write(self, buffer: bytes | bytearray | memoryview) -> int:
+        self._handle.seek(self._position, VfsSeekPosition.START)
+        written = self._handle.write(buffer)
+        if written > 0:
+            self._cache.invalidate(self._key, self._position, self._position + written)
+            self._position += written
+
+        return written
+
+    def flush(self) -> bool:
+        return self._handle.flush()
+
+    def truncate(self, length: int) -> int:
+        result = self._handle.truncate(length)
+        self._cache.invalidate(self._key, length)
+        return result
+
+    def __load(self, index: int) -> bytes:
+        block = bytearray(self._cache.block_size)
+        view = memoryview(block)
+        self._handle.seek(index * self._cache.block_size, VfsSeekPosition.START)
+        length = 0
+        while length < len(block):
+            count = self._handle.read(view[length:])
+            if count <= 0:
+                break
+
+            length += count
+
+        view.release()
+        del block[length:]
+        return bytes(block)
+
+
+class CachingFileSystemInterface(FileSystemInterface):
+    """
+    Wraps another :class:`FileSystemInterface`,
+    keeping recently-read parts of files in a least-recently-used cache of fixed-size blocks.
+    Useful for cores that reread the same data (e.g. a disc's file table) many times
+    from slow or remote storage.
+
+    Cached blocks are invalidated when their file is written, truncated, renamed, or removed
+    through this interface, but not when it's modified by anything else.
+    """
+
+    def __init__(
+        self,
+        interface: FileSystemInterface,
+        block_size: int = 64 * 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        :param interface: The interface to wrap.
+        :param block_size: The size of each cached block, in bytes.
+        :param max_bytes: The maximum number of bytes to keep cached across all files.
+
+        :raises TypeError: If ``interface`` is not a :class:`FileSystemInterface`.
+        :raises ValueError: If ``block_size`` or ``max_bytes`` is not positive.
+        """
+        super().__init__(None)
+        if not isinstance(interface, FileSystemInterface):
+            raise TypeError(f"Expected a FileSystemInterface, got {type(interface).__name__}")
+
+        if block_size <= 0:
+            raise ValueError(f"Expected a positive block_size, got {block_size}")
+
+        if max_bytes <= 0:
+            raise ValueError(f"Expected a positive max_bytes, got {max_bytes}")
+
+        self._interface = interface
+        self._stats = BlockCacheStats()
+        self._cache = _BlockCache(block_size, max_bytes, self._stats)
+
+    @property
+    def version(self) -> int:
+        return self._interface.version
+
+    def open(
+        self, path: bytes, mode: VfsFileAccess, hints: VfsFileAccessHint
+    ) -> FileHandle | None:
+        handle = self._interface.open(path, mode, hints)
+        if not handle:
+            return None
+
+        if mode & VfsFileAccess.WRITE and not mode & VfsFileAccess.UPDATE_EXISTING:
+            # The file was just truncated
+            self._cache.invalidate(_path_key(path))
+
+        return CachingFileHandle(handle, path, mode, hints, self._cache)
+
+    def remove(self, path: bytes) -> bool:
+        self._cache.invalidate(_path_key(path))
+        return self._interface.remove(path)
+
+    def rename(self, old_path: bytes, new_path: bytes) -> bool:
+        self._cache.invalidate(_path_key(old_path))
+        self._cache.invalidate(_path_key(new_path))
+        return self._interface.rename(old_path, new_path)
+
+    def stat(self, path: bytes) -> tuple[VfsStat, int] | None:
+        return self._interface.stat(path)
+
+    def mkdir(self, path: bytes) -> VfsMkdirResult:
+        return self._interface.mkdir(path)
+
+    def opendir(self, path: bytes, include_hidden: bool) -> DirectoryHandle | None:
+        return self._interface.opendir(path, include_hidden)
+
+    @property
+    def stats(self) -> BlockCacheStats:
+        """Counts of this cache's hits, misses, and evictions. Updated in place."""
+        return self._stats
+
+    @property
+    def cached_bytes(self) -> int:
+        """The number of bytes currently cached."""
+        return self._cache.size
+
+    @property
+    def block_size(self) -> int:
+        return self._cache.block_size
+
+    @property
+    def max_bytes(self) -> int:
+        return self._cache.max_bytes
+
+    def clear(self) -> None:
+        """Drops all cached blocks. Doesn't reset :attr:`stats`."""
+        self._cache.clear()
+
+
+__all__ = [
+    "BlockCacheStats",
+    "CachingFileHandle",
+    "CachingFileSystemInterface",
+]
@@ -1,5 +1,11 @@
+import errno
+import mmap
 import os
 import stat
+import threading
+import weakref
+from dataclasses import dataclass, field
+from enum import Enum
 from io import FileIO
 from logging import Logger
 from typing import Literal
@@ -17,26 +23,132 @@ from libretro.api.vfs import (
 from .interface import DirectoryHandle, DirEntry, FileHandle, FileSystemInterface
 
 
+class FsyncPolicy(Enum):
+    """When a :class:`StandardFileHandle` asks the OS to write flushed data to disk."""
+
+    ALWAYS = "always"
+    """Call :func:`os.fsync` on every flush. The safest and slowest policy."""
+
+    ON_CLOSE = "on_close"
+    """Call :func:`os.fsync` once when the file is closed, if it was flushed since the last sync."""
+
+    PERIODIC = "periodic"
+    """
+    Call :func:`os.fsync` on every flushed file from a background thread at a fixed interval,
+    and once more when the file is closed.
+    """
+
+    NEVER = "never"
+    """Never call :func:`os.fsync`; leave it to the OS to write data back."""
+
+
+@dataclass(slots=True)
+class FlushStats:
+    """
+    Counts how :class:`StandardFileHandle` flushes were handled.
+    Safe to share between handles that are used from different threads.
+    """
+
+    flushes: int = 0
+    """The number of times any file was flushed."""
+
+    fsyncs: int = 0
+    """The number of times :func:`os.fsync` was called."""
+
+    # Held while counting, since "+=" isn't atomic
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @property
+    def coalesced(self) -> int:
+        """
+        The number of flushes that didn't need their own :func:`os.fsync`,
+        either because they were merged into a later one or because syncing is disabled.
+        """
+        with self._lock:
+            return self.flushes - self.fsyncs
+
+    def _count(self, flushes: int = 0, fsyncs: int = 0):
+        with self._lock:
+            self.flushes += flushes
+            self.fsyncs += fsyncs
+
+
 class StandardFileHandle(FileHandle):
-    def __init__(self, path: VfsPath, mode: VfsFileAccess, hints: VfsFileAccessHint):
+    def __init__(
+        self,
+        path: VfsPath,
+        mode: VfsFileAccess,
+        hints: VfsFileAccessHint,
+        fsync: FsyncPolicy = FsyncPolicy.ALWAYS,
+        stats: FlushStats | None = None,
+    ):
         super().__init__(path, mode, hints)
         self._file: FileIO | None = None
+        self._dirty = False
+
+        # Held while syncing so that a background sync can't race with close()
+        self._lock = threading.Lock()
         if not path:
             raise ValueError("Expected a non-empty path")
 
+        if not isinstance(fsync, FsyncPolicy):
+            raise TypeError(f"Expected a FsyncPolicy, got {type(fsync).__name__}")
+
+        if not isinstance(stats, (FlushStats, type(None))):
+            raise TypeError(f"Expected a FlushStats or None, got {type(stats).__name__}")
+
+        self._fsync = fsync
+        self._stats = stats if stats is not None else FlushStats()
         self._file = FileIO(as_bytes(path), mode.open_flag)
 
     def __del__(self):
         self.close()
 
     def close(self) -> bool:
-        if self._file is not None:
-            self._file.close()
-            del self._file
-            self._file = None
+        with self._lock:
+            if self._file is not None:
+                if self._dirty and self._fsync != FsyncPolicy.NEVER:
+                    self.__fsync()
+
+                self._file.close()
+                del self._file
+                self._file = None
 
         return True
 
+    @property
+    def fsync(self) -> FsyncPolicy:
+        """This file's :class:`FsyncPolicy`."""
+        return self._fsync
+
+    @property
+    def needs_sync(self) -> bool:
+        """Whether this file has been flushed since it was last synced to disk."""
+        return self._dirty
+
+    def sync(self) -> bool:
+        """
+        Calls :func:`os.fsync` on this file if it was flushed since it was last synced,
+        regardless of its :class:`FsyncPolicy`.
+
+        :return: :obj:`True` if the file was synced,
+            :obj:`False` if it didn't need to be or was already closed.
+        """
+        with self._lock:
+            if self._file is None or not self._dirty:
+                return False
+
+            self.__fsync()
+            return True
+
+    def __fsync(self):
+        # Cleared first so that a concurrent flush() marks the file dirty again
+        self._dirty = False
+        os.fsync(self._file.fileno())
+        self._stats._count(fsyncs=1)
+
     @property
     def path(self) -> bytes:
         if not self._file:
@@ -84,7 +196,13 @@ class StandardFileHandle(FileHandle):
             raise IOError("File is closed")
 
         self._file.flush()
-        os.fsync(self._file.fileno())
+        self._stats._count(flushes=1)
+        if self._fsync == FsyncPolicy.ALWAYS:
+            with self._lock:
+                self.__fsync()
+        else:
+            self._dirty = True
+
         return True
 
     def truncate(self, length: int) -> int:
@@ -94,6 +212,165 @@ class StandardFileHandle(FileHandle):
         return self._file.truncate(length)
 
 
+class MappedFileHandle(FileHandle):
+    """
+    A read-only file handle that maps the entire file into memory once
+    and serves reads by copying from the mapping,
+    instead of reading each chunk into the core's buffer with a separate system call.
+
+    Empty files and special files (e.g. pipes) can't be mapped.
+
+    .. warning::
+        Accessing a mapped page that no longer exists because the file was truncated
+        raises ``SIGBUS``, which kills the interpreter.
+        The file's size is only checked again when a read reaches the end of the mapping;
+        if it has changed since the file was mapped,
+        that read and all later ones fall back to the file itself
+        (which also makes appended data visible).
+        Reads that end before the mapped end aren't checked,
+        so only use this handle for files that won't shrink while they're open,
+        such as game content.
+    """
+
+    def __init__(self, path: VfsPath, mode: VfsFileAccess, hints: VfsFileAccessHint):
+        """
+        :raises ValueError: If ``path`` is empty, if ``mode`` isn't :attr:`VfsFileAccess.READ`,
+            or if the file is empty.
+        :raises OSError: If the file couldn't be opened or mapped.
+        """
+        super().__init__(path, mode, hints)
+        self._file: FileIO | None = None
+        self._map: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        if not path:
+            raise ValueError("Expected a non-empty path")
+
+        if mode != VfsFileAccess.READ:
+            raise ValueError(f"Expected VfsFileAccess.READ, got {mode!r}")
+
+        self._path = as_bytes(path)
+        self._position = 0
+
+        # Set once the file's size no longer matches the mapping's
+        self._stale = False
+
+        # Kept open to check the file's size and to read it if that changes
+        self._file = FileIO(self._path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except:
+            self._file.close()
+            self._file = None
+            raise
+
+        # Frequently-accessed files are likely to be read out of order,
+        # so only tell the OS to expect sequential access if that isn't the case
+        if hints & VfsFileAccessHint.FREQUENT_ACCESS:
+            advice = getattr(mmap, "MADV_WILLNEED", None)
+        else:
+            advice = getattr(mmap, "MADV_SEQUENTIAL", None)
+
+        if advice is not None:
+            self._map.madvise(advice)
+
+        self._view = memoryview(self._map)
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> bool:
+        if self._view is not None:
+            # The map can't be closed while a view of it exists
+            self._view.release()
+            self._view = None
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        return True
+
+    @property
+    def path(self) -> bytes:
+        if self._view is None:
+            raise IOError("File is closed")
+
+        return self._path
+
+    @property
+    def size(self) -> int:
+        if self._view is None:
+            raise IOError("File is closed")
+
+        return os.fstat(self._file.fileno()).st_size
+
+    def tell(self) -> int:
+        if self._view is None:
+            raise IOError("File is closed")
+
+        return self._position
+
+    def seek(self, offset: int, whence: VfsSeekPosition) -> int:
+        if self._view is None:
+            raise IOError("File is closed")
+
+        match whence:
+            case VfsSeekPosition.START:
+                position = offset
+            case VfsSeekPosition.CURRENT:
+                position = self._position + offset
+            case VfsSeekPosition.END:
+                position = self.size + offset
+            case _:
+                raise ValueError(f"Invalid VfsSeekPosition: {whence}")
+
+        if position < 0:
+            raise OSError(errno.EINVAL, "Invalid seek position", self._path)
+
+        self._position = position
+        return position
+
+    def read(self, buffer: bytearray | memoryview) -> int:
+        if self._view is None:
+            raise IOError("File is closed")
+
+        view = self._view
+        position = self._position
+        end = position + len(buffer)
+        if end >= len(view) and (
+            self._stale or os.fstat(self._file.fileno()).st_size != len(view)
+        ):
+            # Pages past a truncated file's new end can't be touched safely
+            self._stale = True
+            self._file.seek(position, os.SEEK_SET)
+            length = self._file.readinto(buffer) or 0
+            self._position = position + length
+            return length
+
+        # Slices are clamped to the end of the file, so this is empty at (or past) EOF
+        chunk = view[position:end]
+        length = len(chunk)
+        buffer[:length] = chunk
+        self._position = position + length
+        return length
+
+    def write(self, buffer: bytes | bytearray | memoryview) -> int:
+        raise OSError(errno.EBADF, "File not open for writing", self._path)
+
+    def flush(self) -> bool:
+        if self._view is None:
+            raise IOError("File is closed")
+
+        return True
+
+    def truncate(self, length: int) -> int:
+        raise OSError(errno.EBADF, "File not open for writing", self._path)
+
+
 class StandardDirectoryHandle(DirectoryHandle):
     def __init__(self, path: VfsPath, include_hidden: bool):
         super().__init__(path, include_hidden)
@@ -118,20 +395,87 @@ class StandardDirectoryHandle(DirectoryHandle):
         return DirEntry(dirent.name, dirent.is_dir())
 
 
+def _sync_periodically(
+    handles: weakref.WeakSet[StandardFileHandle], interval: float, stopped: threading.Event
+):
+    # Only holds weak references, so it doesn't keep the interface or its files alive
+    while not stopped.wait(interval):
+        for handle in tuple(handles):
+            try:
+                handle.sync()
+            except OSError:
+                pass  # The handle will try again when it's closed
+
+
 class StandardFileSystemInterface(FileSystemInterface):
-    def __init__(self, version: Literal[1, 2, 3] = 3, logger: Logger | None = None):
+    def __init__(
+        self,
+        version: Literal[1, 2, 3] = 3,
+        logger: Logger | None = None,
+        fsync: FsyncPolicy = FsyncPolicy.ALWAYS,
+        fsync_interval: float = 1.0,
+        map_reads: bool = True,
+    ):
+        """
+        :param version: The version of the VFS interface to expose to the core.
+        :param logger: The logger to use for reporting errors.
+        :param fsync: When flushed files should be synced to disk.
+            Policies other than :attr:`FsyncPolicy.ALWAYS` trade crash durability for speed,
+            which is usually fine for throwaway test environments.
+        :param fsync_interval: The number of seconds between background syncs
+            if ``fsync`` is :attr:`FsyncPolicy.PERIODIC`.
+        :param map_reads: If :obj:`True`, files opened with :attr:`VfsFileAccess.READ`
+            are read through a :class:`MappedFileHandle` where possible.
+            Disable this if files might be truncated while the core is reading them
+            (see :class:`MappedFileHandle`).
+
+        :raises TypeError: If ``fsync`` is not a :class:`FsyncPolicy`.
+        :raises ValueError: If ``fsync_interval`` is not positive.
+        """
         super().__init__(logger)
+        if not isinstance(fsync, FsyncPolicy):
+            raise TypeError(f"Expected a FsyncPolicy, got {type(fsync).__name__}")
+
+        if fsync_interval <= 0:
+            raise ValueError(f"Expected a positive fsync_interval, got {fsync_interval}")
+
         self._version = version
+        self._fsync = fsync
+        self._fsync_interval = fsync_interval
+        self._map_reads = map_reads
+        self._flush_stats = FlushStats()
+        self._handles: weakref.WeakSet[StandardFileHandle] = weakref.WeakSet()
+        self._sync_thread: threading.Thread | None = None
 
     def open(
         self, path: bytes, mode: VfsFileAccess, hints: VfsFileAccessHint
     ) -> FileHandle | None:
+        if self._map_reads and mode == VfsFileAccess.READ:
+            try:
+                return MappedFileHandle(path, mode, hints)
+            except (OSError, ValueError):
+                pass  # Not everything can be mapped (e.g. empty files), so read it normally
+
         try:
-            handle = StandardFileHandle(path, mode, hints)
-            return handle
+            handle = StandardFileHandle(path, mode, hints, self._fsync, self._flush_stats)
         except OSError as e:
             return None
 
+        self._handles.add(handle)
+        if self._fsync == FsyncPolicy.PERIODIC and self._sync_thread is None:
+            # Started on the first open so that unused interfaces don't cost a thread
+            stopped = threading.Event()
+            self._sync_thread = threading.Thread(
+                target=_sync_periodically,
+                args=(self._handles, self._fsync_interval, stopped),
+                name="StandardFileSystemInterface fsync",
+                daemon=True,
+            )
+            weakref.finalize(self, stopped.set)
+            self._sync_thread.start()
+
+        return handle
+
     def remove(self, path: bytes) -> bool:
         os.remove(path)
         return True
@@ -174,9 +518,34 @@ class StandardFileSystemInterface(FileSystemInterface):
     def version(self) -> int:
         return self._version
 
+    @property
+    def fsync(self) -> FsyncPolicy:
+        """The :class:`FsyncPolicy` given to each opened file."""
+        return self._fsync
+
+    @property
+    def flush_stats(self) -> FlushStats:
+        """
+        Counts the flushes and syncs of all files opened through this interface.
+        Updated in place.
+        """
+        return self._flush_stats
+
+    def sync(self) -> int:
+        """
+        Immediately syncs every open file that was flushed since it was last synced,
+        regardless of :attr:`fsync`.
+
+        :return: The number of files that were synced.
+        """
+        return sum(handle.sync() for handle in tuple(self._handles))
+
 
 __all__ = [
+    "FsyncPolicy",
+    "FlushStats",
     "StandardFileHandle",
+    "MappedFileHandle",
     "StandardDirectoryHandle",
     "StandardFileSystemInterface",
 ]
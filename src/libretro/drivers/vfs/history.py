@@ -1,6 +1,10 @@
-from collections.abc import MutableSequence, Sequence
+import struct
+from collections.abc import Iterator, Mapping, MutableSequence, Sequence
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, NamedTuple
+from os import PathLike
+from time import perf_counter_ns, time_ns
+from typing import Any, BinaryIO, NamedTuple
 
 from libretro.api.vfs import (
     VfsFileAccess,
@@ -41,6 +45,417 @@ class VfsOperation(NamedTuple):
     result: Any
 
 
+# Operation codes are indexes into VfsOperationType, so new members must only be appended
+_OPERATIONS = tuple(VfsOperationType)
+_OPERATION_CODES = {op: code for code, op in enumerate(_OPERATIONS)}
+_READ = _OPERATION_CODES[VfsOperationType.READ]
+_WRITE = _OPERATION_CODES[VfsOperationType.WRITE]
+
+_LOG_MAGIC = b"LRPYVFS\0"
+_LOG_VERSION = 1
+_LOG_HEADER = struct.Struct("<8sHQ")  # magic, version, wall-clock start time (ns)
+
+# operation code, path ID, handle ID, offset, length, result, timestamp (ns), duration (ns)
+_RECORD = struct.Struct("<BIIqqqQQ")
+
+# Precedes each path's first use in a streamed log: tag, path ID, path length, then the path
+_PATH_TAG = 0xFF
+_PATH_RECORD = struct.Struct("<BII")
+
+
+class VfsOperationRecord(NamedTuple):
+    """
+    One operation in a :class:`VfsOperationLog`.
+    Fields that don't apply to an operation are ``-1``.
+    """
+
+    operation: VfsOperationType
+
+    path: bytes | None
+    """The path of the file or directory that was operated on, if known."""
+
+    handle: int
+    """
+    The ID of the file or directory handle that was operated on,
+    or ``0`` for operations that don't use one.
+    """
+
+    offset: int
+    """
+    The file position of a read or write, the offset of a seek,
+    the hints of an open, or the ID of a rename's new path.
+    """
+
+    length: int
+    """
+    The requested length of a read or write, the whence of a seek,
+    the length of a truncation, the mode of an open, the size reported by a stat,
+    or whether an opendir included hidden files.
+    """
+
+    result: int
+    """
+    The operation's return value, converted to an integer
+    (``1`` or ``0`` for booleans, or the new handle's ID for opens).
+    ``-1`` if the operation raised an exception.
+    """
+
+    timestamp: int
+    """When the operation started, in nanoseconds since the log was created."""
+
+    duration: int
+    """How long the operation took, in nanoseconds."""
+
+
+@dataclass(slots=True)
+class VfsOperationSummary:
+    """Aggregate statistics about the operations in a :class:`VfsOperationLog`."""
+
+    operations: dict[VfsOperationType, int] = field(default_factory=dict)
+    """The number of times each type of operation was performed."""
+
+    errors: dict[VfsOperationType, int] = field(default_factory=dict)
+    """The number of times each type of operation failed."""
+
+    bytes_read: dict[bytes | None, int] = field(default_factory=dict)
+    """The number of bytes read from each path."""
+
+    bytes_written: dict[bytes | None, int] = field(default_factory=dict)
+    """The number of bytes written to each path."""
+
+    latency: dict[VfsOperationType, dict[int, int]] = field(default_factory=dict)
+    """
+    A histogram of each type of operation's duration.
+    Each key ``k`` counts the operations that took at least ``2 ** (k - 1)``
+    but less than ``2 ** k`` nanoseconds.
+    """
+
+    def add(self, record: VfsOperationRecord) -> None:
+        """Adds a record to this summary."""
+        operation = record.operation
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+        if record.result < 0:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+        elif operation == VfsOperationType.READ:
+            self.bytes_read[record.path] = self.bytes_read.get(record.path, 0) + record.result
+        elif operation == VfsOperationType.WRITE:
+            self.bytes_written[record.path] = (
+                self.bytes_written.get(record.path, 0) + record.result
+            )
+
+        histogram = self.latency.setdefault(operation, {})
+        bucket = record.duration.bit_length()
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+
+class VfsOperationLog:
+    """
+    A compact, bounded record of VFS operations,
+    for tracing I/O over long sessions without unbounded memory growth.
+
+    Each operation is packed into a fixed-size binary record (49 bytes)
+    that describes the call instead of storing its arguments.
+    The most recent records are kept in a ring buffer,
+    and all records can also be streamed to a file
+    to be read later with :class:`VfsOperationLogReader`.
+    Running totals for :meth:`summary` cover every operation,
+    including those that have been overwritten in the ring buffer.
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = 65536,
+        stream: str | bytes | PathLike | BinaryIO | None = None,
+    ):
+        """
+        :param capacity: The number of records to keep in memory,
+            or :obj:`None` to only stream them.
+        :param stream: A path or binary file to append every record to,
+            or :obj:`None` to only keep them in memory.
+            Files opened from a path are closed by :meth:`close`.
+
+        :raises ValueError: If ``capacity`` isn't positive,
+            or if both ``capacity`` and ``stream`` are :obj:`None`.
+        :raises OSError: If ``stream`` is a path that couldn't be opened.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"Expected a positive capacity, got {capacity}")
+
+        if capacity is None and stream is None:
+            raise ValueError("Expected a capacity, a stream, or both")
+
+        self._capacity = capacity
+        self._ring = bytearray(capacity * _RECORD.size) if capacity is not None else None
+        self._total = 0
+        self._origin = perf_counter_ns()
+        self._start_time = time_ns()
+
+        # Path IDs start at 1, since 0 means "no path"
+        self._path_ids: dict[bytes, int] = {}
+        self._paths: list[bytes | None] = [None]
+        self._next_handle = 1
+
+        self._operations = [0] * len(_OPERATIONS)
+        self._errors = [0] * len(_OPERATIONS)
+        self._latency = [[0] * 65 for _ in _OPERATIONS]
+        self._bytes_read: dict[int, int] = {}
+        self._bytes_written: dict[int, int] = {}
+
+        match stream:
+            case None:
+                self._stream = None
+                self._owns_stream = False
+            case str() | bytes() | PathLike():
+                self._stream = open(stream, "wb")
+                self._owns_stream = True
+            case _:
+                self._stream = stream
+                self._owns_stream = False
+
+        if self._stream is not None:
+            self._stream.write(_LOG_HEADER.pack(_LOG_MAGIC, _LOG_VERSION, self._start_time))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def capacity(self) -> int | None:
+        """The number of records kept in memory."""
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """The number of operations that have been logged."""
+        return self._total
+
+    @property
+    def dropped(self) -> int:
+        """The number of records that have been overwritten in the ring buffer."""
+        if self._capacity is None:
+            return self._total
+
+        return max(0, self._total - self._capacity)
+
+    @property
+    def start_time(self) -> int:
+        """When this log was created, in nanoseconds since the epoch."""
+        return self._start_time
+
+    @property
+    def paths(self) -> Mapping[int, bytes]:
+        """Maps each path ID in this log to its path."""
+        return {i: path for i, path in enumerate(self._paths) if path is not None}
+
+    def path_id(self, path: bytes | None) -> int:
+        """
+        Returns the ID used for ``path`` in this log's records,
+        assigning a new one if necessary.
+        :obj:`None` always has the ID ``0``.
+        """
+        if path is None:
+            return 0
+
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            path_id = len(self._paths)
+            self._path_ids[path] = path_id
+            self._paths.append(path)
+            if self._stream is not None:
+                self._stream.write(_PATH_RECORD.pack(_PATH_TAG, path_id, len(path)) + path)
+
+        return path_id
+
+    def handle_id(self) -> int:
+        """Returns a new ID for a file or directory handle."""
+        handle_id = self._next_handle
+        self._next_handle += 1
+        return handle_id
+
+    def record(
+        self,
+        operation: VfsOperationType,
+        path_id: int,
+        handle_id: int,
+        offset: int,
+        length: int,
+        result: int,
+        start: int,
+    ) -> None:
+        """
+        Adds an operation to the log.
+
+        :param start: When the operation started, as returned by :func:`time.perf_counter_ns`.
+            Its duration is measured from this until now.
+        """
+        duration = perf_counter_ns() - start
+        code = _OPERATION_CODES[operation]
+        packed = (
+            code,
+            path_id,
+            handle_id,
+            offset,
+            length,
+            result,
+            start - self._origin,
+            duration,
+        )
+        if self._ring is not None:
+            _RECORD.pack_into(self._ring, (self._total % self._capacity) * _RECORD.size, *packed)
+
+        if self._stream is not None:
+            self._stream.write(_RECORD.pack(*packed))
+
+        self._total += 1
+        self._operations[code] += 1
+        self._latency[code][duration.bit_length()] += 1
+        if result < 0:
+            self._errors[code] += 1
+        elif code == _READ:
+            self._bytes_read[path_id] = self._bytes_read.get(path_id, 0) + result
+        elif code == _WRITE:
+            self._bytes_written[path_id] = self._bytes_written.get(path_id, 0) + result
+
+    def records(self) -> Iterator[VfsOperationRecord]:
+        """Yields the records in the ring buffer, from oldest to newest."""
+        if self._ring is None:
+            return
+
+        first = self.dropped
+        for i in range(first, self._total):
+            yield self.__decode(
+                _RECORD.unpack_from(self._ring, (i % self._capacity) * _RECORD.size)
+            )
+
+    def summary(self) -> VfsOperationSummary:
+        """Returns statistics about every operation logged so far."""
+        paths = self._paths
+        return VfsOperationSummary(
+            operations={_OPERATIONS[c]: n for c, n in enumerate(self._operations) if n},
+            errors={_OPERATIONS[c]: n for c, n in enumerate(self._errors) if n},
+            bytes_read={paths[p]: n for p, n in self._bytes_read.items()},
+            bytes_written={paths[p]: n for p, n in self._bytes_written.items()},
+            latency={
+                _OPERATIONS[c]: {k: n for k, n in enumerate(histogram) if n}
+                for c, histogram in enumerate(self._latency)
+                if self._operations[c]
+            },
+        )
+
+    def flush(self) -> None:
+        """Flushes the stream, if there is one."""
+        if self._stream is not None:
+            self._stream.flush()
+
+    def close(self) -> None:
+        """Flushes the stream, and closes it if this log opened it."""
+        if self._stream is not None:
+            self._stream.flush()
+            if self._owns_stream:
+                self._stream.close()
+
+            self._stream = None
+
+    def __decode(self, fields: tuple) -> VfsOperationRecord:
+        code, path_id, *rest = fields
+        return VfsOperationRecord(_OPERATIONS[code], self._paths[path_id], *rest)
+
+
+class VfsOperationLogReader:
+    """
+    Reads back the records that a :class:`VfsOperationLog` streamed to a file, in order.
+    A file that ends partway through a record (e.g. after a crash) is read up to that record;
+    iterating over one with an unknown operation raises :exc:`ValueError`.
+    """
+
+    def __init__(self, stream: str | bytes | PathLike | BinaryIO):
+        """
+        :param stream: A path to the log, or a binary file positioned at its start.
+            Files opened from a path are closed by :meth:`close`.
+
+        :raises ValueError: If the stream isn't a log, or is from an unsupported version.
+        :raises OSError: If ``stream`` is a path that couldn't be opened.
+        """
+        match stream:
+            case str() | bytes() | PathLike():
+                self._stream = open(stream, "rb")
+                self._owns_stream = True
+            case _:
+                self._stream = stream
+                self._owns_stream = False
+
+        header = self._stream.read(_LOG_HEADER.size)
+        if len(header) < _LOG_HEADER.size:
+            raise ValueError("Expected a VFS operation log, got a truncated header")
+
+        magic, version, start_time = _LOG_HEADER.unpack(header)
+        if magic != _LOG_MAGIC:
+            raise ValueError("Expected a VFS operation log")
+
+        if version != _LOG_VERSION:
+            raise ValueError(f"Unsupported VFS operation log version {version}")
+
+        self._start_time: int = start_time
+        self._paths: dict[int, bytes | None] = {0: None}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def start_time(self) -> int:
+        """When the log was created, in nanoseconds since the epoch."""
+        return self._start_time
+
+    @property
+    def paths(self) -> Mapping[int, bytes]:
+        """Maps each path ID read so far to its path."""
+        return {i: path for i, path in self._paths.items() if path is not None}
+
+    def __iter__(self) -> Iterator[VfsOperationRecord]:
+        read = self._stream.read
+        while tag := read(1):
+            if tag[0] == _PATH_TAG:
+                fields = read(_PATH_RECORD.size - 1)
+                if len(fields) < _PATH_RECORD.size - 1:
+                    return
+
+                _, path_id, length = _PATH_RECORD.unpack(tag + fields)
+                path = read(length)
+                if len(path) < length:
+                    return
+
+                self._paths[path_id] = path
+                continue
+
+            fields = read(_RECORD.size - 1)
+            if len(fields) < _RECORD.size - 1:
+                return
+
+            code, path_id, *rest = _RECORD.unpack(tag + fields)
+            if code >= len(_OPERATIONS):
+                raise ValueError("Corrupt VFS operation log")
+
+            yield VfsOperationRecord(_OPERATIONS[code], self._paths.get(path_id), *rest)
+
+    def summary(self) -> VfsOperationSummary:
+        """Reads the rest of the log and returns statistics about its records."""
+        summary = VfsOperationSummary()
+        for record in self:
+            summary.add(record)
+
+        return summary
+
+    def close(self) -> None:
+        """Closes the stream if this reader opened it."""
+        if self._owns_stream:
+            self._stream.close()
+
+
 class HistoryFileHandle(FileHandle):
     def __init__(self, handle: FileHandle, history: MutableSequence[VfsOperation]):
         if not isinstance(handle, FileHandle):
@@ -166,14 +581,239 @@ class HistoryDirectoryHandle(DirectoryHandle):
             raise
 
 
+class LoggedFileHandle(FileHandle):
+    """
+    Wraps another :class:`FileHandle`, recording each call in a :class:`VfsOperationLog`.
+    Unlike :class:`HistoryFileHandle`, the data that was read or written isn't kept.
+    """
+
+    def __init__(
+        self,
+        handle: FileHandle,
+        log: VfsOperationLog,
+        path: bytes | None,
+        mode: VfsFileAccess,
+        hints: VfsFileAccessHint,
+    ):
+        super().__init__(path, mode, hints)
+        if not isinstance(handle, FileHandle):
+            raise TypeError(f"Expected a FileHandle, got {type(handle).__name__}")
+
+        if not isinstance(log, VfsOperationLog):
+            raise TypeError(f"Expected a VfsOperationLog, got {type(log).__name__}")
+
+        self._handle = handle
+        self._log = log
+        self._path_id = log.path_id(path)
+        self._id = log.handle_id()
+
+        # Tracked here so that reads and writes can be logged with their offsets;
+        # the wrapped handle might not start at 0 (e.g. if it was opened for appending)
+        self._position = handle.tell()
+
+    @property
+    def handle_id(self) -> int:
+        """This handle's ID in the log."""
+        return self._id
+
+    def close(self) -> bool:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            ok = self._handle.close()
+            result = int(ok)
+            return ok
+        finally:
+            self._log.record(
+                VfsOperationType.CLOSE, self._path_id, self._id, -1, -1, result, start
+            )
+
+    @property
+    def path(self) -> bytes:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            path = self._handle.path
+            result = 0
+            return path
+        finally:
+            self._log.record(
+                VfsOperationType.GET_PATH, self._path_id, self._id, -1, -1, result, start
+            )
+
+    @property
+    def size(self) -> int:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            result = self._handle.size
+            return result
+        finally:
+            self._log.record(VfsOperationType.SIZE, self._path_id, self._id, -1, -1, result, start)
+
+    def tell(self) -> int:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            result = self._handle.tell()
+            return result
+        finally:
+            self._log.record(VfsOperationType.TELL, self._path_id, self._id, -1, -1, result, start)
+
+    def seek(self, offset: int, whence: VfsSeekPosition) -> int:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            result = self._handle.seek(offset, whence)
+            if result >= 0:
+                self._position = result
+
+            return result
+        finally:
+            self._log.record(
+                VfsOperationType.SEEK, self._path_id, self._id, offset, whence, result, start
+            )
+
+    def read(self, buffer: bytearray | memoryview) -> int:
+        start = perf_counter_ns()
+        position = self._position
+        result = -1
+        try:
+            result = self._handle.read(buffer)
+            if result >= 0:
+                self._position += result
+
+            return result
+        finally:
+            self._log.record(
+                VfsOperationType.READ,
+                self._path_id,
+                self._id,
+                position,
+                len(buffer),
+                result,
+                start,
+            )
+
+    def write(self, buffer: bytes | bytearray | memoryview) -> int:
+        start = perf_counter_ns()
+        position = self._position
+        result = -1
+        try:
+            result = self._handle.write(buffer)
+            if result >= 0:
+                self._position += result
+
+            return result
+        finally:
+            self._log.record(
+                VfsOperationType.WRITE,
+                self._path_id,
+                self._id,
+                position,
+                len(buffer),
+                result,
+                start,
+            )
+
+    def flush(self) -> bool:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            ok = self._handle.flush()
+            result = int(ok)
+            return ok
+        finally:
+            self._log.record(
+                VfsOperationType.FLUSH, self._path_id, self._id, -1, -1, result, start
+            )
+
+    def truncate(self, length: int) -> int:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            result = self._handle.truncate(length)
+            return result
+        finally:
+            self._log.record(
+                VfsOperationType.TRUNCATE, self._path_id, self._id, -1, length, result, start
+            )
+
+
+class LoggedDirectoryHandle(DirectoryHandle):
+    """
+    Wraps another :class:`DirectoryHandle`, recording each call in a :class:`VfsOperationLog`.
+    """
+
+    def __init__(
+        self,
+        handle: DirectoryHandle,
+        log: VfsOperationLog,
+        path: bytes | None,
+        include_hidden: bool,
+    ):
+        super().__init__(path, include_hidden)
+        if not isinstance(handle, DirectoryHandle):
+            raise TypeError(f"Expected a DirectoryHandle, got {type(handle).__name__}")
+
+        if not isinstance(log, VfsOperationLog):
+            raise TypeError(f"Expected a VfsOperationLog, got {type(log).__name__}")
+
+        self._handle = handle
+        self._log = log
+        self._path_id = log.path_id(path)
+        self._id = log.handle_id()
+
+    @property
+    def handle_id(self) -> int:
+        """This handle's ID in the log."""
+        return self._id
+
+    def close(self) -> bool:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            ok = self._handle.close()
+            result = int(ok)
+            return ok
+        finally:
+            self._log.record(
+                VfsOperationType.CLOSEDIR, self._path_id, self._id, -1, -1, result, start
+            )
+
+    def readdir(self) -> DirEntry | None:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            entry = self._handle.readdir()
+            result = int(entry is not None)
+            return entry
+        finally:
+            self._log.record(
+                VfsOperationType.READDIR, self._path_id, self._id, -1, -1, result, start
+            )
+
+
 class HistoryFileSystemInterface(FileSystemInterface):
-    def __init__(self, interface: FileSystemInterface):
+    def __init__(self, interface: FileSystemInterface, log: VfsOperationLog | None = None):
+        """
+        :param interface: The interface to wrap.
+        :param log: If given, operations are recorded compactly in this log
+            instead of being appended to :attr:`history`.
+
+        :raises TypeError: If ``interface`` is not a :class:`FileSystemInterface`
+            or ``log`` is not a :class:`VfsOperationLog` or :obj:`None`.
+        """
         super().__init__(None)
         if not isinstance(interface, FileSystemInterface):
             raise TypeError(f"Expected a FileSystemInterface, got {type(interface).__name__}")
 
+        if not isinstance(log, (VfsOperationLog, type(None))):
+            raise TypeError(f"Expected a VfsOperationLog or None, got {type(log).__name__}")
+
         self._interface = interface
         self._history: list[VfsOperation] = []
+        self._log = log
 
     @property
     def version(self) -> int:
@@ -182,6 +822,9 @@ class HistoryFileSystemInterface(FileSystemInterface):
     def open(
         self, path: bytes, mode: VfsFileAccess, hints: VfsFileAccessHint
     ) -> FileHandle | None:
+        if self._log is not None:
+            return self.__logged_open(path, mode, hints)
+
         try:
             wrapped_handle = self._interface.open(path, mode, hints)
             if not wrapped_handle:
@@ -200,6 +843,18 @@ class HistoryFileSystemInterface(FileSystemInterface):
             raise
 
     def remove(self, path: bytes) -> bool:
+        if self._log is not None:
+            start = perf_counter_ns()
+            result = -1
+            try:
+                ok = self._interface.remove(path)
+                result = int(ok)
+                return ok
+            finally:
+                self._log.record(
+                    VfsOperationType.REMOVE, self._log.path_id(path), 0, -1, -1, result, start
+                )
+
         try:
             result = self._interface.remove(path)
             self._history.append(VfsOperation(VfsOperationType.REMOVE, (path,), result))
@@ -209,6 +864,18 @@ class HistoryFileSystemInterface(FileSystemInterface):
             raise
 
     def rename(self, old_path: bytes, new_path: bytes) -> bool:
+        if self._log is not None:
+            start = perf_counter_ns()
+            result = -1
+            try:
+                ok = self._interface.rename(old_path, new_path)
+                result = int(ok)
+                return ok
+            finally:
+                old_id = self._log.path_id(old_path)
+                new_id = self._log.path_id(new_path)
+                self._log.record(VfsOperationType.RENAME, old_id, 0, new_id, -1, result, start)
+
         try:
             result = self._interface.rename(old_path, new_path)
             self._history.append(
@@ -222,6 +889,18 @@ class HistoryFileSystemInterface(FileSystemInterface):
             raise
 
     def stat(self, path: bytes) -> tuple[VfsStat, int] | None:
+        if self._log is not None:
+            start = perf_counter_ns()
+            flags, size = -1, -1
+            try:
+                result = self._interface.stat(path)
+                flags, size = result if result is not None else (0, -1)
+                return result
+            finally:
+                self._log.record(
+                    VfsOperationType.STAT, self._log.path_id(path), 0, -1, size, flags, start
+                )
+
         try:
             result = self._interface.stat(path)
             self._history.append(VfsOperation(VfsOperationType.STAT, (path,), result))
@@ -231,6 +910,17 @@ class HistoryFileSystemInterface(FileSystemInterface):
             raise
 
     def mkdir(self, path: bytes) -> VfsMkdirResult:
+        if self._log is not None:
+            start = perf_counter_ns()
+            result = VfsMkdirResult.ERROR
+            try:
+                result = self._interface.mkdir(path)
+                return result
+            finally:
+                self._log.record(
+                    VfsOperationType.MKDIR, self._log.path_id(path), 0, -1, -1, result, start
+                )
+
         try:
             result = self._interface.mkdir(path)
             self._history.append(VfsOperation(VfsOperationType.MKDIR, (path,), result))
@@ -242,6 +932,28 @@ class HistoryFileSystemInterface(FileSystemInterface):
             raise
 
     def opendir(self, path: bytes, include_hidden: bool) -> DirectoryHandle | None:
+        if self._log is not None:
+            start = perf_counter_ns()
+            result = -1
+            try:
+                wrapped_handle = self._interface.opendir(path, include_hidden)
+                if not wrapped_handle:
+                    return None
+
+                handle = LoggedDirectoryHandle(wrapped_handle, self._log, path, include_hidden)
+                result = handle.handle_id
+                return handle
+            finally:
+                self._log.record(
+                    VfsOperationType.OPENDIR,
+                    self._log.path_id(path),
+                    0,
+                    -1,
+                    include_hidden,
+                    result,
+                    start,
+                )
+
         try:
             handle = self._interface.opendir(path, include_hidden)
             self._history.append(
@@ -258,11 +970,40 @@ class HistoryFileSystemInterface(FileSystemInterface):
     def history(self) -> Sequence[VfsOperation]:
         return tuple(self._history)
 
+    @property
+    def log(self) -> VfsOperationLog | None:
+        """The compact log that operations are recorded in, if one was given."""
+        return self._log
+
+    def __logged_open(
+        self, path: bytes, mode: VfsFileAccess, hints: VfsFileAccessHint
+    ) -> FileHandle | None:
+        start = perf_counter_ns()
+        result = -1
+        try:
+            wrapped_handle = self._interface.open(path, mode, hints)
+            if not wrapped_handle:
+                return None
+
+            handle = LoggedFileHandle(wrapped_handle, self._log, path, mode, hints)
+            result = handle.handle_id
+            return handle
+        finally:
+            self._log.record(
+                VfsOperationType.OPEN, self._log.path_id(path), 0, hints, mode, result, start
+            )
+
 
 __all__ = [
     "HistoryFileHandle",
     "HistoryDirectoryHandle",
     "HistoryFileSystemInterface",
+    "LoggedFileHandle",
+    "LoggedDirectoryHandle",
     "VfsOperationType",
     "VfsOperation",
+    "VfsOperationRecord",
+    "VfsOperationSummary",
+    "VfsOperationLog",
+    "VfsOperationLogReader",
 ]
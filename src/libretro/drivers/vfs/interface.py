@@ -335,10 +335,8 @@ class FileSystemInterface(Protocol):
             if not handle:
                 return -1
 
-            assert isinstance(
-                handle, FileHandle
-            ), f"Expected a FileHandle, got: {type(handle).__name__}"
-
+            # Not checked against FileHandle here like in the other callbacks;
+            # __open already did, and checking a Protocol costs far more than the read itself
             memview = memoryview_at(buffer, length)
             bytes_read = handle.read(memview)
             if not isinstance(bytes_read, int):
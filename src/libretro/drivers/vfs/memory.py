@@ -0,0 +1,464 @@
+import errno
+import os
+from logging import Logger
+from os import PathLike
+from typing import Literal, TypeAlias
+
+from libretro.api._utils import as_bytes
+from libretro.api.vfs import (
+    VfsFileAccess,
+    VfsFileAccessHint,
+    VfsMkdirResult,
+    VfsPath,
+    VfsSeekPosition,
+    VfsStat,
+)
+
+from .interface import DirectoryHandle, DirEntry, FileHandle, FileSystemInterface
+
+_Directory: TypeAlias = dict[bytes, "bytearray | _Directory"]
+
+
+def _split_path(path: VfsPath) -> tuple[bytes, ...]:
+    # Relative paths are resolved against the real working directory
+    # so that they refer to the same files as they would on disk
+    path = os.path.abspath(os.fsencode(path))
+    if os.name == "nt":
+        path = path.replace(b"\\", b"/")
+
+    return tuple(p for p in path.split(b"/") if p)
+
+
+class MemoryFileHandle(FileHandle):
+    """
+    A handle to a file in a :class:`MemoryFileSystemInterface`.
+
+    Reads and writes operate directly on the file's :class:`bytearray`,
+    so changes are visible to other handles to the same file immediately.
+    """
+
+    def __init__(
+        self, path: VfsPath, mode: VfsFileAccess, hints: VfsFileAccessHint, data: bytearray
+    ):
+        super().__init__(path, mode, hints)
+        if not path:
+            raise ValueError("Expected a non-empty path")
+
+        if not isinstance(data, bytearray):
+            raise TypeError(f"Expected a bytearray, got {type(data).__name__}")
+
+        self._path = os.fsencode(as_bytes(path))
+        self._data: bytearray | None = data
+        self._position = 0
+        self._readable = bool(mode & VfsFileAccess.READ)
+        self._writable = bool(mode & VfsFileAccess.WRITE)
+
+    def close(self) -> bool:
+        self._data = None
+        return True
+
+    @property
+    def path(self) -> bytes:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        return self._path
+
+    @property
+    def size(self) -> int:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        return len(self._data)
+
+    def tell(self) -> int:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        return self._position
+
+    def seek(self, offset: int, whence: VfsSeekPosition) -> int:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        match whence:
+            case VfsSeekPosition.START:
+                position = offset
+            case VfsSeekPosition.CURRENT:
+                position = self._position + offset
+            case VfsSeekPosition.END:
+                position = len(self._data) + offset
+            case _:
+                raise ValueError(f"Invalid VfsSeekPosition: {whence}")
+
+        if position < 0:
+            raise OSError(errno.EINVAL, "Invalid seek position", self._path)
+
+        self._position = position
+        return position
+
+    def read(self, buffer: bytearray | memoryview) -> int:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        if not self._readable:
+            raise OSError(errno.EBADF, "File not open for reading", self._path)
+
+        start = min(self._position, len(self._data))
+        length = min(len(buffer), len(self._data) - start)
+        buffer[:length] = self._data[start : start + length]
+        self._position = start + length
+        return length
+
+    def write(self, buffer: bytes | bytearray | memoryview) -> int:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        if not self._writable:
+            raise OSError(errno.EBADF, "File not open for writing", self._path)
+
+        length = len(buffer)
+        if self._position > len(self._data):
+            # Writing past the end leaves a zero-filled gap, as with a real file
+            self._data.extend(bytes(self._position - len(self._data)))
+
+        self._data[self._position : self._position + length] = buffer
+        self._position += length
+        return length
+
+    def flush(self) -> bool:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        return True
+
+    def truncate(self, length: int) -> int:
+        if self._data is None:
+            raise IOError("File is closed")
+
+        if not self._writable:
+            raise OSError(errno.EBADF, "File not open for writing", self._path)
+
+        if length < 0:
+            raise OSError(errno.EINVAL, "Invalid length", self._path)
+
+        if length < len(self._data):
+            del self._data[length:]
+        else:
+            self._data.extend(bytes(length - len(self._data)))
+
+        return length
+
+
+class MemoryDirectoryHandle(DirectoryHandle):
+    """
+    A handle to a directory in a :class:`MemoryFileSystemInterface`.
+
+    The directory's entries are listed when the handle is opened,
+    so later changes to the directory aren't reflected.
+    """
+
+    def __init__(self, path: VfsPath, include_hidden: bool, entries: _Directory):
+        super().__init__(path, include_hidden)
+        if not isinstance(entries, dict):
+            raise TypeError(f"Expected a dict, got {type(entries).__name__}")
+
+        self._entries = iter(
+            tuple(
+                DirEntry(name, isinstance(node, dict))
+                for name, node in entries.items()
+                if include_hidden or not name.startswith(b".")
+            )
+        )
+
+    def close(self) -> bool:
+        self._entries = iter(())
+        return True
+
+    def readdir(self) -> DirEntry | None:
+        return next(self._entries, None)
+
+
+class MemoryFileSystemInterface(FileSystemInterface):
+    """
+    A file system that exists entirely in memory,
+    so that cores can save and load files without any disk I/O.
+
+    Files are stored as :class:`bytearray`\\s in a tree of directories
+    that starts out empty (apart from the root).
+    Paths are resolved as they would be on disk,
+    so the tree can be seeded from a real directory with :meth:`load_directory`
+    and written back out with :meth:`save_directory`.
+    """
+
+    def __init__(
+        self,
+        version: Literal[1, 2, 3] = 3,
+        logger: Logger | None = None,
+        seed: str | bytes | PathLike | None = None,
+    ):
+        """
+        :param version: The version of the VFS interface to expose to the core.
+        :param logger: The logger to use for reporting errors.
+        :param seed: A real directory to copy into memory at its own absolute path,
+            or :obj:`None` to start with an empty tree.
+            Equivalent to calling :meth:`load_directory` afterwards.
+
+        :raises OSError: If ``seed`` couldn't be read.
+        """
+        super().__init__(logger)
+        self._version = version
+        self._root: _Directory = {}
+        if seed is not None:
+            self.load_directory(seed)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def open(
+        self, path: bytes, mode: VfsFileAccess, hints: VfsFileAccessHint
+    ) -> FileHandle | None:
+        parts = _split_path(path)
+        parent = self.__directory(parts[:-1])
+        if parent is None or not parts:
+            return None
+
+        node = parent.get(parts[-1])
+        if isinstance(node, dict):
+            return None
+
+        # Use the same semantics as StandardFileSystemInterface
+        match mode.open_flag:
+            case "rb" | "r+b" if node is None:
+                return None
+            case "wb" | "w+b" if node is None:
+                node = parent[parts[-1]] = bytearray()
+            case "wb" | "w+b":
+                node.clear()
+
+        return MemoryFileHandle(path, mode, hints, node)
+
+    def remove(self, path: bytes) -> bool:
+        parts = _split_path(path)
+        parent = self.__directory(parts[:-1])
+        if parent is None or not parts or parts[-1] not in parent:
+            raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+
+        if isinstance(parent[parts[-1]], dict):
+            # Like os.remove(), which StandardFileSystemInterface uses
+            raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+
+        del parent[parts[-1]]
+        return True
+
+    def rename(self, old_path: bytes, new_path: bytes) -> bool:
+        old_parts = _split_path(old_path)
+        new_parts = _split_path(new_path)
+        old_parent = self.__directory(old_parts[:-1])
+        new_parent = self.__directory(new_parts[:-1])
+        if old_parent is None or not old_parts or old_parts[-1] not in old_parent:
+            raise FileNotFoundError(errno.ENOENT, "No such file or directory", old_path)
+
+        if new_parent is None or not new_parts:
+            raise FileNotFoundError(errno.ENOENT, "No such file or directory", new_path)
+
+        node = old_parent[old_parts[-1]]
+        existing = new_parent.get(new_parts[-1])
+        match node, existing:
+            case _ if old_parts == new_parts:
+                return True
+            case dict(), _ if new_parts[: len(old_parts)] == old_parts:
+                raise OSError(errno.EINVAL, "Can't move a directory into itself", new_path)
+            case dict(), bytearray():
+                raise NotADirectoryError(errno.ENOTDIR, "Not a directory", new_path)
+            case bytearray(), dict():
+                raise IsADirectoryError(errno.EISDIR, "Is a directory", new_path)
+            case dict(), dict() if existing:
+                raise OSError(errno.ENOTEMPTY, "Directory not empty", new_path)
+
+        del old_parent[old_parts[-1]]
+        new_parent[new_parts[-1]] = node
+        return True
+
+    def stat(self, path: bytes) -> tuple[VfsStat, int] | None:
+        match self.__node(_split_path(path)):
+            case dict():
+                return VfsStat.IS_VALID | VfsStat.IS_DIRECTORY, 0
+            case bytearray() as data:
+                return VfsStat.IS_VALID, len(data)
+            case _:
+                return VfsStat(0), 0
+
+    def mkdir(self, path: bytes) -> VfsMkdirResult:
+        parts = _split_path(path)
+        parent = self.__directory(parts[:-1])
+        if parent is None:
+            return VfsMkdirResult.ERROR
+
+        if not parts or parts[-1] in parent:
+            return VfsMkdirResult.ALREADY_EXISTS
+
+        parent[parts[-1]] = {}
+        return VfsMkdirResult.SUCCESS
+
+    def opendir(self, path: bytes, include_hidden: bool) -> DirectoryHandle | None:
+        directory = self.__directory(_split_path(path))
+        if directory is None:
+            return None
+
+        return MemoryDirectoryHandle(path, include_hidden, directory)
+
+    def makedirs(self, path: str | bytes | PathLike) -> None:
+        """
+        Creates a directory in memory, along with any missing parent directories.
+
+        :param path: The directory to create.
+        :raises FileExistsError: If ``path`` or one of its parents is a file.
+        """
+        self.__makedirs(_split_path(path), path)
+
+    def read_file(self, path: str | bytes | PathLike) -> bytes:
+        """
+        Returns a copy of a file's contents.
+
+        :param path: The file to read.
+        :raises FileNotFoundError: If ``path`` doesn't exist.
+        :raises IsADirectoryError: If ``path`` is a directory.
+        """
+        match self.__node(_split_path(path)):
+            case bytearray() as data:
+                return bytes(data)
+            case dict():
+                raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+            case _:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+
+    def write_file(self, path: str | bytes | PathLike, data: bytes | bytearray | memoryview):
+        """
+        Creates or replaces a file, along with any missing parent directories.
+
+        :param path: The file to write.
+        :param data: The file's new contents, which will be copied.
+        :raises FileExistsError: If one of the parent directories is a file.
+        :raises IsADirectoryError: If ``path`` is a directory.
+        """
+        parts = _split_path(path)
+        if not parts:
+            raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+
+        parent = self.__makedirs(parts[:-1], path)
+        match parent.get(parts[-1]):
+            case dict():
+                raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+            case bytearray() as existing:
+                # Replace the contents in place so that open handles see the new data
+                existing[:] = data
+            case None:
+                parent[parts[-1]] = bytearray(data)
+
+    def load_directory(
+        self,
+        source: str | bytes | PathLike,
+        path: str | bytes | PathLike | None = None,
+    ) -> None:
+        """
+        Copies a real directory and everything in it into memory,
+        replacing any files that already exist.
+
+        :param source: The directory on disk to copy.
+        :param path: Where to put the copy in memory.
+            Defaults to ``source``, so that paths the core uses will resolve to the copy.
+
+        :raises OSError: If ``source`` couldn't be read.
+        :raises FileExistsError: If a file in memory is in the way of a copied directory.
+        """
+        source = os.fsencode(os.path.abspath(source))
+        if not os.path.isdir(source):
+            raise NotADirectoryError(errno.ENOTDIR, "Not a directory", source)
+
+        destination = os.fsencode(os.path.abspath(path if path is not None else source))
+        self.makedirs(destination)
+        for root, dirs, files in os.walk(source):
+            relative = os.path.relpath(root, source)
+            target = os.path.normpath(os.path.join(destination, relative))
+            for name in dirs:
+                self.makedirs(os.path.join(target, name))
+
+            for name in files:
+                with open(os.path.join(root, name), "rb") as file:
+                    self.write_file(os.path.join(target, name), file.read())
+
+    def save_directory(
+        self,
+        destination: str | bytes | PathLike,
+        path: str | bytes | PathLike | None = None,
+    ) -> None:
+        """
+        Writes a directory in memory and everything in it to disk,
+        creating directories and overwriting files as needed.
+        Files on disk that don't exist in memory are left alone.
+
+        :param destination: The directory on disk to write to.
+        :param path: The directory in memory to write out.
+            Defaults to ``destination``.
+
+        :raises FileNotFoundError: If ``path`` doesn't exist in memory.
+        :raises NotADirectoryError: If ``path`` is a file.
+        :raises OSError: If ``destination`` couldn't be written.
+        """
+        destination = os.fsencode(os.path.abspath(destination))
+        source = path if path is not None else destination
+        match self.__node(_split_path(source)):
+            case dict() as directory:
+                pass
+            case bytearray():
+                raise NotADirectoryError(errno.ENOTDIR, "Not a directory", source)
+            case _:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", source)
+
+        pending: list[tuple[bytes, _Directory]] = [(destination, directory)]
+        while pending:
+            target, directory = pending.pop()
+            os.makedirs(target, exist_ok=True)
+            for name, node in directory.items():
+                match node:
+                    case dict():
+                        pending.append((os.path.join(target, name), node))
+                    case bytearray():
+                        with open(os.path.join(target, name), "wb") as file:
+                            file.write(node)
+
+    def __makedirs(self, parts: tuple[bytes, ...], path: VfsPath) -> _Directory:
+        directory = self._root
+        for part in parts:
+            node = directory.setdefault(part, {})
+            if not isinstance(node, dict):
+                raise FileExistsError(errno.EEXIST, "File exists", path)
+
+            directory = node
+
+        return directory
+
+    def __node(self, parts: tuple[bytes, ...]) -> "bytearray | _Directory | None":
+        node: bytearray | _Directory = self._root
+        for part in parts:
+            if not isinstance(node, dict):
+                return None
+
+            node = node.get(part)
+            if node is None:
+                return None
+
+        return node
+
+    def __directory(self, parts: tuple[bytes, ...]) -> _Directory | None:
+        node = self.__node(parts)
+        return node if isinstance(node, dict) else None
+
+
+__all__ = [
+    "MemoryFileHandle",
+    "MemoryDirectoryHandle",
+    "MemoryFileSystemInterface",
+]
@@ -1,8 +1,29 @@
+from importlib import import_module as _import_module
+
 from .driver import *
 from .multi import *
+from .multi import _HAS_OPENGL
 from .software import *
 
-try:
-    from .opengl import *
-except ImportError:
-    pass
+# moderngl and PyOpenGL take a while to import,
+# so the drivers that need them are only imported when first accessed (see PEP 562).
+# These are the names that "from .opengl import *" used to add to this module.
+_OPENGL_NAMES = frozenset(("opengl", "moderngl", "ModernGlVideoDriver"))
+
+
+def __getattr__(name: str):
+    if name in _OPENGL_NAMES and _HAS_OPENGL:
+        try:
+            # Not "from . import opengl", which would call this function again
+            opengl = _import_module(".opengl", __name__)
+        except ImportError:
+            pass  # Installed, but broken
+        else:
+            value = globals()[name] = opengl if name == "opengl" else getattr(opengl, name)
+            return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *(_OPENGL_NAMES if _HAS_OPENGL else ())})
@@ -6,6 +6,8 @@ and available hardware resources.
 
 from collections.abc import Callable, Mapping, Set
 from copy import deepcopy
+from importlib import import_module
+from importlib.util import find_spec
 from types import MappingProxyType
 from typing import final
 
@@ -33,13 +35,65 @@ _default_driver_map: dict[HardwareContext, Callable[[], VideoDriver]] = {
     HardwareContext.NONE: ArrayVideoDriver
 }
 
-try:
-    from libretro.drivers.video.opengl import ModernGlVideoDriver
 
-    _default_driver_map[HardwareContext.OPENGL_CORE] = ModernGlVideoDriver
-    _default_driver_map[HardwareContext.OPENGL] = ModernGlVideoDriver
-except ImportError:
-    ModernGlVideoDriver = None
+class _LazyVideoDriverClass:
+    """
+    Stands in for a :class:`.VideoDriver` subclass whose module is slow to import,
+    importing it only when it's first called or inspected.
+    Compares equal to the real class and works with :func:`isinstance` and :func:`issubclass`.
+    """
+
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+
+    def resolve(self) -> type[VideoDriver]:
+        """Imports and returns the real class."""
+        return getattr(import_module(self._module), self._name)
+
+    def __call__(self, *args, **kwargs) -> VideoDriver:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # Unset slots and protocol lookups (e.g. from copy or pickle) shouldn't import anything
+        if name in _LazyVideoDriverClass.__slots__ or (
+            name.startswith("__") and name not in ("__name__", "__qualname__")
+        ):
+            raise AttributeError(name)
+
+        return getattr(self.resolve(), name)
+
+    def __instancecheck__(self, instance) -> bool:
+        return isinstance(instance, self.resolve())
+
+    def __subclasscheck__(self, subclass) -> bool:
+        return issubclass(subclass, self.resolve())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _LazyVideoDriverClass):
+            return (self._module, self._name) == (other._module, other._name)
+
+        return self.resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+    def __repr__(self) -> str:
+        return f"<lazy class '{self._module}.{self._name}'>"
+
+
+# Looking for the packages is much cheaper than importing them,
+# and moderngl and PyOpenGL are only imported if a core actually asks for OpenGL
+_HAS_OPENGL = find_spec("moderngl") is not None and find_spec("OpenGL") is not None
+
+if _HAS_OPENGL:
+    _modern_gl_video_driver = _LazyVideoDriverClass(
+        "libretro.drivers.video.opengl.moderngl", "ModernGlVideoDriver"
+    )
+    _default_driver_map[HardwareContext.OPENGL_CORE] = _modern_gl_video_driver
+    _default_driver_map[HardwareContext.OPENGL] = _modern_gl_video_driver
 
 DEFAULT_DRIVER_MAP: DriverMap = MappingProxyType(_default_driver_map)
 """
@@ -51,7 +105,10 @@ They are as follows:
     Always available and mapped to :class:`.ArrayVideoDriver`.
 
 :attr:`~.HardwareContext.OPENGL_CORE`, :attr:`~.HardwareContext.OPENGL`
-    Mapped to :class:`.ModernGlVideoDriver` if :py:mod:`moderngl` is installed, absent if not.
+    Mapped to :class:`.ModernGlVideoDriver`
+    if :py:mod:`moderngl` and PyOpenGL are installed, absent if not.
+    The class is represented by a stand-in that compares equal to it,
+    so that neither package is imported until it's first called or inspected.
 
 :class:`.VideoDriver` s for other graphics APIs have not yet been implemented.
 """
@@ -163,7 +220,7 @@ class MultiVideoDriver(VideoDriver):
 
             Does not use :attr:`~.VideoDriver.preferred_context`.
         """
-        if self._current is not None and self._current.active_context == self._next_hw_context:
+        if self.__keeps_current_driver:
             # If we're not switching to a whole new video driver...
             self._current.reinit()  # ...then just let the driver reinit itself
         else:
@@ -356,7 +413,13 @@ class MultiVideoDriver(VideoDriver):
             raise TypeError(f"Expected retro_system_av_info, got {type(av_info).__name__}")
 
         self._system_av_info = deepcopy(av_info)
-        self.reinit()
+        if self.__keeps_current_driver:
+            # Setting the system AV info reinitializes the driver,
+            # which can then decide for itself how much work that requires
+            self._current.system_av_info = av_info
+            self._next_hw_context = None
+        else:
+            self.reinit()
 
     @property
     @override
@@ -413,6 +476,13 @@ class MultiVideoDriver(VideoDriver):
         if self._current:
             self._current.shared_context = value
 
+    @property
+    def __keeps_current_driver(self) -> bool:
+        if self._current is None:
+            return False
+
+        return self._next_hw_context in (None, self._current.active_context)
+
     @override
     def screenshot(self, prerotate: bool = True) -> Screenshot | None:
         return self._current.screenshot(prerotate) if self._current else None
@@ -1,12 +1,13 @@
 import struct
 import warnings
 from array import array
+from collections import deque
 from collections.abc import Callable, Iterator, Sequence, Set
 from contextlib import contextmanager
 from copy import deepcopy
 from importlib import resources
 from sys import modules
-from typing import final
+from typing import NamedTuple, final
 
 import moderngl
 from OpenGL import GL
@@ -54,6 +55,9 @@ _CONTEXTS = frozenset((HardwareContext.NONE, HardwareContext.OPENGL_CORE, Hardwa
 
 _DEFAULT_VERT_FILENAME = "moderngl_vertex.glsl"
 _DEFAULT_FRAG_FILENAME = "moderngl_frag.glsl"
+_READBACK_VERT_FILENAME = "moderngl_readback_vertex.glsl"
+_READBACK_FRAG_FILENAME = "moderngl_readback_frag.glsl"
+_READBACK_TEXTURE_UNIT = 2
 
 _vertex = struct.Struct("2f 2f")  # 4 floats (one vec2 for screen coords, one for vec2 coords)
 _POSITION_NORTHWEST = (-1, 1)
@@ -76,11 +80,53 @@ _DEFAULT_WINDOW_IMPL = "pyglet"
 _IDENTITY_MAT4 = array("f", [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1])
 
 GL_RGBA = 0x1908
+_FENCE_TIMEOUT_NS = 1_000_000_000
 ModernGlResource = (
     Buffer | Program | VertexArray | Query | Sampler | Texture | Renderbuffer | Framebuffer
 )
 
 
+class _PendingReadback(NamedTuple):
+    buffer: Buffer
+    fence: object | None  # A GLsync, or None if fences aren't supported
+    width: int
+    height: int
+    rotation: Rotation
+
+
+# (cos, sin) of each counter-clockwise rotation
+_ROTATION_COEFFICIENTS = {
+    Rotation.NONE: (1, 0),
+    Rotation.NINETY: (0, 1),
+    Rotation.ONE_EIGHTY: (-1, 0),
+    Rotation.TWO_SEVENTY: (0, -1),
+}
+
+
+def _create_readback_matrix(rotation: Rotation, upside_down: bool) -> array:
+    # glReadPixels returns the bottom row first, so the readback is flipped vertically (F)
+    # after rotating (R) to return the frame's top row first; i.e. F·R.
+    # Frames with a bottom-left origin have always been returned bottom row first,
+    # so they're flipped before rotating as well to preserve that; i.e. F·R·F.
+    cos, sin = _ROTATION_COEFFICIENTS[rotation]
+    if upside_down:
+        # F·R·F is a rotation in the opposite direction
+        matrix = (cos, -sin, sin, cos)
+    else:
+        matrix = (cos, -sin, -sin, -cos)
+
+    # Column-major, like all OpenGL matrices
+    return array("f", (*matrix[:2], 0, 0, *matrix[2:], 0, 0, 0, 0, 1, 0, 0, 0, 0, 1))
+
+
+def _fits(texture: Texture | None, size: tuple[int, int]) -> bool:
+    if texture is None:
+        return False
+
+    width, height = texture.size
+    return width >= size[0] and height >= size[1]
+
+
 def _create_orthogonal_projection(
     left,
     right,
@@ -154,6 +200,8 @@ class ModernGlVideoDriver(VideoDriver):
         fragment_shader: str | None = None,
         varyings: Sequence[str] = ("transformedTexCoord",),
         window: str | None = None,
+        backend: str | None = None,
+        readback_buffers: int = 0,
         # TODO: Add ability to configure the OpenGL message callback
         # TODO: Add ability to configure the OpenGL debug group
         # TODO: Add ability to force an OpenGL version
@@ -172,6 +220,14 @@ class ModernGlVideoDriver(VideoDriver):
         :param fragment_shader: The GLSL source of the fragment shader to use for rendering,
             or ``None`` to use the built-in default.
         :param varyings: The names of the "varyings" (vertex value outputs) to use.
+        :param backend: The ``glcontext`` backend to use for standalone contexts
+            (e.g. ``"egl"`` for headless rendering),
+            or ``None`` to use the platform's default.
+            Ignored if ``window`` is given.
+        :param readback_buffers: The number of pixel buffer objects
+            to use for asynchronous readback with :meth:`capture`,
+            or 0 to disable asynchronous readback.
+            Use 2 for double-buffering or 3 for triple-buffering.
         """
         package_files = resources.files(modules[__name__].__package__)
         # TODO: Support passing SPIR-V shaders as bytes
@@ -198,6 +254,20 @@ class ModernGlVideoDriver(VideoDriver):
             raise TypeError("All elements of 'varyings' must be str")
 
         self._varyings = tuple(varyings)
+        self._readback_vertex_shader = (package_files / _READBACK_VERT_FILENAME).read_text()
+        self._readback_fragment_shader = (package_files / _READBACK_FRAG_FILENAME).read_text()
+
+        if backend is not None and not isinstance(backend, str):
+            raise TypeError(f"Expected a str or None, got {type(backend).__name__}")
+
+        if not isinstance(readback_buffers, int):
+            raise TypeError(f"Expected an int, got {type(readback_buffers).__name__}")
+
+        if readback_buffers == 1 or readback_buffers < 0:
+            raise ValueError(f"Expected 0 or at least 2 readback buffers, got {readback_buffers}")
+
+        self._backend = backend
+        self._readback_buffer_count = readback_buffers
         self._callback: retro_hw_render_callback | None = None
         self._prev_callback: retro_hw_render_callback | None = None
         self._pixel_format = PixelFormat.RGB1555
@@ -227,6 +297,21 @@ class ModernGlVideoDriver(VideoDriver):
         # Texture for CPU-rendered output
         self._cpu_color: Texture | None = None
 
+        # Framebuffer that holds the final (flipped and rotated) frame for readback,
+        # plus the program and VAO that render to it
+        self._readback_fbo: Framebuffer | None = None
+        self._readback_color: Texture | None = None
+        self._readback_program: Program | None = None
+        self._readback_vao: VertexArray | None = None
+
+        # Pixel buffer objects for asynchronous readback, used round-robin
+        self._readback_buffers: list[Buffer] = []
+        self._readback_index = 0
+
+        # Readbacks that have been issued but not yet returned by capture(), oldest first
+        self._pending_readbacks: deque[_PendingReadback] = deque()
+        self._has_sync = False
+
         self._get_proc_address = retro_hw_get_proc_address_t(self.get_proc_address)
         self._get_hw_framebuffer = retro_hw_get_current_framebuffer_t(
             lambda: self.current_framebuffer
@@ -243,12 +328,24 @@ class ModernGlVideoDriver(VideoDriver):
 
             self._window_class = moderngl_window.get_local_window_cls(window_mode)
 
+        # The parameters that the current context was created with;
+        # if these don't change, reinit() may be able to keep the context
+        self._context_params: tuple | None = None
+        self._avoided_reinits = 0
+
         self._debug_group_id = 0
         self.__gl_push_debug_group: Callable[[int, int, int, bytes], None] | None = None
         self.__gl_pop_debug_group: Callable[[], None] | None = None
         self.__gl_object_label: Callable[[int, int, int, bytes], None] | None = None
 
     def __del__(self):
+        self._pending_readbacks.clear()
+        self._readback_buffers.clear()
+        self._readback_vao = None
+        self._readback_program = None
+        self._readback_fbo = None
+        self._readback_color = None
+
         if self._cpu_color:
             del self._cpu_color
 
@@ -358,10 +455,15 @@ class ModernGlVideoDriver(VideoDriver):
                     self._context.copy_framebuffer(self._window.fbo, self._fbo)
                     self._window.swap_buffers()
 
-            self._context.finish()
             self._last_width = width
             self._last_height = height
 
+            if self._readback_buffers:
+                # Don't stall on the GPU; capture() will pick up the frame once it's done
+                self.__queue_readback()
+            else:
+                self._context.finish()
+
     @property
     @override
     def needs_reinit(self) -> bool:
@@ -387,7 +489,13 @@ class ModernGlVideoDriver(VideoDriver):
         if context_type not in _CONTEXTS:
             raise RuntimeError(f"Unsupported hardware context: {context_type}")
 
-        # TODO: Honor cache_context; try to avoid reinitializing the context
+        context_params = self.__context_params(context_type)
+        if self._context and self.__can_keep_context(context_type, context_params):
+            # If the existing context can be reused as-is...
+            self.__reinit_cached(context_type)
+            self._avoided_reinits += 1
+            return
+
         if self._context:
             _clear_gl_errors()
             if self._callback and self._callback.context_destroy:
@@ -399,22 +507,26 @@ class ModernGlVideoDriver(VideoDriver):
 
             if self._window:
                 self._window.destroy()
-                del self._window
+                self._window = None
+
+            self.__release_readback()
 
             self._context.release()
-            del self._context
+            self._context = None
 
-            del self._hw_render_depth
-            del self._hw_render_color
-            del self._hw_render_fbo
-            del self._vao
-            del self._fbo
-            del self._shader_program
-            del self._vbo
-            del self._cpu_color
-            del self.__gl_push_debug_group
-            del self.__gl_pop_debug_group
-            del self.__gl_object_label
+            self._hw_render_depth = None
+            self._hw_render_color = None
+            self._hw_render_fbo = None
+            self._vao = None
+            self._fbo = None
+            self._color = None
+            self._depth = None
+            self._shader_program = None
+            self._vbo = None
+            self._cpu_color = None
+            self.__gl_push_debug_group = None
+            self.__gl_pop_debug_group = None
+            self.__gl_object_label = None
             # Destroy the OpenGL context and create a new one
 
         geometry = self._system_av_info.geometry
@@ -455,13 +567,18 @@ class ModernGlVideoDriver(VideoDriver):
             case HardwareContext.NONE, None:
                 # Create a default context with OpenGL 3.3 core profile;
                 # do not expose it to the core, only use it for software rendering
-                self._context = create_context(standalone=True)
+                self._context = create_context(standalone=True, **self.__backend_args)
             case HardwareContext.OPENGL, None:
-                self._context = create_context(require=210, standalone=True, share=self._shared)
+                self._context = create_context(
+                    require=210, standalone=True, share=self._shared, **self.__backend_args
+                )
             case HardwareContext.OPENGL_CORE, None:
                 ver = self._callback.version_major * 100 + self._callback.version_minor * 10
-                self._context = create_context(require=ver, standalone=True, share=self._shared)
+                self._context = create_context(
+                    require=ver, standalone=True, share=self._shared, **self.__backend_args
+                )
 
+        self._context_params = context_params
         _clear_gl_errors()
         if self._context.version_code >= 430:
             self.__gl_push_debug_group = GL.glPushDebugGroup
@@ -509,6 +626,8 @@ class ModernGlVideoDriver(VideoDriver):
             self.__object_label(self._vbo, b"libretro.py Screen VBO")
             self.__object_label(self._vao, b"libretro.py Screen VAO")
 
+            self.__init_readback()
+
             # TODO: Honor debug_context; enable debugging features if requested
             if self._callback is not None and context_type != HardwareContext.NONE:
                 # If the core specifically wants to render with the OpenGL API...
@@ -532,6 +651,8 @@ class ModernGlVideoDriver(VideoDriver):
     def preferred_context(self) -> HardwareContext | None:
         return HardwareContext.OPENGL_CORE
 
+    @property
+    @override
     def active_context(self) -> HardwareContext | None:
         if self._context and self._callback:
             return HardwareContext(self._callback.context_type)
@@ -613,47 +734,86 @@ class ModernGlVideoDriver(VideoDriver):
 
     @override
     def screenshot(self, prerotate: bool = True) -> Screenshot | None:
-        if self._system_av_info is None:
+        if self._system_av_info is None or self._last_width is None:
             return None
 
         _clear_gl_errors()
         with self.__debug_group(b"libretro.ModernGlVideoDriver.screenshot"):
-            size = (self._last_width, self._last_height)
-            if self._window:
-                frame = self._window.fbo.read(size, 4)
-            else:
-                frame = self._fbo.read(size, 4)
+            rotation = self._rotation if prerotate else Rotation.NONE
+            width, height = self.__render_readback(rotation)
+            frame = self._readback_fbo.read((0, 0, width, height), 4)
 
             if frame is None:
                 return None
 
             _clear_gl_errors()
-            if not self._callback or not self._callback.bottom_left_origin:
-                # If we're using software rendering or the origin is at the bottom-left...
-                bytes_per_row = self._last_width * self._pixel_format.bytes_per_pixel
-                reversed_frame = array("B", frame)
-                reversed_frame_view = memoryview(reversed_frame)
-                frame_view = memoryview(frame)
-                frame_len = len(frame)
-                for i in range(self._last_height):
-                    # For each row...
-                    start = i * bytes_per_row
-                    end = start + bytes_per_row
-                    reversed_frame_view[start:end] = frame_view[
-                        frame_len - end : frame_len - start
-                    ]
-                    # ...copy row number (height - i) to row i
-
-                frame = reversed_frame_view
-
             return Screenshot(
                 memoryview(frame),
-                self._last_width,
-                self._last_height,
+                width,
+                height,
                 self._rotation,
                 self._pixel_format,
             )
 
+    def capture(self, block: bool = False) -> Screenshot | None:
+        """
+        Returns the most recent frame whose asynchronous readback has completed,
+        without waiting for the GPU unless ``block`` is :obj:`True`.
+
+        Each frame presented by :meth:`refresh` is copied into a pixel buffer object
+        without stalling the CPU, so the returned frame usually lags one frame behind
+        the one that was most recently rendered.
+        Frames are returned at most once;
+        older completed frames are discarded in favor of newer ones.
+
+        Captured frames are always rotated according to :attr:`rotation`
+        as it was when the frame was rendered.
+
+        :param block: If :obj:`True` and no completed frame is available,
+            wait for the most recently rendered frame to finish.
+        :return: A :class:`.Screenshot` in the same format as :meth:`screenshot`,
+            or :obj:`None` if no frame is ready (or none has been rendered since the last call).
+        :raises RuntimeError: If this driver was created without ``readback_buffers``,
+            or if waiting for a frame failed.
+        """
+        if not self._readback_buffer_count:
+            raise RuntimeError("Asynchronous readback is disabled for this driver")
+
+        if not self._pending_readbacks:
+            return None
+
+        _clear_gl_errors()
+        with self.__debug_group(b"libretro.ModernGlVideoDriver.capture"):
+            ready: _PendingReadback | None = None
+            while self._pending_readbacks and self.__is_readback_done(self._pending_readbacks[0]):
+                if ready is not None:
+                    # Superseded by a newer completed frame
+                    self.__delete_fence(ready)
+
+                ready = self._pending_readbacks.popleft()
+
+            if ready is None and block:
+                ready = self._pending_readbacks.pop()
+                while self._pending_readbacks:
+                    self.__delete_fence(self._pending_readbacks.popleft())
+
+                if ready.fence is not None:
+                    self.__wait_for_readback(ready)
+
+            if ready is None:
+                return None
+
+            frame = ready.buffer.read(ready.width * ready.height * 4)
+            self.__delete_fence(ready)
+            _clear_gl_errors()
+            return Screenshot(
+                memoryview(frame),
+                ready.width,
+                ready.height,
+                ready.rotation,
+                self._pixel_format,
+            )
+
     @property
     @override
     def shared_context(self) -> bool:
@@ -674,6 +834,21 @@ class ModernGlVideoDriver(VideoDriver):
         # TODO: Map the OpenGL texture to a software framebuffer
         pass
 
+    @property
+    def avoided_reinits(self) -> int:
+        """
+        The number of times :meth:`reinit` kept the existing OpenGL context
+        instead of destroying and recreating it.
+
+        The context is kept if the core's requested context parameters haven't changed
+        and either the core uses software rendering
+        or it set :attr:`.retro_hw_render_callback.cache_context`.
+        In that case, framebuffers are only reallocated if they're too small for the new geometry,
+        and the core's ``context_destroy`` and ``context_reset`` callbacks
+        are only called if its framebuffer had to be reallocated.
+        """
+        return self._avoided_reinits
+
     @property
     def hw_render_interface(self) -> retro_hw_render_interface | None:
         # libretro doesn't define one of these for OpenGL, so no need
@@ -704,9 +879,9 @@ class ModernGlVideoDriver(VideoDriver):
             assert self._context is not None
             assert self._system_av_info is not None
 
-            del self._fbo
-            del self._color
-            del self._depth
+            self._fbo = None
+            self._color = None
+            self._depth = None
 
             geometry = self._system_av_info.geometry
             size = self.__get_framebuffer_size()
@@ -722,6 +897,9 @@ class ModernGlVideoDriver(VideoDriver):
             self.__object_label(self._depth, b"libretro.py Main FBO Depth Attachment")
             self.__object_label(self._fbo, b"libretro.py Main FBO")
 
+            # Only sampled by the readback pass, which maps texels 1:1
+            self._color.filter = (moderngl.NEAREST, moderngl.NEAREST)
+
             self._fbo.viewport = (0, 0, geometry.base_width, geometry.base_height)
             self._fbo.scissor = (0, 0, geometry.base_width, geometry.base_height)
             self._fbo.clear()
@@ -768,6 +946,200 @@ class ModernGlVideoDriver(VideoDriver):
                     self._hw_render_depth, b"libretro.py Hardware Rendering FBO Depth Attachment"
                 )
 
+    def __release_readback(self):
+        while self._pending_readbacks:
+            self.__delete_fence(self._pending_readbacks.popleft())
+
+        for pbo in self._readback_buffers:
+            pbo.release()
+
+        self._readback_buffers.clear()
+        self._readback_vao = None
+        self._readback_program = None
+        self._readback_fbo = None
+        self._readback_color = None
+
+    def __context_params(self, context_type: HardwareContext) -> tuple:
+        if context_type == HardwareContext.NONE or not self._callback:
+            return (context_type, self._shared)
+
+        callback = self._callback
+        return (
+            context_type,
+            callback.version_major,
+            callback.version_minor,
+            bool(callback.depth),
+            bool(callback.stencil),
+            self._shared,
+        )
+
+    def __can_keep_context(self, context_type: HardwareContext, params: tuple) -> bool:
+        if params != self._context_params:
+            # The core wants a different kind of context than the one we have
+            return False
+
+        if context_type == HardwareContext.NONE:
+            # The core never sees the context, so there's nothing to reset
+            return True
+
+        return bool(self._callback.cache_context)
+
+    def __reinit_cached(self, context_type: HardwareContext):
+        # Only reallocates framebuffers if they're too small for the new geometry;
+        # the context, shader programs, and vertex buffers are left alone.
+        with self.__debug_group(b"libretro.ModernGlVideoDriver.reinit.cached"):
+            size = self.__get_framebuffer_size()
+            geometry = self._system_av_info.geometry
+
+            if _fits(self._color, size):
+                self._fbo.viewport = (0, 0, geometry.base_width, geometry.base_height)
+                self._fbo.scissor = (0, 0, geometry.base_width, geometry.base_height)
+            else:
+                self.__release_readback()
+                self.__init_fbo()
+                self.__init_readback()
+
+            if context_type != HardwareContext.NONE and not _fits(self._hw_render_color, size):
+                # The core may have cached the old framebuffer's ID,
+                # so it has to be told about the new one
+                if self._callback.context_destroy:
+                    _clear_gl_errors()
+                    with self.__debug_group(
+                        b"libretro.ModernGlVideoDriver.reinit.context_destroy"
+                    ):
+                        self._callback.context_destroy()
+
+                    _warn_unhandled_gl_errors()
+
+                self.__init_hw_render()
+
+                if self._callback.context_reset:
+                    _clear_gl_errors()
+                    with self.__debug_group(b"libretro.ModernGlVideoDriver.reinit.context_reset"):
+                        self._callback.context_reset()
+
+                    _warn_unhandled_gl_errors()
+
+        _clear_gl_errors()
+
+    def __init_readback(self):
+        with self.__debug_group(b"libretro.ModernGlVideoDriver.__init_readback"):
+            assert self._context is not None
+            assert self._vbo is not None
+            width, height = self.__get_framebuffer_size()
+
+            # Square, so that it can hold the frame in any orientation
+            side = max(width, height)
+            self._readback_color = self._context.texture((side, side), 4)
+            self._readback_fbo = self._context.framebuffer(self._readback_color)
+            self._readback_program = self._context.program(
+                vertex_shader=self._readback_vertex_shader,
+                fragment_shader=self._readback_fragment_shader,
+                fragment_outputs={"pixelColor": 0},
+            )
+            self._readback_program["frameTexture"].value = _READBACK_TEXTURE_UNIT
+            self._readback_vao = self._context.vertex_array(
+                self._readback_program, self._vbo, "vertexCoord", "texCoord"
+            )
+
+            self.__object_label(self._readback_color, b"libretro.py Readback FBO Color Attachment")
+            self.__object_label(self._readback_fbo, b"libretro.py Readback FBO")
+            self.__object_label(self._readback_program, b"libretro.py Readback Shader Program")
+            self.__object_label(self._readback_vao, b"libretro.py Readback VAO")
+
+            if not self._readback_buffer_count:
+                return
+
+            while self._pending_readbacks:
+                self.__delete_fence(self._pending_readbacks.popleft())
+
+            self._readback_buffers = [
+                self._context.buffer(reserve=width * height * 4, dynamic=True)
+                for _ in range(self._readback_buffer_count)
+            ]
+            self._readback_index = 0
+
+            for i, pbo in enumerate(self._readback_buffers):
+                self.__object_label(pbo, f"libretro.py Readback PBO {i}".encode())
+
+            self._has_sync = (
+                self._context.version_code >= 320 or "GL_ARB_sync" in self._context.extensions
+            )
+
+    def __render_readback(self, rotation: Rotation) -> tuple[int, int]:
+        # Draws the most recent frame to the readback FBO in its final orientation,
+        # so that no CPU-side pass is needed after reading it.
+        # Returns the size of the drawn frame.
+        with self.__debug_group(b"libretro.ModernGlVideoDriver.__render_readback"):
+            width, height = self._last_width, self._last_height
+            texture_width, texture_height = self._color.size
+            upside_down = bool(self._callback and self._callback.bottom_left_origin)
+
+            self._readback_program["mvp"].write(_create_readback_matrix(rotation, upside_down))
+            self._readback_program["texScale"].value = (
+                width / texture_width,
+                height / texture_height,
+            )
+
+            if rotation in (Rotation.NINETY, Rotation.TWO_SEVENTY):
+                width, height = height, width
+
+            self._color.use(_READBACK_TEXTURE_UNIT)
+            self._readback_fbo.use()
+            self._context.viewport = (0, 0, width, height)
+            self._readback_vao.render(moderngl.TRIANGLE_STRIP)
+            self._fbo.use()
+
+            return width, height
+
+    def __queue_readback(self):
+        with self.__debug_group(b"libretro.ModernGlVideoDriver.__queue_readback"):
+            pbo = self._readback_buffers[self._readback_index]
+            self._readback_index = (self._readback_index + 1) % len(self._readback_buffers)
+
+            if len(self._pending_readbacks) == len(self._readback_buffers):
+                # If the caller hasn't kept up with capture(), drop the oldest frame
+                self.__delete_fence(self._pending_readbacks.popleft())
+
+            rotation = self._rotation
+            width, height = self.__render_readback(rotation)
+
+            # With a buffer as the destination, glReadPixels returns without waiting for the GPU
+            self._readback_fbo.read_into(pbo, (0, 0, width, height), components=4)
+            fence = GL.glFenceSync(GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0) if self._has_sync else None
+            self._pending_readbacks.append(_PendingReadback(pbo, fence, width, height, rotation))
+
+    def __is_readback_done(self, readback: "_PendingReadback") -> bool:
+        if readback.fence is None:
+            # Without fences, assume a readback is done once a newer one has been issued
+            return readback is not self._pending_readbacks[-1]
+
+        status = GL.glClientWaitSync(readback.fence, GL.GL_SYNC_FLUSH_COMMANDS_BIT, 0)
+        return status in (GL.GL_ALREADY_SIGNALED, GL.GL_CONDITION_SATISFIED)
+
+    def __wait_for_readback(self, readback: "_PendingReadback"):
+        # glClientWaitSync may time out more than once (e.g. on a slow or busy GPU);
+        # the commands only need to be flushed the first time
+        flags = GL.GL_SYNC_FLUSH_COMMANDS_BIT
+        while True:
+            match GL.glClientWaitSync(readback.fence, flags, _FENCE_TIMEOUT_NS):
+                case GL.GL_ALREADY_SIGNALED | GL.GL_CONDITION_SATISFIED:
+                    return
+                case GL.GL_WAIT_FAILED:
+                    self.__delete_fence(readback)
+                    raise RuntimeError("glClientWaitSync failed while waiting for a readback")
+
+            flags = 0
+
+    @staticmethod
+    def __delete_fence(readback: "_PendingReadback"):
+        if readback.fence is not None:
+            GL.glDeleteSync(readback.fence)
+
+    @property
+    def __backend_args(self) -> dict[str, str]:
+        return {"backend": self._backend} if self._backend else {}
+
     def __update_cpu_texture(self, data: memoryview, width: int, height: int, pitch: int):
         with self.__debug_group(b"libretro.ModernGlVideoDriver.__update_cpu_texture"):
             if self._cpu_color and self._cpu_color.size == (width, height):
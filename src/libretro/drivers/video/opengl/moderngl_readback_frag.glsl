@@ -0,0 +1,9 @@
+#version 330
+
+uniform sampler2D frameTexture;
+in vec2 readbackTexCoord;
+out vec4 pixelColor;
+
+void main() {
+    pixelColor = vec4(texture(frameTexture, readbackTexCoord).rgb, 1.0f);
+}
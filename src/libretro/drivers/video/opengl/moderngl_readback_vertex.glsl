@@ -0,0 +1,12 @@
+#version 330
+
+in vec2 vertexCoord;
+in vec2 texCoord;
+uniform mat4 mvp;
+uniform vec2 texScale;
+out vec2 readbackTexCoord;
+
+void main() {
+    gl_Position = mvp * vec4(vertexCoord, 0.0, 1.0);
+    readbackTexCoord = texCoord * texScale;
+}
@@ -1,2 +1,4 @@
 from .array import *
 from .base import *
+from .convert import *
+from .null import *
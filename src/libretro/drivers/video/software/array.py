@@ -5,17 +5,29 @@ from typing import final
 from warnings import warn
 
 from libretro._typing import override
+from libretro.api._utils import addressof_view
 from libretro.api.av import retro_game_geometry, retro_system_av_info
-from libretro.api.video import MemoryAccess, PixelFormat, Rotation, retro_framebuffer
+from libretro.api.video import (
+    MemoryAccess,
+    MemoryType,
+    PixelFormat,
+    Rotation,
+    retro_framebuffer,
+)
 
 from ..driver import FrameBufferSpecial, Screenshot
 from .base import SoftwareVideoDriver
+from .convert import convert_to_rgba
 
 
 @final
 class ArrayVideoDriver(SoftwareVideoDriver):
     def __init__(self):
         self._frame: array | None = None
+
+        # The buffer most recently given to the core by get_software_framebuffer;
+        # kept alive until the core asks for another, even if _frame is replaced
+        self._exposed_frame: array | None = None
         self._pixel_format: PixelFormat = PixelFormat.RGB1555
         self._system_av_info: retro_system_av_info | None = None
         self._rotation: Rotation = Rotation.NONE
@@ -28,8 +40,13 @@ class ArrayVideoDriver(SoftwareVideoDriver):
         self, data: memoryview | FrameBufferSpecial, width: int, height: int, pitch: int
     ) -> None:
         match data:
+            case memoryview() if (
+                self._frame is not None and addressof_view(data) == self._frame.buffer_info()[0]
+            ):
+                pass  # The core rendered to the buffer from get_software_framebuffer; no copy needed
+
             case memoryview():
-                if len(data) > len(self._frame):
+                if self._frame is None or len(data) > len(self._frame):
                     # Reallocate frame buffer
                     self._frame = array("B", itertools.repeat(0, len(data)))
                 frameview = memoryview(self._frame)
@@ -99,105 +116,81 @@ class ArrayVideoDriver(SoftwareVideoDriver):
 
     @override
     def screenshot(self, prerotate: bool = True) -> Screenshot | None:
-        if not self._frame:
+        if not self._frame or self._last_pitch is None:
             return None
 
-        last_frame_length = self._last_pitch * self._last_height
-        screen = self._frame[:last_frame_length]
-        screen_out = bytearray(self._last_width * self._last_height * 4)
-        pixel_buf = array("B", (0, 0, 0, 255))
-
         rot = self._rotation if prerotate else Rotation.NONE
-
-        # Select rotation coefficients
-        # NOTE: output buffer is assumed to be four bytes per pixel (ABGR)
-        match rot:
-            case Rotation.NONE:
-                start_y = 0
-                delta_x = 4
-                delta_y = self._last_width * 4
-                is_sideways = False
-            case Rotation.NINETY:
-                start_y = (self._last_width - 4) * self._last_height * 4
-                delta_x = self._last_height * -4
-                delta_y = 4
-                is_sideways = True
-            case Rotation.ONE_EIGHTY:
-                start_y = self._last_width * self._last_height * 4 - 4
-                delta_x = -4
-                delta_y = self._last_width * -4
-                is_sideways = False
-            case Rotation.TWO_SEVENTY:
-                start_y = self._last_height * 4 - 4
-                delta_x = self._last_height * 4
-                delta_y = -4
-                is_sideways = True
-
-        # Copy from input buffer to output buffer, converting the pixel format
-        #   and taking into account rotation (if prerotate is True).
-        if self._pixel_format == PixelFormat.XRGB8888:
-            for y in range(self._last_height):
-                i = y * self._last_pitch
-                o = start_y + y * delta_y
-                for x in range(self._last_width):
-                    next_i = i + 3
-                    pixel_buf[2::-1] = screen[i:next_i]
-                    screen_out[o : o + 4] = pixel_buf
-                    i = next_i + 1
-                    o += delta_x
-        elif self._pixel_format == PixelFormat.RGB565:
-            for y in range(self._last_height):
-                i = y * self._last_pitch
-                o = start_y + y * delta_y
-                for x in range(self._last_width):
-                    next_i = i + 2
-                    b, r = screen[i:next_i]
-                    g = ((b & 0xE0) >> 3) | ((r & 0x07) << 5)
-                    b = (b & 0x1F) << 3
-                    pixel_buf[0] = (r & 0xF8) | (r >> 5)
-                    pixel_buf[1] = g | (g >> 6)
-                    pixel_buf[2] = b | (b >> 5)
-                    screen_out[o : o + 4] = pixel_buf
-                    i = next_i
-                    o += delta_x
-        elif self._pixel_format == PixelFormat.RGB1555:
-            for y in range(self._last_height):
-                i = y * self._last_pitch
-                o = start_y + y * delta_y
-                for x in range(self._last_width):
-                    next_i = i + 2
-                    b, g = screen[i:next_i]
-                    r = (g & 0x7C) << 1
-                    g = ((b & 0xE0) >> 2) | ((g & 0x03) << 6)
-                    b = (b & 0x1F) << 3
-                    pixel_buf[0] = r | (r >> 5)
-                    pixel_buf[1] = g | (g >> 5)
-                    pixel_buf[2] = b | (b >> 5)
-                    screen_out[o : o + 4] = pixel_buf
-                    i = next_i
-                    o += delta_x
+        screen_out = convert_to_rgba(
+            memoryview(self._frame),
+            self._last_width,
+            self._last_height,
+            self._last_pitch,
+            self._pixel_format,
+            rot,
+        )
 
         # Swap width and height if buffer is rotated 90 or 270 degrees.
-        if is_sideways:
+        if rot in (Rotation.NINETY, Rotation.TWO_SEVENTY):
             return Screenshot(
-                memoryview(screen_out),
+                screen_out,
                 self._last_height,
                 self._last_width,
                 self._rotation,
                 self._pixel_format,
             )
         return Screenshot(
-            memoryview(screen_out),
+            screen_out,
             self._last_width,
             self._last_height,
             self._rotation,
             self._pixel_format,
         )
 
+    @override
     def get_software_framebuffer(
         self, width: int, height: int, flags: MemoryAccess
     ) -> retro_framebuffer | None:
-        pass
+        """
+        Exposes this driver's own frame buffer to the core,
+        so that :meth:`refresh` doesn't need to copy the frame
+        if the core renders directly to it.
+        The exposed buffer stays alive until the next call to this method,
+        even if the driver reallocates its own frame buffer in the meantime.
+
+        :return: A :class:`.retro_framebuffer` that points to this driver's frame buffer,
+            or :obj:`None` if the driver isn't initialized
+            or if the buffer is too small for the requested frame.
+        """
+        if not isinstance(width, int) or not isinstance(height, int):
+            raise TypeError(
+                f"Expected width and height to be ints, got {type(width).__name__} and {type(height).__name__}"
+            )
+
+        if not isinstance(flags, MemoryAccess):
+            raise TypeError(f"Expected a MemoryAccess, got {type(flags).__name__}")
+
+        if width < 1 or height < 1:
+            raise ValueError(f"Expected a framebuffer size of at least 1x1, got {width}x{height}")
+
+        if self._frame is None:
+            return None
+
+        pitch = width * self._pixel_format.bytes_per_pixel
+        if pitch * height > len(self._frame):
+            # Reallocating here could invalidate a pointer the core already has
+            return None
+
+        self._exposed_frame = self._frame
+        address, _ = self._frame.buffer_info()
+        return retro_framebuffer(
+            data=address,
+            width=width,
+            height=height,
+            pitch=pitch,
+            format=self._pixel_format,
+            access_flags=flags,
+            memory_flags=MemoryType.CACHED,
+        )
 
     @property
     @override
@@ -0,0 +1,218 @@
+"""
+Routines for converting software-rendered frames to 32-bit RGBA,
+the layout returned by :meth:`.ArrayVideoDriver.screenshot`.
+
+Frames are converted a whole frame (or at worst a whole row) at a time.
+:py:mod:`numpy` is used if it's installed;
+otherwise, conversion falls back to :py:mod:`array` operations
+that still avoid visiting each pixel in Python bytecode.
+"""
+
+import sys
+from array import array
+from functools import cache
+
+from libretro._typing import Buffer
+from libretro.api.video import PixelFormat, Rotation
+
+_RGBA_TYPECODE = next(t for t in "IL" if array(t).itemsize == 4)
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+@cache
+def _numpy():
+    # Imported on first use, since numpy takes a while to import
+    # and many sessions never convert a frame
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+# Byte offsets of the blue, green, and red channels within an XRGB8888 pixel,
+# which libretro defines as a native-endian 32-bit integer
+_XRGB8888_BGR = (0, 1, 2) if _LITTLE_ENDIAN else (3, 2, 1)
+
+
+def _expand_rgb565(pixel: int) -> tuple[int, int, int]:
+    r = (pixel >> 11) & 0x1F
+    g = (pixel >> 5) & 0x3F
+    b = pixel & 0x1F
+    return (r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)
+
+
+def _expand_rgb1555(pixel: int) -> tuple[int, int, int]:
+    r = (pixel >> 10) & 0x1F
+    g = (pixel >> 5) & 0x1F
+    b = pixel & 0x1F
+    return (r << 3) | (r >> 2), (g << 3) | (g >> 2), (b << 3) | (b >> 2)
+
+
+def _pack_rgba(r: int, g: int, b: int) -> int:
+    # Packed so that the resulting integer is laid out in memory as R, G, B, A
+    if _LITTLE_ENDIAN:
+        return r | (g << 8) | (b << 16) | 0xFF000000
+
+    return (r << 24) | (g << 16) | (b << 8) | 0xFF
+
+
+@cache
+def _lookup_table(pixel_format: PixelFormat) -> array:
+    match pixel_format:
+        case PixelFormat.RGB565:
+            expand = _expand_rgb565
+        case PixelFormat.RGB1555:
+            expand = _expand_rgb1555
+        case _:
+            raise ValueError(f"No lookup table for {pixel_format!r}")
+
+    # One entry for every possible 16-bit pixel; 256KiB per pixel format
+    return array(_RGBA_TYPECODE, (_pack_rgba(*expand(p)) for p in range(0x10000)))
+
+
+@cache
+def _numpy_lookup_table(pixel_format: PixelFormat):
+    numpy = _numpy()
+    return numpy.frombuffer(_lookup_table(pixel_format), dtype=numpy.uint32)
+
+
+def _packed_rows(data: memoryview, height: int, row_length: int, pitch: int) -> memoryview:
+    if pitch == row_length:
+        # No padding between rows, so the frame can be converted in one go
+        return data[: row_length * height]
+
+    return memoryview(b"".join(data[y * pitch : y * pitch + row_length] for y in range(height)))
+
+
+def _convert_array(
+    data: memoryview, width: int, height: int, pitch: int, pixel_format: PixelFormat
+) -> array:
+    rows = _packed_rows(data, height, width * pixel_format.bytes_per_pixel, pitch)
+    match pixel_format:
+        case PixelFormat.XRGB8888:
+            b, g, r = _XRGB8888_BGR
+            rgba = bytearray(len(rows))
+            rgba[0::4] = rows[r::4]
+            rgba[1::4] = rows[g::4]
+            rgba[2::4] = rows[b::4]
+            rgba[3::4] = b"\xff" * (width * height)
+            return array(_RGBA_TYPECODE, rgba)
+        case PixelFormat.RGB565 | PixelFormat.RGB1555:
+            pixels = array("H")
+            pixels.frombytes(rows)
+            return array(_RGBA_TYPECODE, map(_lookup_table(pixel_format).__getitem__, pixels))
+        case _:
+            raise ValueError(f"Unsupported pixel format: {pixel_format!r}")
+
+
+def _rotate_array(pixels: array, width: int, height: int, rotation: Rotation) -> array:
+    # Rotations are counter-clockwise, as with RETRO_ENVIRONMENT_SET_ROTATION
+    match rotation:
+        case Rotation.NONE:
+            return pixels
+        case Rotation.ONE_EIGHTY:
+            pixels.reverse()
+            return pixels
+        case Rotation.NINETY:
+            rotated = array(pixels.typecode)
+            for x in reversed(range(width)):
+                # Each output row is an input column, read from top to bottom
+                rotated.extend(pixels[x::width])
+            return rotated
+        case Rotation.TWO_SEVENTY:
+            rotated = array(pixels.typecode)
+            last_row = (height - 1) * width
+            for x in range(width):
+                # Each output row is an input column, read from bottom to top
+                rotated.extend(pixels[last_row + x :: -width])
+            return rotated
+        case _:
+            raise ValueError(f"Invalid rotation: {rotation}")
+
+
+def _convert_numpy(
+    data: memoryview,
+    width: int,
+    height: int,
+    pitch: int,
+    pixel_format: PixelFormat,
+    rotation: Rotation,
+) -> memoryview:
+    numpy = _numpy()
+    match pixel_format:
+        case PixelFormat.XRGB8888:
+            pixels = numpy.ndarray((height, width), numpy.uint32, data, strides=(pitch, 4))
+            if _LITTLE_ENDIAN:
+                rgba = (
+                    ((pixels >> 16) & 0xFF)
+                    | (pixels & 0xFF00)
+                    | ((pixels & 0xFF) << 16)
+                    | numpy.uint32(0xFF000000)
+                )
+            else:
+                rgba = (pixels << 8) | numpy.uint32(0xFF)
+        case PixelFormat.RGB565 | PixelFormat.RGB1555:
+            pixels = numpy.ndarray((height, width), numpy.uint16, data, strides=(pitch, 2))
+            rgba = _numpy_lookup_table(pixel_format)[pixels]
+        case _:
+            raise ValueError(f"Unsupported pixel format: {pixel_format!r}")
+
+    if rotation != Rotation.NONE:
+        # numpy.rot90 also rotates counter-clockwise
+        rgba = numpy.ascontiguousarray(numpy.rot90(rgba, int(rotation)))
+
+    return memoryview(rgba.reshape(-1).view(numpy.uint8))
+
+
+def convert_to_rgba(
+    data: Buffer,
+    width: int,
+    height: int,
+    pitch: int,
+    pixel_format: PixelFormat,
+    rotation: Rotation = Rotation.NONE,
+) -> memoryview:
+    """
+    Converts a software-rendered frame to 32-bit RGBA,
+    optionally rotating it.
+
+    :param data: The frame's pixel data, in the format given by ``pixel_format``.
+        May be larger than the frame itself.
+    :param width: The width of the frame, in pixels.
+    :param height: The height of the frame, in pixels.
+    :param pitch: The distance between the start of each row in ``data``, in bytes.
+    :param pixel_format: The pixel format of ``data``.
+    :param rotation: The counter-clockwise rotation to apply to the converted frame.
+
+    :return: A :class:`memoryview` of ``width * height * 4`` bytes
+        with one byte per channel in the order R, G, B, A.
+        If ``rotation`` is :attr:`.Rotation.NINETY` or :attr:`.Rotation.TWO_SEVENTY`,
+        the returned frame is ``height`` pixels wide and ``width`` pixels tall.
+
+    :raises ValueError: If ``data`` is too small for the given dimensions,
+        or if ``pixel_format`` or ``rotation`` is invalid.
+    """
+    view = memoryview(data).cast("B")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Expected a positive frame size, got {width}x{height}")
+
+    row_length = width * pixel_format.bytes_per_pixel
+    if pitch < row_length:
+        raise ValueError(f"Pitch of {pitch} bytes is too small for {width} pixels")
+
+    if len(view) < pitch * (height - 1) + row_length:
+        raise ValueError(f"Expected at least {pitch * height} bytes, got {len(view)}")
+
+    if rotation not in Rotation:
+        raise ValueError(f"Invalid rotation: {rotation}")
+
+    if _numpy() is not None:
+        return _convert_numpy(view, width, height, pitch, pixel_format, rotation)
+
+    pixels = _convert_array(view, width, height, pitch, pixel_format)
+    return memoryview(_rotate_array(pixels, width, height, rotation)).cast("B")
+
+
+__all__ = ["convert_to_rgba"]
@@ -0,0 +1,231 @@
+import hashlib
+from copy import deepcopy
+from typing import final
+from warnings import warn
+
+from libretro._typing import override
+from libretro.api.av import retro_game_geometry, retro_system_av_info
+from libretro.api.video import MemoryAccess, PixelFormat, Rotation, retro_framebuffer
+
+from ..driver import FrameBufferSpecial, Screenshot
+from .base import SoftwareVideoDriver
+from .convert import convert_to_rgba
+
+
+@final
+class NullVideoDriver(SoftwareVideoDriver):
+    """
+    A software video driver that discards frames instead of copying them,
+    for use when the core's raw throughput matters more than its output.
+
+    By default only the dimensions of the most recent frame are kept,
+    but the driver can optionally maintain a running hash of all frames
+    or keep a copy of every Nth frame.
+    """
+
+    def __init__(self, hash_algorithm: str | None = None, keep_every: int = 0):
+        """
+        :param hash_algorithm: The name of a :py:mod:`hashlib` algorithm
+            used to hash the visible pixels of each frame in order,
+            or :obj:`None` to disable hashing.
+        :param keep_every: If positive, a copy of every ``keep_every``-th frame is kept
+            so that :meth:`screenshot` can return it.
+            If 0, no frames are kept and :meth:`screenshot` always returns :obj:`None`.
+
+        :raises TypeError: If any parameter is not consistent with its documented types.
+        :raises ValueError: If ``hash_algorithm`` isn't supported by :py:mod:`hashlib`
+            or if ``keep_every`` is negative.
+        """
+        if hash_algorithm is not None and not isinstance(hash_algorithm, str):
+            raise TypeError(f"Expected a str or None, got {type(hash_algorithm).__name__}")
+
+        if not isinstance(keep_every, int):
+            raise TypeError(f"Expected an int, got {type(keep_every).__name__}")
+
+        if keep_every < 0:
+            raise ValueError(f"Expected a non-negative int, got {keep_every}")
+
+        self._hash = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self._keep_every = keep_every
+        self._kept_frame: bytes | None = None
+        self._kept_size: tuple[int, int, int] | None = None
+        self._kept_format: PixelFormat | None = None
+        self._frame_count = 0
+        self._dupe_count = 0
+        self._pixel_format: PixelFormat = PixelFormat.RGB1555
+        self._system_av_info: retro_system_av_info | None = None
+        self._rotation: Rotation = Rotation.NONE
+        self._last_width: int | None = None
+        self._last_height: int | None = None
+        self._last_pitch: int | None = None
+
+    @override
+    def refresh(
+        self, data: memoryview | FrameBufferSpecial, width: int, height: int, pitch: int
+    ) -> None:
+        match data:
+            case memoryview():
+                self._frame_count += 1
+                if self._hash is not None:
+                    row_length = width * self._pixel_format.bytes_per_pixel
+                    if pitch == row_length:
+                        self._hash.update(data[: row_length * height])
+                    else:
+                        for y in range(height):
+                            self._hash.update(data[y * pitch : y * pitch + row_length])
+
+                if self._keep_every and self._frame_count % self._keep_every == 0:
+                    self._kept_frame = bytes(data)
+                    self._kept_size = (width, height, pitch)
+                    self._kept_format = self._pixel_format
+
+            case FrameBufferSpecial.DUPE:
+                self._dupe_count += 1
+
+            case FrameBufferSpecial.HARDWARE:
+                warn("RETRO_HW_FRAME_BUFFER_VALID passed to software-only video refresh callback")
+
+            case _:
+                raise TypeError(
+                    f"Expected a memoryview or a FrameBufferSpecial, got {type(data).__name__}"
+                )
+
+        self._last_width = width
+        self._last_height = height
+        self._last_pitch = pitch
+
+    @property
+    @override
+    def needs_reinit(self) -> bool:
+        return False
+
+    @override
+    def reinit(self) -> None:
+        pass  # Nothing to allocate
+
+    @property
+    def frame_count(self) -> int:
+        """
+        The number of frames passed to :meth:`refresh`, not counting duplicated frames.
+        """
+        return self._frame_count
+
+    @property
+    def dupe_count(self) -> int:
+        """
+        The number of times the core asked to duplicate the previous frame.
+        """
+        return self._dupe_count
+
+    @property
+    def size(self) -> tuple[int, int] | None:
+        """
+        The width and height of the most recent frame,
+        or :obj:`None` if no frame has been received yet.
+        """
+        if self._last_width is None:
+            return None
+
+        return self._last_width, self._last_height
+
+    @property
+    def digest(self) -> bytes | None:
+        """
+        The running hash of all frames received so far,
+        or :obj:`None` if hashing is disabled.
+        Duplicated frames are not included.
+        """
+        return self._hash.digest() if self._hash is not None else None
+
+    @property
+    @override
+    def rotation(self) -> Rotation:
+        return self._rotation
+
+    @rotation.setter
+    @override
+    def rotation(self, rotation: Rotation) -> None:
+        if not isinstance(rotation, Rotation):
+            raise TypeError(f"Expected a Rotation, got {type(rotation).__name__}")
+
+        if rotation not in Rotation:
+            raise ValueError(f"Invalid rotation: {rotation}")
+
+        self._rotation = rotation
+
+    @property
+    @override
+    def pixel_format(self) -> PixelFormat:
+        return self._pixel_format
+
+    @pixel_format.setter
+    @override
+    def pixel_format(self, format: PixelFormat) -> None:
+        if not isinstance(format, PixelFormat):
+            raise TypeError(f"Expected a PixelFormat, got {type(format).__name__}")
+
+        if format not in PixelFormat:
+            raise ValueError(f"Invalid pixel format: {format}")
+
+        self._pixel_format = format
+
+    @override
+    def screenshot(self, prerotate: bool = True) -> Screenshot | None:
+        """
+        :return: The most recently kept frame,
+            or :obj:`None` if this driver doesn't keep frames
+            or hasn't kept one yet.
+        """
+        if self._kept_frame is None:
+            return None
+
+        width, height, pitch = self._kept_size
+        rot = self._rotation if prerotate else Rotation.NONE
+        screen_out = convert_to_rgba(
+            self._kept_frame, width, height, pitch, self._kept_format, rot
+        )
+
+        if rot in (Rotation.NINETY, Rotation.TWO_SEVENTY):
+            width, height = height, width
+
+        return Screenshot(screen_out, width, height, self._rotation, self._kept_format)
+
+    @override
+    def get_software_framebuffer(
+        self, width: int, height: int, flags: MemoryAccess
+    ) -> retro_framebuffer | None:
+        return None
+
+    @property
+    @override
+    def system_av_info(self) -> retro_system_av_info | None:
+        return deepcopy(self._system_av_info) if self._system_av_info else None
+
+    @system_av_info.setter
+    @override
+    def system_av_info(self, av_info: retro_system_av_info) -> None:
+        if not isinstance(av_info, retro_system_av_info):
+            raise TypeError(f"Expected a retro_system_av_info, got {type(av_info).__name__}")
+
+        self._system_av_info = deepcopy(av_info)
+
+    @property
+    @override
+    def geometry(self) -> retro_game_geometry | None:
+        if not self._system_av_info:
+            return None
+
+        return deepcopy(self._system_av_info.geometry)
+
+    @geometry.setter
+    @override
+    def geometry(self, geometry: retro_game_geometry) -> None:
+        if not isinstance(geometry, retro_game_geometry):
+            raise TypeError(f"Expected a retro_game_geometry, got {type(geometry).__name__}")
+
+        self._system_av_info.geometry.base_width = geometry.base_width
+        self._system_av_info.geometry.base_height = geometry.base_height
+        self._system_av_info.geometry.aspect_ratio = geometry.aspect_ratio
+
+
+__all__ = ["NullVideoDriver"]
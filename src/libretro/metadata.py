@@ -0,0 +1,426 @@
+"""
+Static information about cores, and an on-disk cache of it.
+
+Learning which content a core accepts normally means loading its shared library
+and calling into it, which adds up when scanning many cores.
+:class:`CoreMetadataCache` remembers what each core reported,
+keyed by the library's size, modification time, and hash,
+so that later scans don't have to load the core at all.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from ctypes import POINTER, c_void_p, cast
+from dataclasses import asdict, dataclass
+from os import PathLike, fsdecode
+from tempfile import NamedTemporaryFile
+from typing import Any, Self
+
+from libretro.api import (
+    EnvironmentCall,
+    retro_subsystem_info,
+    retro_system_content_info_override,
+)
+from libretro.api._utils import from_zero_terminated
+from libretro.core import Core, CoreIsolation
+
+_FORMAT_VERSION = 1
+_HASH_ALGORITHM = "sha256"
+_CHUNK_SIZE = 1 << 20
+
+
+def _decode(value: bytes | None) -> str | None:
+    return value.decode(errors="replace") if value is not None else None
+
+
+def _split(extensions: bytes | None) -> tuple[str, ...]:
+    return tuple(e for e in _decode(extensions).split("|") if e) if extensions else ()
+
+
+@dataclass(frozen=True, slots=True)
+class SubsystemMemoryMetadata:
+    """A plain-data copy of a :class:`.retro_subsystem_memory_info`."""
+
+    extension: str
+    type: int
+
+
+@dataclass(frozen=True, slots=True)
+class SubsystemRomMetadata:
+    """A plain-data copy of a :class:`.retro_subsystem_rom_info`."""
+
+    desc: str | None
+    valid_extensions: tuple[str, ...]
+    need_fullpath: bool
+    block_extract: bool
+    required: bool
+    memory: tuple[SubsystemMemoryMetadata, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SubsystemMetadata:
+    """A plain-data copy of a :class:`.retro_subsystem_info`."""
+
+    desc: str | None
+    ident: str | None
+    id: int
+    roms: tuple[SubsystemRomMetadata, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ContentOverrideMetadata:
+    """A plain-data copy of a :class:`.retro_system_content_info_override`."""
+
+    extensions: tuple[str, ...]
+    need_fullpath: bool
+    persistent_data: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CoreMetadata:
+    """
+    What a core reports about itself before any content is loaded.
+    Contains only plain Python data, so it can be pickled or stored as JSON.
+    """
+
+    api_version: int
+    """The value returned by ``retro_api_version``."""
+
+    library_name: str | None
+    library_version: str | None
+
+    valid_extensions: tuple[str, ...]
+    """The content file extensions the core accepts, without leading dots."""
+
+    need_fullpath: bool
+    block_extract: bool
+
+    subsystems: tuple[SubsystemMetadata, ...]
+    """The subsystems the core registered with ``RETRO_ENVIRONMENT_SET_SUBSYSTEM_INFO``."""
+
+    content_overrides: tuple[ContentOverrideMetadata, ...]
+    """The overrides the core registered with ``RETRO_ENVIRONMENT_SET_CONTENT_INFO_OVERRIDE``."""
+
+    @classmethod
+    def from_core(cls, core: Core | str | PathLike) -> Self:
+        """
+        Loads a private instance of a core and asks it for its metadata.
+
+        The core is always probed through a copy loaded with :meth:`.Core.isolated`,
+        since setting its environment callback would otherwise replace the callback
+        of every other :class:`.Core` (and :class:`.Session`) that shares its library.
+        The copy's environment callback only records subsystem info and content overrides;
+        ``retro_init`` is not called.
+
+        :param core: The core to query (only its :attr:`~.Core.path` is used),
+            or the path to its shared library.
+        :raises TypeError: If ``core`` is not one of the documented types.
+        :raises OSError: If the core's library couldn't be loaded.
+        :raises ValueError: If the library isn't a valid libretro core.
+        """
+        match core:
+            case Core():
+                path = core.path
+            case str() | PathLike():
+                path = core
+            case _:
+                raise TypeError(f"Expected a Core, str, or PathLike; got {type(core).__name__}")
+
+        # Not dlmopen, since each namespace stays in use until the process exits
+        # and there are only a few of them; sessions need them more than probes do
+        core = Core.isolated(path, CoreIsolation.COPY)
+
+        subsystems: list[SubsystemMetadata] = []
+        overrides: list[ContentOverrideMetadata] = []
+
+        def set_subsystem_info(data: c_void_p) -> bool:
+            if not data:
+                return False
+
+            subsystems[:] = (
+                SubsystemMetadata(
+                    _decode(s.desc),
+                    _decode(s.ident),
+                    int(s.id),
+                    tuple(
+                        SubsystemRomMetadata(
+                            _decode(r.desc),
+                            _split(r.valid_extensions),
+                            bool(r.need_fullpath),
+                            bool(r.block_extract),
+                            bool(r.required),
+                            tuple(
+                                SubsystemMemoryMetadata(_decode(m.extension), int(m.type))
+                                for m in (r.memory[: r.num_memory] if r.memory else ())
+                            ),
+                        )
+                        for r in (s.roms[: s.num_roms] if s.roms else ())
+                    ),
+                )
+                for s in from_zero_terminated(cast(data, POINTER(retro_subsystem_info)))
+            )
+            return True
+
+        def set_content_info_override(data: c_void_p) -> bool:
+            if not data:
+                # This envcall supports passing NULL to query for support
+                return True
+
+            overrides[:] = (
+                ContentOverrideMetadata(
+                    _split(o.extensions), bool(o.need_fullpath), bool(o.persistent_data)
+                )
+                for o in from_zero_terminated(
+                    cast(data, POINTER(retro_system_content_info_override))
+                )
+            )
+            return True
+
+        envcalls = {
+            EnvironmentCall.SET_SUBSYSTEM_INFO: set_subsystem_info,
+            EnvironmentCall.SET_CONTENT_INFO_OVERRIDE: set_content_info_override,
+        }
+
+        def environment(cmd: int, data: c_void_p) -> bool:
+            # All other envcalls are reported as unsupported
+            function = envcalls.get(cmd)
+            return function(data) if function is not None else False
+
+        core.set_environment(environment)
+        info = core.get_system_info()
+
+        return cls(
+            api_version=core.api_version(),
+            library_name=_decode(info.library_name),
+            library_version=_decode(info.library_version),
+            valid_extensions=_split(info.valid_extensions),
+            need_fullpath=bool(info.need_fullpath),
+            block_extract=bool(info.block_extract),
+            subsystems=tuple(subsystems),
+            content_overrides=tuple(overrides),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """
+        Reconstructs metadata from the output of :func:`dataclasses.asdict`
+        (e.g. after a round trip through JSON).
+
+        :raises KeyError: If a required field is missing.
+        :raises TypeError: If a field has the wrong structure.
+        """
+        return cls(
+            api_version=data["api_version"],
+            library_name=data["library_name"],
+            library_version=data["library_version"],
+            valid_extensions=tuple(data["valid_extensions"]),
+            need_fullpath=data["need_fullpath"],
+            block_extract=data["block_extract"],
+            subsystems=tuple(
+                SubsystemMetadata(
+                    s["desc"],
+                    s["ident"],
+                    s["id"],
+                    tuple(
+                        SubsystemRomMetadata(
+                            r["desc"],
+                            tuple(r["valid_extensions"]),
+                            r["need_fullpath"],
+                            r["block_extract"],
+                            r["required"],
+                            tuple(SubsystemMemoryMetadata(**m) for m in r["memory"]),
+                        )
+                        for r in s["roms"]
+                    ),
+                )
+                for s in data["subsystems"]
+            ),
+            content_overrides=tuple(
+                ContentOverrideMetadata(
+                    tuple(o["extensions"]), o["need_fullpath"], o["persistent_data"]
+                )
+                for o in data["content_overrides"]
+            ),
+        )
+
+
+def _default_cache_dir() -> str:
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+        return os.path.join(root, "libretro.py", "Cache", "cores")
+
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/libretro.py/cores")
+
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(root, "libretro.py", "cores")
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.new(_HASH_ALGORITHM)
+    with open(path, "rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class CoreMetadataCache:
+    """
+    Stores :class:`CoreMetadata` on disk so that cores only have to be loaded once.
+
+    Each entry is keyed by the hash of the core's shared library,
+    so identical copies of a core share an entry
+    and rebuilt cores are never confused with older builds.
+    Each library's path is also mapped to its last known size, modification time, and hash,
+    so unchanged libraries don't have to be hashed again.
+
+    Every file is replaced atomically,
+    so several processes may safely share a cache directory.
+    """
+
+    def __init__(self, directory: str | bytes | PathLike | None = None):
+        """
+        :param directory: Where to store the cache.
+            Created if it doesn't exist.
+            Defaults to a ``libretro.py`` directory in the platform's per-user cache directory.
+
+        :raises TypeError: If ``directory`` is not a path or :obj:`None`.
+        :raises OSError: If ``directory`` couldn't be created.
+        """
+        match directory:
+            case None:
+                self._directory = _default_cache_dir()
+            case str() | bytes() | PathLike():
+                self._directory = fsdecode(directory)
+            case _:
+                raise TypeError(
+                    f"Expected a str, bytes, PathLike, or None; got {type(directory).__name__}"
+                )
+
+        self._entries = os.path.join(self._directory, "entries")
+        self._paths = os.path.join(self._directory, "paths")
+        os.makedirs(self._entries, exist_ok=True)
+        os.makedirs(self._paths, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """The directory this cache is stored in."""
+        return self._directory
+
+    def get(self, path: str | PathLike) -> CoreMetadata:
+        """
+        Returns the metadata for the core at ``path``,
+        loading the core and caching its metadata if it isn't already cached.
+
+        :param path: The path to the core's shared library.
+        :raises OSError: If the library doesn't exist or couldn't be loaded.
+        :raises ValueError: If the library isn't a valid libretro core.
+        """
+        path = os.path.realpath(path)
+        digest = self.__digest(path)
+        metadata = self.__read_entry(digest)
+        if metadata is None:
+            metadata = CoreMetadata.from_core(path)
+            self.__write(
+                os.path.join(self._entries, f"{digest}.json"),
+                {"version": _FORMAT_VERSION, "metadata": asdict(metadata)},
+            )
+
+        return metadata
+
+    def lookup(self, path: str | PathLike) -> CoreMetadata | None:
+        """
+        Returns the cached metadata for the core at ``path`` without ever loading the core.
+
+        :param path: The path to the core's shared library.
+        :return: The cached metadata,
+            or :obj:`None` if there is none for this version of the library.
+        :raises OSError: If the library doesn't exist or couldn't be read.
+        """
+        path = os.path.realpath(path)
+        return self.__read_entry(self.__digest(path))
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        for directory in (self._entries, self._paths):
+            for name in os.listdir(directory):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass  # Another process got there first
+
+    def __digest(self, path: str) -> str:
+        stat = os.stat(path)
+        key = hashlib.sha1(os.fsencode(path)).hexdigest()
+        index_path = os.path.join(self._paths, f"{key}.json")
+        index = self.__read(index_path)
+        if (
+            index is not None
+            and index.get("path") == path
+            and index.get("size") == stat.st_size
+            and index.get("mtime_ns") == stat.st_mtime_ns
+            and isinstance(index.get("hash"), str)
+        ):
+            return index["hash"]
+
+        digest = _hash_file(path)
+        self.__write(
+            index_path,
+            {
+                "version": _FORMAT_VERSION,
+                "path": path,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "hash": digest,
+            },
+        )
+        return digest
+
+    def __read_entry(self, digest: str) -> CoreMetadata | None:
+        entry = self.__read(os.path.join(self._entries, f"{digest}.json"))
+        if entry is None:
+            return None
+
+        try:
+            return CoreMetadata.from_dict(entry["metadata"])
+        except (KeyError, TypeError):
+            return None  # Treat a malformed entry as a miss; it'll be overwritten
+
+    def __read(self, path: str) -> dict[str, Any] | None:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            return None
+
+        return data
+
+    def __write(self, path: str, data: dict[str, Any]) -> None:
+        # Written to a temporary file first so that readers never see a partial file
+        with NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as file:
+            try:
+                json.dump(data, file)
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+
+        os.replace(file.name, path)
+
+
+__all__ = [
+    "SubsystemMemoryMetadata",
+    "SubsystemRomMetadata",
+    "SubsystemMetadata",
+    "ContentOverrideMetadata",
+    "CoreMetadata",
+    "CoreMetadataCache",
+]
@@ -0,0 +1,500 @@
+"""
+Runs many independent sessions at once, each in its own process.
+
+Cores keep global state, so only one :class:`.Session` per core can run in a process at a time.
+This module runs each :class:`SessionSpec` in a fresh worker process
+and streams a :class:`SessionResult` back for each one as soon as it finishes,
+so that a matrix of cores, content, and options can use every CPU core.
+"""
+
+import logging
+import multiprocessing
+import os
+import traceback
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from enum import Enum, auto
+from hashlib import new as new_hash
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from os import PathLike, fsdecode
+from time import monotonic, perf_counter_ns
+from typing import Any, TypeVar
+
+from libretro.api import HardwareContext, SubsystemContent
+from libretro.builder import SessionBuilder
+from libretro.drivers import (
+    DEFAULT_DRIVER_MAP,
+    GeneratorInputDriver,
+    InputPollResult,
+    NullAudioDriver,
+    NullVideoDriver,
+    UnformattedLogDriver,
+)
+from libretro.session import Session
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSpec:
+    """
+    Describes a session to run in a worker process.
+    Every field must be picklable.
+    """
+
+    core: str | PathLike
+    """The path to the core's shared library."""
+
+    content: str | PathLike | Sequence[str | PathLike] | None = None
+    """
+    The path to the content to load,
+    a sequence of paths if :attr:`subsystem` is set,
+    or :obj:`None` to load the core without content.
+    """
+
+    subsystem: str | None = None
+    """The identifier of the subsystem to load :attr:`content` with, if any."""
+
+    options: Mapping[str, str] = field(default_factory=dict)
+    """The core options to set before the session starts."""
+
+    frames: int = 60
+    """The maximum number of frames to run."""
+
+    inputs: Sequence[InputPollResult | Sequence[InputPollResult]] = ()
+    """
+    The input state for each successive input poll,
+    in any form accepted by :class:`.GeneratorInputDriver`.
+    No input is pressed once they run out.
+    """
+
+    hash_algorithm: str = "sha256"
+    """The :py:mod:`hashlib` algorithm used for :attr:`SessionResult.video_digest`
+    and :attr:`SessionResult.audio_digest`."""
+
+    name: str | None = None
+    """A label for this spec, for use in reports. Not used by the runner."""
+
+
+class SessionStatus(Enum):
+    """
+    How a session run by :func:`run_parallel` ended.
+    """
+
+    COMPLETED = auto()
+    """The session ran all its frames, or the core shut itself down."""
+
+    FAILED = auto()
+    """The session raised an exception; see :attr:`SessionResult.error`."""
+
+    CRASHED = auto()
+    """The worker process exited without reporting a result, e.g. due to a segfault."""
+
+    TIMED_OUT = auto()
+    """The worker process took longer than the timeout and was killed."""
+
+
+@dataclass(frozen=True, slots=True)
+class SessionResult:
+    """
+    The outcome of running a :class:`SessionSpec`.
+    """
+
+    spec: SessionSpec
+    """The spec that was run."""
+
+    status: SessionStatus
+    """How the session ended."""
+
+    frames: int = 0
+    """The number of frames that were run."""
+
+    wall_time: float = 0.0
+    """The time between starting and finishing the session, in seconds,
+    including loading the core and content."""
+
+    core_time: float = 0.0
+    """The time spent inside the core's ``retro_run``, in seconds."""
+
+    video_digest: bytes | None = None
+    """
+    The hash of every software-rendered frame in order,
+    or of the final screenshot if the core rendered with hardware acceleration.
+    :obj:`None` if no frame was rendered.
+    """
+
+    audio_digest: bytes | None = None
+    """The hash of every audio sample in order."""
+
+    logs: tuple[str, ...] = ()
+    """Messages the core logged, each prefixed with its level."""
+
+    error: str | None = None
+    """A description of what went wrong if :attr:`status` isn't :attr:`SessionStatus.COMPLETED`."""
+
+    exit_code: int | None = None
+    """The worker process's exit code, or :obj:`None` if it was still running when the result was sent."""
+
+
+class _LogCollector(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(f"{record.levelname}: {record.getMessage()}")
+
+
+def _run_spec(spec: SessionSpec) -> SessionResult:
+    collector = _LogCollector()
+    logger = logging.getLogger(f"libretro.parallel.{os.getpid()}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(collector)
+
+    software = NullVideoDriver(hash_algorithm=spec.hash_algorithm)
+    audio = NullAudioDriver(hash_algorithm=spec.hash_algorithm)
+    driver_map = dict(DEFAULT_DRIVER_MAP)
+    driver_map[HardwareContext.NONE] = lambda: software
+
+    match spec.subsystem, spec.content:
+        case None, None:
+            content = None
+        case None, str() | PathLike() as path:
+            content = fsdecode(path)
+        case str() as subsystem, [*paths]:
+            content = SubsystemContent(subsystem, [fsdecode(p) for p in paths])
+        case _:
+            raise ValueError("Invalid combination of subsystem and content")
+
+    start = perf_counter_ns()
+    builder = (
+        SessionBuilder.defaults(fsdecode(spec.core))
+        .with_content(content)
+        .with_options(dict(spec.options))
+        .with_video(driver_map)
+        .with_audio(audio)
+        .with_input(GeneratorInputDriver(iter(spec.inputs)))
+        .with_log(lambda: UnformattedLogDriver(logger))
+    )
+
+    with builder.build() as session:
+        stats = session.run_frames(spec.frames)
+        video_digest = software.digest if software.frame_count else None
+        if session.video.active_context != HardwareContext.NONE:
+            screenshot = session.video.screenshot()
+            if screenshot is not None:
+                video_digest = new_hash(spec.hash_algorithm, screenshot.data).digest()
+
+    return SessionResult(
+        spec=spec,
+        status=SessionStatus.COMPLETED,
+        frames=stats.frames,
+        wall_time=(perf_counter_ns() - start) / 1e9,
+        core_time=stats.core_time,
+        video_digest=video_digest,
+        audio_digest=audio.digest,
+        logs=tuple(collector.messages),
+    )
+
+
+def _worker(spec: SessionSpec, connection: Connection) -> None:
+    # Runs in the child process
+    try:
+        result = _run_spec(spec)
+    except BaseException as e:
+        result = SessionResult(
+            spec=spec,
+            status=SessionStatus.FAILED,
+            error="".join(traceback.format_exception(e)),
+        )
+
+    connection.send(result)
+    connection.close()
+
+
+@dataclass(slots=True)
+class _Job:
+    item: Any
+    process: BaseProcess
+    connection: Connection
+    deadline: float | None
+
+
+def _check_pool_args(
+    workers: int | None, timeout: float | None, context: BaseContext | str | None
+) -> tuple[int, BaseContext]:
+    if workers is None:
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+        workers = workers or os.cpu_count() or 1
+
+    if not isinstance(workers, int):
+        raise TypeError(f"Expected an int or None, got {type(workers).__name__}")
+
+    if workers <= 0:
+        raise ValueError(f"Expected a positive number of workers, got {workers}")
+
+    if timeout is not None and not isinstance(timeout, (int, float)):
+        raise TypeError(f"Expected a float or None, got {type(timeout).__name__}")
+
+    if timeout is not None and timeout < 0:
+        raise ValueError(f"Expected a non-negative timeout, got {timeout}")
+
+    match context:
+        case None | str():
+            context = multiprocessing.get_context(context)
+        case BaseContext():
+            pass
+        case _:
+            raise TypeError(
+                f"Expected a multiprocessing context, a str, or None; got {type(context).__name__}"
+            )
+
+    return workers, context
+
+
+def run_parallel(
+    specs: Iterable[SessionSpec],
+    workers: int | None = None,
+    timeout: float | None = None,
+    context: BaseContext | str | None = None,
+) -> Iterator[SessionResult]:
+    """
+    Runs each spec in its own worker process,
+    with up to ``workers`` processes running at once.
+
+    Every spec gets a fresh process, so no state leaks between sessions
+    and a worker that crashes or hangs only affects its own spec;
+    the next spec is started in a new process either way.
+
+    :param specs: The sessions to run. Consumed lazily, as workers become free.
+    :param workers: The maximum number of processes to run at once.
+        Defaults to the number of CPUs available to this process.
+    :param timeout: The number of seconds each session may take before its process is killed,
+        or :obj:`None` to wait indefinitely.
+    :param context: The :py:mod:`multiprocessing` context (or the name of its start method)
+        used to start workers, or :obj:`None` to use the default.
+    :return: An iterator that yields a :class:`SessionResult` for each spec
+        in the order they finish, not the order they were given.
+        Closing the iterator early kills any workers that are still running.
+
+    :raises TypeError: If any parameter is not consistent with its documented types.
+    :raises ValueError: If ``workers`` is not positive or ``timeout`` is negative.
+    """
+    # Validate everything before starting any processes
+    workers, context = _check_pool_args(workers, timeout, context)
+
+    def start(spec: SessionSpec, sender: Connection) -> BaseProcess:
+        if not isinstance(spec, SessionSpec):
+            raise TypeError(f"Expected a SessionSpec, got {type(spec).__name__}")
+
+        return context.Process(
+            target=_worker, args=(spec, sender), name=f"libretro.parallel-{spec.name or ''}"
+        )
+
+    def finish(spec: SessionSpec, result: SessionResult, exit_code: int | None) -> SessionResult:
+        return replace(result, exit_code=exit_code)
+
+    def fail(
+        spec: SessionSpec, status: SessionStatus, error: str, exit_code: int | None
+    ) -> SessionResult:
+        wall_time = timeout if status == SessionStatus.TIMED_OUT else 0.0
+        return SessionResult(
+            spec=spec, status=status, wall_time=wall_time, error=error, exit_code=exit_code
+        )
+
+    return _pool(iter(specs), workers, timeout, context, start, finish, fail)
+
+
+@dataclass(frozen=True, slots=True)
+class ForkResult:
+    """
+    The outcome of running one case with :func:`fork_session`.
+    """
+
+    case: Any
+    """The case that was run."""
+
+    status: SessionStatus
+    """How the case ended."""
+
+    value: Any = None
+    """What the case's function returned, if it completed."""
+
+    wall_time: float = 0.0
+    """The time spent running the case's function, in seconds."""
+
+    error: str | None = None
+    """A description of what went wrong if :attr:`status` isn't :attr:`SessionStatus.COMPLETED`."""
+
+    exit_code: int | None = None
+    """The child process's exit code."""
+
+
+def _fork_worker(
+    session: Session, case: Any, function: Callable[[Session, Any], Any], connection: Connection
+) -> None:
+    # Runs in the forked child, which has its own copy-on-write copy of the session
+    start = perf_counter_ns()
+    try:
+        value = function(session, case)
+        result = ForkResult(
+            None, SessionStatus.COMPLETED, value, (perf_counter_ns() - start) / 1e9
+        )
+    except BaseException as e:
+        result = ForkResult(
+            None,
+            SessionStatus.FAILED,
+            wall_time=(perf_counter_ns() - start) / 1e9,
+            error="".join(traceback.format_exception(e)),
+        )
+
+    connection.send(result)
+    connection.close()
+
+
+def fork_session(
+    session: Session,
+    cases: Iterable[T],
+    function: Callable[[Session, T], Any],
+    workers: int | None = None,
+    timeout: float | None = None,
+) -> Iterator[ForkResult]:
+    """
+    Runs a function against copies of an already-running session,
+    each in its own forked child process.
+
+    Build the session and run it up to the point every case should start from
+    (e.g. past the core's boot sequence),
+    then pass it here instead of loading the core and content again for each case.
+    Each child starts from that exact state and shares the parent's memory copy-on-write,
+    so starting a case takes milliseconds no matter how large the content is.
+    Changes a child makes to its session are not seen by the parent or by other children.
+
+    Only available on platforms with :func:`os.fork`.
+    Sessions that use hardware rendering can't be forked,
+    since graphics contexts don't survive in the child;
+    neither can drivers that use background threads, such as :class:`.WaveWriterAudioDriver`.
+
+    :param session: The session to fork. Must already be entered.
+    :param cases: The values to pass to ``function``, one per child.
+        Consumed lazily, as workers become free.
+        Need not be picklable.
+    :param function: Called in each child as ``function(session, case)``.
+        Its return value is sent back to the parent, so it must be picklable.
+    :param workers: The maximum number of children to run at once.
+        Defaults to the number of CPUs available to this process.
+    :param timeout: The number of seconds each case may take before its child is killed,
+        or :obj:`None` to wait indefinitely.
+    :return: An iterator that yields a :class:`ForkResult` for each case
+        in the order they finish, not the order they were given.
+        Closing the iterator early kills any children that are still running.
+
+    :raises TypeError: If any parameter is not consistent with its documented types.
+    :raises ValueError: If ``workers`` is not positive or ``timeout`` is negative,
+        or if this platform doesn't support :func:`os.fork`.
+    """
+    if not isinstance(session, Session):
+        raise TypeError(f"Expected a Session, got {type(session).__name__}")
+
+    if not callable(function):
+        raise TypeError(f"Expected a callable, got {type(function).__name__}")
+
+    # Raises ValueError if fork isn't supported
+    workers, context = _check_pool_args(workers, timeout, "fork")
+
+    def start(case: T, sender: Connection) -> BaseProcess:
+        return context.Process(
+            target=_fork_worker, args=(session, case, function, sender), name="libretro.fork"
+        )
+
+    def finish(case: T, result: ForkResult, exit_code: int | None) -> ForkResult:
+        return replace(result, case=case, exit_code=exit_code)
+
+    def fail(case: T, status: SessionStatus, error: str, exit_code: int | None) -> ForkResult:
+        wall_time = timeout if status == SessionStatus.TIMED_OUT else 0.0
+        return ForkResult(case, status, wall_time=wall_time, error=error, exit_code=exit_code)
+
+    return _pool(iter(cases), workers, timeout, context, start, finish, fail)
+
+
+def _kill(job: _Job) -> None:
+    job.process.kill()
+    job.process.join()
+    job.connection.close()
+
+
+def _pool(
+    items: Iterator[T],
+    workers: int,
+    timeout: float | None,
+    context: BaseContext,
+    start: Callable[[T, Connection], BaseProcess],
+    finish: Callable[[T, R, int | None], R],
+    fail: Callable[[T, SessionStatus, str, int | None], R],
+) -> Iterator[R]:
+    running: dict[Connection, _Job] = {}
+    try:
+        while True:
+            while len(running) < workers and (item := next(items, _DONE)) is not _DONE:
+                receiver, sender = context.Pipe(duplex=False)
+                try:
+                    process = start(item, sender)
+                    process.start()
+                except BaseException:
+                    receiver.close()
+                    raise
+                finally:
+                    sender.close()  # Only the child needs it now
+
+                deadline = monotonic() + timeout if timeout is not None else None
+                running[receiver] = _Job(item, process, receiver, deadline)
+
+            if not running:
+                return
+
+            deadlines = [job.deadline for job in running.values() if job.deadline is not None]
+            wait_time = max(0.0, min(deadlines) - monotonic()) if deadlines else None
+
+            # A connection becomes ready when the child sends its result or exits
+            for connection in wait(list(running), wait_time):
+                job = running.pop(connection)
+                try:
+                    result = connection.recv()
+                except (EOFError, OSError):
+                    # The child exited without sending anything
+                    job.process.join()
+                    code = job.process.exitcode
+                    error = f"Worker exited with code {code} without reporting a result"
+                    yield fail(job.item, SessionStatus.CRASHED, error, code)
+                else:
+                    job.process.join()
+                    yield finish(job.item, result, job.process.exitcode)
+                finally:
+                    connection.close()
+
+            now = monotonic()
+            for connection, job in list(running.items()):
+                if job.deadline is not None and job.deadline <= now:
+                    del running[connection]
+                    _kill(job)
+                    error = f"Worker took longer than {timeout} seconds and was killed"
+                    yield fail(job.item, SessionStatus.TIMED_OUT, error, job.process.exitcode)
+    finally:
+        for job in running.values():
+            _kill(job)
+
+
+__all__ = [
+    "SessionSpec",
+    "SessionStatus",
+    "SessionResult",
+    "run_parallel",
+    "ForkResult",
+    "fork_session",
+]
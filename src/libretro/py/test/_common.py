@@ -7,6 +7,7 @@ from click import BadArgumentUsage, FileError
 from typer import Argument, Option
 
 from libretro import DEFAULT_DRIVER_MAP, Core, HardwareContext
+from libretro.metadata import CoreMetadataCache
 
 
 def load_core(value: str):
@@ -20,6 +21,34 @@ def load_core(value: str):
         raise BadArgumentUsage(f"{e}") from e
 
 
+def check_content(
+    core: Core, cache_dir: Path | None, subsystem: str | None, content: list[Path] | None
+):
+    """
+    Checks the subsystem and content against the core's metadata,
+    which is read from (or added to) the cache in ``cache_dir``.
+    Does nothing if ``cache_dir`` is None.
+    """
+    if cache_dir is None:
+        return
+
+    try:
+        metadata = CoreMetadataCache(cache_dir).get(core.path)
+    except OSError as e:
+        raise FileError(f"{cache_dir}", f"{e}") from e
+
+    if subsystem is not None:
+        if not any(s.ident == subsystem for s in metadata.subsystems):
+            raise BadArgumentUsage(f"Core does not define a subsystem named '{subsystem}'")
+    elif content and metadata.valid_extensions:
+        extensions = {e.lower() for e in metadata.valid_extensions}
+        for path in content:
+            if path.suffix[1:].lower() not in extensions:
+                raise BadArgumentUsage(
+                    f"Core does not accept {path.name}; expected one of: {', '.join(sorted(extensions))}"
+                )
+
+
 def option_callback(value: list[str] | None):
     if value is None:
         return None
@@ -83,6 +112,25 @@ CoreOptionsOption = Annotated[
     ),
 ]
 
+ForkCountOption = Annotated[
+    int,
+    Option(
+        "--forks",
+        "-f",
+        help="Run --warmup frames, then fork this many child processes that each run --frames more frames from that state. Requires os.fork (e.g. Linux); 0 disables forking.",
+        min=0,
+    ),
+]
+
+WarmupOption = Annotated[
+    int,
+    Option(
+        "--warmup",
+        help="The number of frames to run before forking. Ignored unless --forks is given.",
+        min=0,
+    ),
+]
+
 
 class SoftwareVideoDriverType(StrEnum):
     """
@@ -90,6 +138,7 @@ class SoftwareVideoDriverType(StrEnum):
     """
 
     DEFAULT = "default"
+    NULL = "null"
     OPENGL = "opengl"
     OPENGL_CORE = "opengl-core"
     OPENGLES2 = "opengles2"
@@ -109,6 +158,7 @@ class _AvailableSoftwareVideoDriverType(StrEnum):
     """
 
     DEFAULT = SoftwareVideoDriverType.DEFAULT
+    NULL = SoftwareVideoDriverType.NULL
 
     if HardwareContext.OPENGL in DEFAULT_DRIVER_MAP:
         OPENGL = SoftwareVideoDriverType.OPENGL
@@ -151,6 +201,16 @@ VideoDriverOption = Annotated[
     ),
 ]
 
+MetadataCacheOption = Annotated[
+    Path | None,
+    Option(
+        "--metadata-cache",
+        help="Directory of a core metadata cache. If given, the subsystem and content are checked against the core's cached metadata before the core is run.",
+        file_okay=False,
+        resolve_path=True,
+    ),
+]
+
 WindowOption = Annotated[
     bool,
     Option(
@@ -167,7 +227,11 @@ __all__ = [
     "SubsystemOption",
     "FrameCountOption",
     "CoreOptionsOption",
+    "ForkCountOption",
+    "WarmupOption",
     "VideoDriverOption",
     "SoftwareVideoDriverType",
     "WindowOption",
+    "MetadataCacheOption",
+    "check_content",
 ]
@@ -3,26 +3,42 @@ import typer
 from libretro import (
     DEFAULT_DRIVER_MAP,
     Content,
+    CoreShutDownException,
     HardwareContext,
     ModernGlVideoDriver,
+    NullVideoDriver,
+    Session,
     SessionBuilder,
     SubsystemContent,
 )
+from libretro.parallel import SessionStatus, fork_session
 
 from ._common import (
     ContentArg,
     CoreArg,
     CoreOptionsOption,
+    ForkCountOption,
     FrameCountOption,
+    MetadataCacheOption,
     SoftwareVideoDriverType,
     SubsystemOption,
     VideoDriverOption,
+    WarmupOption,
     WindowOption,
+    check_content,
 )
 
 _EMPTY = []
 
 
+def _run_frames(session: Session, frames: int) -> None:
+    # run_frames stops quietly if the core shuts down,
+    # but running fewer frames than requested should fail this test
+    stats = session.run_frames(frames)
+    if stats.frames < frames:
+        raise CoreShutDownException()
+
+
 def main(
     libretro: CoreArg,
     subsystem: SubsystemOption = None,
@@ -31,11 +47,18 @@ def main(
     options: CoreOptionsOption = (),
     software_video: VideoDriverOption = SoftwareVideoDriverType.DEFAULT,
     windowed: WindowOption = False,
+    forks: ForkCountOption = 0,
+    warmup: WarmupOption = 0,
+    metadata_cache: MetadataCacheOption = None,
 ):
     """
     Loads a libretro core with zero or more content files
     and runs it for a fixed number of frames.
 
+    With --forks, the frames are instead run in that many child processes
+    forked from a session that has already run --warmup frames,
+    so each one starts without reloading the core or content.
+
     Exits with 0 if no errors are raised during this time.
     """
 
@@ -52,6 +75,8 @@ def main(
         case _:
             raise ValueError("Invalid combination of subsystem and content")
 
+    check_content(libretro, metadata_cache, subsystem, content_paths)
+
     core_options: dict[str, str] = (
         {k: v for k, v in (opt.split("=", 1) for opt in options)} if options else dict()
     )
@@ -63,6 +88,8 @@ def main(
         driver_map[HardwareContext.OPENGL_CORE] = init_with_window
 
     match software_video:
+        case SoftwareVideoDriverType.NULL:
+            driver_map[HardwareContext.NONE] = NullVideoDriver
         case SoftwareVideoDriverType.OPENGL:
             driver_map[HardwareContext.NONE] = driver_map[HardwareContext.OPENGL]
         case SoftwareVideoDriverType.OPENGL_CORE:
@@ -94,8 +121,20 @@ def main(
     )
 
     with builder.build() as session:
-        for i in range(frames):
-            session.run()
+        if not forks:
+            _run_frames(session, frames)
+            return
+
+        _run_frames(session, warmup)
+        failed = False
+        for result in fork_session(session, range(forks), lambda s, _: _run_frames(s, frames)):
+            typer.echo(f"Fork {result.case}: {result.status.name} in {result.wall_time:.3f}s")
+            if result.status != SessionStatus.COMPLETED:
+                typer.echo(result.error, err=True)
+                failed = True
+
+    if failed:
+        raise typer.Exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+"""
+Fixed-memory storage of past savestates for stepping a session backwards.
+"""
+
+import zlib
+from collections import deque
+from functools import cache
+from typing import NamedTuple
+
+from libretro._typing import Buffer
+
+
+@cache
+def _numpy():
+    # Imported on first use, since numpy takes a while to import
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _xor(a: Buffer, b: Buffer) -> bytes:
+    # Both operands must be the same length
+    numpy = _numpy()
+    if numpy is not None:
+        return numpy.bitwise_xor(
+            numpy.frombuffer(a, dtype=numpy.uint8), numpy.frombuffer(b, dtype=numpy.uint8)
+        ).tobytes()
+
+    length = memoryview(a).nbytes
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(length, "little")
+
+
+class _Delta(NamedTuple):
+    frame: int
+    """The frame at which the older state was taken."""
+
+    data: bytes
+    """The compressed XOR of the older state and the next-newest state,
+    or the older state itself if the two states have different sizes."""
+
+    is_delta: bool
+
+
+class RewindBuffer:
+    """
+    Keeps savestates taken at regular intervals within a fixed memory budget.
+
+    The newest state is kept whole,
+    and each older state is kept as a compressed XOR against the state after it.
+    Since consecutive states tend to differ in only a few bytes,
+    most deltas compress to a tiny fraction of a full state.
+    When the budget is exceeded, the oldest states are discarded first.
+    """
+
+    def __init__(self, capacity: int, interval: int = 1, compression_level: int = 1):
+        """
+        :param capacity: The maximum number of bytes to use for stored states,
+            including the uncompressed newest state.
+        :param interval: Take a snapshot after every ``interval`` frames.
+        :param compression_level: The :py:mod:`zlib` compression level for deltas,
+            from 0 (no compression) to 9 (smallest but slowest).
+
+        :raises TypeError: If any parameter is not an :class:`int`.
+        :raises ValueError: If ``capacity`` or ``interval`` is not positive,
+            or if ``compression_level`` is not between 0 and 9.
+        """
+        for name, value in (
+            ("capacity", capacity),
+            ("interval", interval),
+            ("compression_level", compression_level),
+        ):
+            if not isinstance(value, int):
+                raise TypeError(f"Expected {name} to be an int, got {type(value).__name__}")
+
+        if capacity <= 0:
+            raise ValueError(f"Expected a positive capacity, got {capacity}")
+
+        if interval <= 0:
+            raise ValueError(f"Expected a positive interval, got {interval}")
+
+        if not 0 <= compression_level <= 9:
+            raise ValueError(f"Expected a compression level from 0 to 9, got {compression_level}")
+
+        self._capacity = capacity
+        self._interval = interval
+        self._compression_level = compression_level
+        self._deltas: deque[_Delta] = deque()
+        self._delta_bytes = 0
+        self._current: bytes | None = None
+        self._current_frame = 0
+
+    def __len__(self) -> int:
+        """
+        :return: The number of states stored, including the newest one.
+        """
+        return len(self._deltas) + (self._current is not None)
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of bytes this buffer will use for stored states."""
+        return self._capacity
+
+    @property
+    def interval(self) -> int:
+        """The number of frames between snapshots."""
+        return self._interval
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        The number of bytes currently used by stored states.
+        Never exceeds :attr:`capacity`, except when a single uncompressed state is larger.
+        """
+        return self._delta_bytes + (len(self._current) if self._current is not None else 0)
+
+    @property
+    def oldest_frame(self) -> int | None:
+        """The frame number of the oldest stored state, or :obj:`None` if empty."""
+        if self._deltas:
+            return self._deltas[0].frame
+
+        return self._current_frame if self._current is not None else None
+
+    @property
+    def newest_frame(self) -> int | None:
+        """The frame number of the newest stored state, or :obj:`None` if empty."""
+        return self._current_frame if self._current is not None else None
+
+    def wants(self, frame: int) -> bool:
+        """
+        :return: Whether a snapshot should be taken after the given frame.
+        """
+        return frame % self._interval == 0
+
+    def push(self, frame: int, state: Buffer) -> None:
+        """
+        Stores a new state, discarding the oldest states if necessary to stay within budget.
+
+        :param frame: The number of frames that had been run when ``state`` was taken.
+        :param state: The serialized state. It's copied, so it may be reused afterwards.
+        """
+        new = bytes(state)
+        if self._current is not None:
+            if len(new) == len(self._current):
+                delta = _Delta(
+                    self._current_frame,
+                    zlib.compress(_xor(new, self._current), self._compression_level),
+                    True,
+                )
+            else:
+                # Can't XOR states of different sizes, so keep the whole thing
+                delta = _Delta(
+                    self._current_frame,
+                    zlib.compress(self._current, self._compression_level),
+                    False,
+                )
+
+            self._deltas.append(delta)
+            self._delta_bytes += len(delta.data)
+
+        self._current = new
+        self._current_frame = frame
+
+        while self._deltas and self.memory_usage > self._capacity:
+            self._delta_bytes -= len(self._deltas.popleft().data)
+
+    def pop(self, frame: int) -> tuple[int, bytes] | None:
+        """
+        Discards all states newer than ``frame``
+        and returns the newest remaining state, which remains stored.
+
+        :param frame: The frame to rewind to.
+            If no state was taken at exactly this frame, the next-oldest state is used.
+        :return: A tuple of the frame number and the state,
+            or :obj:`None` if all stored states are newer than ``frame``
+            (in which case nothing is discarded).
+        """
+        oldest = self.oldest_frame
+        if oldest is None or oldest > frame:
+            return None
+
+        while self._current_frame > frame:
+            delta = self._deltas.pop()
+            self._delta_bytes -= len(delta.data)
+            older = zlib.decompress(delta.data)
+            self._current = _xor(self._current, older) if delta.is_delta else older
+            self._current_frame = delta.frame
+
+        return self._current_frame, self._current
+
+    def clear(self) -> None:
+        """Discards all stored states."""
+        self._deltas.clear()
+        self._delta_bytes = 0
+        self._current = None
+        self._current_frame = 0
+
+
+__all__ = ["RewindBuffer"]
@@ -1,17 +1,20 @@
 from collections.abc import Callable, Sequence
 from copy import deepcopy
-from ctypes import CDLL
+from ctypes import CDLL, Array, c_char, sizeof
 from os import PathLike
+from time import perf_counter_ns
 from types import TracebackType
-from typing import AnyStr, Type
+from typing import AnyStr, NamedTuple, Type
 
 from _ctypes import CFuncPtr
 
+from libretro._typing import Buffer
 from libretro._utils import Pollable
 from libretro.api import (
     API_VERSION,
     AvEnableFlags,
     Content,
+    SavestateContext,
     SerializationQuirks,
     SubsystemContent,
     Subsystems,
@@ -44,6 +47,23 @@ from libretro.drivers import (
     VideoDriver,
 )
 from libretro.error import CoreShutDownException
+from libretro.rewind import RewindBuffer
+
+
+class RunStats(NamedTuple):
+    """
+    Statistics about a batch of frames run by :meth:`Session.run_frames`.
+    """
+
+    frames: int
+    """The number of frames that were actually run."""
+
+    wall_time: float
+    """The total time spent in :meth:`Session.run_frames`, in seconds."""
+
+    core_time: float
+    """The time spent inside the core's ``retro_run``, in seconds.
+    Includes time spent in callbacks that the core calls."""
 
 
 class Session:
@@ -80,6 +100,15 @@ class Session:
         self._pending_callback_exceptions: list[BaseException] = []
         self._is_exited = False
 
+        # Savestate buffers that can be reused, keyed by size
+        self._state_size: int | None = None
+        self._state_buffers: dict[int, list[Array]] = {}
+
+        self._frame_count = 0
+        self._rewind: RewindBuffer | None = None
+        self._run_ahead = 0
+        self._verify_run_ahead = False
+
     def __enter__(self):
         api_version = self._core.api_version()
         if api_version != API_VERSION:
@@ -322,7 +351,337 @@ class Session:
         # TODO: self._environment.audio.report_buffer_status()
         # TODO: self._environment.camera.poll() (see runloop_iterate in runloop.c, lion)
         # TODO: Ensure that input is not polled more than once per frame
-        self._core.run()
+        if self._run_ahead:
+            self.__run_ahead()
+        else:
+            self._core.run()
+
+        self._frame_count += 1
+        if self._rewind is not None and self._rewind.wants(self._frame_count):
+            self.__record_rewind()
+
+    def run_frames(self, frames: int, *, until: Callable[[], bool] | None = None) -> RunStats:
+        """
+        Runs the core for up to ``frames`` frames.
+
+        Equivalent to calling :meth:`run` in a loop,
+        but looks up the video driver and the core's run function once for the whole batch
+        instead of on every frame.
+        The video driver is still reinitialized between frames whenever it needs to be,
+        and the microphone and timing drivers are still polled on every frame
+        (so callbacks the core registers mid-batch take effect on the next frame).
+        If :attr:`run_ahead` is set, the reported core time includes the hidden frames;
+        changes to :attr:`run_ahead` take effect on the next batch.
+
+        :param frames: The maximum number of frames to run.
+        :param until: If given, called after each frame;
+            the batch ends early once it returns ``True``.
+        :return: Statistics about the frames that were run.
+            The batch ends early without raising an exception if the core shuts down,
+            in which case later calls will raise :exc:`.CoreShutDownException`.
+
+        :raises TypeError: If any parameter is not consistent with its documented types.
+        :raises ValueError: If ``frames`` is negative.
+        :raises CoreShutDownException: If the core was already shut down
+            or this session has already exited.
+        """
+        if not isinstance(frames, int):
+            raise TypeError(f"Expected an int, got {type(frames).__name__}")
+
+        if frames < 0:
+            raise ValueError(f"Expected a non-negative frame count, got {frames}")
+
+        if until is not None and not callable(until):
+            raise TypeError(f"Expected a callable or None, got {type(until).__name__}")
+
+        if self._is_exited or self._environment.is_shutdown:
+            raise CoreShutDownException()
+
+        environment = self._environment
+        video = environment.video
+        run = self.__run_ahead if self._run_ahead else self._core.run
+        rewind = self._rewind
+
+        core_ns = 0
+        count = 0
+        start = perf_counter_ns()
+        while count < frames:
+            if video.needs_reinit:
+                video.reinit()
+
+            # Looked up on every frame, since the core can register these at any time
+            microphones = environment.microphones
+            if isinstance(microphones, Pollable):
+                microphones.poll()
+
+            timing = environment.timing
+            if timing:
+                # TODO: Pass the time elapsed since the last frame (see the same TODO in run())
+                timing.frame_time(None)
+
+            before = perf_counter_ns()
+            run()
+            core_ns += perf_counter_ns() - before
+            count += 1
+            self._frame_count += 1
+            if rewind is not None and rewind.wants(self._frame_count):
+                self.__record_rewind()
+
+            if environment.is_shutdown or (until is not None and until()):
+                break
+
+        return RunStats(count, (perf_counter_ns() - start) / 1e9, core_ns / 1e9)
+
+    @property
+    def state_size(self) -> int:
+        """
+        The size of the core's serialized state, in bytes; 0 if the core doesn't support savestates.
+
+        Only asks the core once,
+        unless the core sets :attr:`.SerializationQuirks.CORE_VARIABLE_SIZE`.
+
+        :raises CoreShutDownException: If the core was shut down or this session has exited.
+        """
+        core = self.core
+        quirks = self._environment.serialization_quirks
+        if self._state_size is None or (
+            quirks and SerializationQuirks.CORE_VARIABLE_SIZE in quirks
+        ):
+            self._state_size = core.serialize_size()
+
+        return self._state_size
+
+    def save_state(self) -> memoryview | None:
+        """
+        Serializes the core's state into a buffer owned by this session.
+
+        Buffers are allocated once per size and can be reused with :meth:`release_state`,
+        so savestating on every frame doesn't allocate memory.
+
+        :return: A writable view of the serialized state that refers to the buffer itself,
+            or :obj:`None` if the core doesn't support savestates or failed to serialize its state.
+            The view remains valid until it's passed to :meth:`release_state`.
+        :raises CoreShutDownException: If the core was shut down or this session has exited.
+        """
+        size = self.state_size
+        if not size:
+            return None
+
+        buffers = self._state_buffers.get(size)
+        buffer = buffers.pop() if buffers else (c_char * size)()
+        if not self._core.serialize(buffer):
+            self._state_buffers.setdefault(size, []).append(buffer)
+            return None
+
+        return memoryview(buffer).cast("B")
+
+    def load_state(self, state: bytes | bytearray | memoryview | Buffer) -> bool:
+        """
+        Restores the core's state from a savestate,
+        such as one returned by :meth:`save_state`.
+
+        :param state: The serialized state to load.
+        :return: ``True`` if the core loaded the state, ``False`` if not.
+        :raises CoreShutDownException: If the core was shut down or this session has exited.
+        """
+        core = self.core
+        if (
+            isinstance(state, memoryview)
+            and isinstance(state.obj, Array)
+            and state.nbytes == sizeof(state.obj)
+        ):
+            # A whole buffer from save_state() can be passed to the core as-is
+            return core.unserialize(state.obj)
+
+        return core.unserialize(state)
+
+    def release_state(self, state: memoryview) -> None:
+        """
+        Returns a savestate's buffer to this session so that :meth:`save_state` can reuse it.
+        ``state`` must not be used afterwards.
+
+        :param state: A view returned by :meth:`save_state`.
+        :raises TypeError: If ``state`` is not a :class:`memoryview`.
+        :raises ValueError: If ``state`` wasn't returned by :meth:`save_state`.
+        """
+        if not isinstance(state, memoryview):
+            raise TypeError(f"Expected a memoryview, got {type(state).__name__}")
+
+        buffer = state.obj
+        if not isinstance(buffer, Array) or buffer._type_ is not c_char:
+            raise ValueError("Expected a savestate returned by save_state()")
+
+        state.release()
+        self._state_buffers.setdefault(sizeof(buffer), []).append(buffer)
+
+    @property
+    def frame_count(self) -> int:
+        """
+        The number of frames run in this session,
+        minus any that were undone by :meth:`rewind`.
+        """
+        return self._frame_count
+
+    @property
+    def rewind_buffer(self) -> RewindBuffer | None:
+        """
+        The buffer that stores past states for :meth:`rewind`,
+        or :obj:`None` if rewinding is disabled (the default).
+        While set, a savestate is stored after every :attr:`.RewindBuffer.interval` frames.
+        """
+        return self._rewind
+
+    @rewind_buffer.setter
+    def rewind_buffer(self, buffer: RewindBuffer | None) -> None:
+        if buffer is not None and not isinstance(buffer, RewindBuffer):
+            raise TypeError(f"Expected a RewindBuffer or None, got {type(buffer).__name__}")
+
+        self._rewind = buffer
+
+    def __record_rewind(self) -> None:
+        state = self.save_state()
+        if state is not None:
+            self._rewind.push(self._frame_count, state)
+            self.release_state(state)
+
+    def rewind(self, frames: int = 1) -> int:
+        """
+        Restores the newest stored state that's at least ``frames`` frames old,
+        or the oldest stored state if there isn't one.
+        States newer than the restored one are discarded.
+
+        :param frames: The number of frames to go back.
+        :return: The number of frames that were actually undone,
+            which may be more than ``frames`` if snapshots are taken less often than every frame
+            or fewer if there isn't enough history.
+        :raises TypeError: If ``frames`` is not an :class:`int`.
+        :raises ValueError: If ``frames`` is negative or :attr:`rewind_buffer` is not set.
+        :raises RuntimeError: If the core fails to load the stored state.
+        :raises CoreShutDownException: If the core was shut down or this session has exited.
+        """
+        if not isinstance(frames, int):
+            raise TypeError(f"Expected an int, got {type(frames).__name__}")
+
+        if frames < 0:
+            raise ValueError(f"Expected a non-negative frame count, got {frames}")
+
+        if self._rewind is None:
+            raise ValueError("Rewinding is disabled; set rewind_buffer first")
+
+        oldest = self._rewind.oldest_frame
+        if oldest is None:
+            return 0
+
+        frame, state = self._rewind.pop(max(self._frame_count - frames, oldest))
+        if not self.load_state(state):
+            raise RuntimeError(f"Core failed to load the state from frame {frame}")
+
+        rewound = self._frame_count - frame
+        self._frame_count = frame
+        return rewound
+
+    @property
+    def run_ahead(self) -> int:
+        """
+        The number of frames to run ahead of each presented frame, or 0 to disable run-ahead (the default).
+
+        With run-ahead enabled, each call to :meth:`run` runs one frame with video suppressed,
+        saves the core's state, runs this many more frames with the same input,
+        presents only the last of them, and then restores the saved state.
+        The core keeps advancing one frame per call,
+        but what's shown reflects the current input this many frames sooner.
+        Only the first frame's audio is played.
+
+        While saving and loading these states, the core is told
+        that the savestate context is :attr:`.SavestateContext.RUNAHEAD_SAME_INSTANCE`
+        (unless the savestate context envcall is disabled).
+
+        :raises TypeError: If set to something other than an :class:`int`.
+        :raises ValueError: If set to a negative number.
+        """
+        return self._run_ahead
+
+    @run_ahead.setter
+    def run_ahead(self, frames: int) -> None:
+        if not isinstance(frames, int):
+            raise TypeError(f"Expected an int, got {type(frames).__name__}")
+
+        if frames < 0:
+            raise ValueError(f"Expected a non-negative frame count, got {frames}")
+
+        self._run_ahead = frames
+
+    @property
+    def verify_run_ahead(self) -> bool:
+        """
+        Whether to check that the core restores its state faithfully during run-ahead.
+        If set, the state is serialized again after it's restored,
+        and :meth:`run` raises a :exc:`RuntimeError` if it doesn't match the saved state.
+        Costs one extra serialization per frame. Defaults to ``False``.
+        """
+        return self._verify_run_ahead
+
+    @verify_run_ahead.setter
+    def verify_run_ahead(self, value: bool) -> None:
+        self._verify_run_ahead = bool(value)
+
+    def __run_ahead(self) -> None:
+        environment = self._environment
+        run = self._core.run
+        context = environment.savestate_context
+        if context is not None:
+            environment.savestate_context = SavestateContext.RUNAHEAD_SAME_INSTANCE
+
+        state = None
+        try:
+            # The "real" frame, whose state is kept; it's heard but not seen
+            environment.suppress_video = True
+            run()
+            state = self.save_state()
+            if state is None:
+                raise RuntimeError("Core failed to save its state for run-ahead")
+
+            # Every later frame sees the same input, but only the last one is seen
+            environment.suppress_audio = True
+            environment.freeze_input = True
+            for _ in range(self._run_ahead - 1):
+                run()
+
+            environment.suppress_video = False
+            run()
+
+            if not self.load_state(state):
+                raise RuntimeError("Core failed to load its state for run-ahead")
+
+            if self._verify_run_ahead:
+                self.__verify_run_ahead(state)
+        finally:
+            environment.suppress_video = False
+            environment.suppress_audio = False
+            environment.freeze_input = False
+            if context is not None:
+                environment.savestate_context = context
+
+            if state is not None:
+                self.release_state(state)
+
+    def __verify_run_ahead(self, expected: memoryview) -> None:
+        actual = self.save_state()
+        if actual is None:
+            raise RuntimeError("Core failed to save its state after loading it for run-ahead")
+
+        try:
+            if actual != expected:
+                offset = next(
+                    (i for i, (a, b) in enumerate(zip(actual, expected)) if a != b),
+                    min(len(actual), len(expected)),
+                )
+                raise RuntimeError(
+                    f"Core's state changed after being saved and loaded for run-ahead "
+                    f"(first difference at byte {offset} of {len(expected)})"
+                )
+        finally:
+            self.release_state(actual)
 
     def reset(self) -> None:
         if self._is_exited or self._environment.is_shutdown:
@@ -332,6 +691,7 @@ class Session:
 
 
 __all__ = [
+    "RunStats",
     "Session",
     "CoreShutDownException",
 ]